@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+GAIA-QAI Real AI Decision-Path Benchmark
+
+Microbenchmarks for each stage of the Real AI decision path and for
+end-to-end decisions at several decision-history sizes. Reports latency
+percentiles and peak transient allocation per call, saves baselines and
+fails when a stage regresses past a tolerance.
+
+Usage:
+    python decision_benchmark.py --backend reference --save-baseline baseline.json
+    python decision_benchmark.py --backend reference native --baseline baseline.json --tolerance 0.25
+    python decision_benchmark.py --backend reference --integrations simulated
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from functional_controller import DEFAULT_CONFIG, FunctionalRealAI
+
+PERCENTILES = {'p50': 50.0, 'p90': 90.0, 'p99': 99.0, 'p99.9': 99.9}
+
+def summarize(samples_ns: np.ndarray, peak_alloc_bytes: float) -> Dict[str, float]:
+    """Latency percentiles (μs) and allocation summary for one stage"""
+    samples_us = samples_ns / 1e3
+    summary = {name: float(np.percentile(samples_us, q)) for name, q in PERCENTILES.items()}
+    summary['mean'] = float(samples_us.mean())
+    summary['calls'] = int(len(samples_us))
+    summary['peak_alloc_bytes'] = float(peak_alloc_bytes)
+    return summary
+
+def measure_allocations(fn: Callable[[], Any], calls: int) -> float:
+    """Mean peak transient allocation per call, in bytes"""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+    return float(np.mean(peaks)) if peaks else 0.0
+
+def bench_sync(fn: Callable[[], Any], iterations: int, warmup: int, alloc_calls: int) -> Dict[str, float]:
+    """Benchmark a synchronous stage"""
+    for _ in range(warmup):
+        fn()
+
+    samples = np.empty(iterations, dtype=np.int64)
+    clock = time.perf_counter_ns
+    for i in range(iterations):
+        start = clock()
+        fn()
+        samples[i] = clock() - start
+
+    return summarize(samples, measure_allocations(fn, alloc_calls))
+
+async def bench_async(fn: Callable[[], Any], iterations: int, warmup: int, alloc_calls: int) -> Dict[str, float]:
+    """Benchmark a coroutine stage"""
+    for _ in range(warmup):
+        await fn()
+
+    samples = np.empty(iterations, dtype=np.int64)
+    clock = time.perf_counter_ns
+    for i in range(iterations):
+        start = clock()
+        await fn()
+        samples[i] = clock() - start
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_calls):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return summarize(samples, float(np.mean(peaks)) if peaks else 0.0)
+
+def benchmark_config(backend: str, integrations: str = 'disabled') -> Dict[str, Any]:
+    """Controller configuration for an offline run
+    
+    Integrations are either disabled (deterministic) or served by the
+    in-process simulated interfaces.
+    """
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai']['inference_backend'] = backend
+    # Synthetic contexts are uncorrelated, so consecutive decisions would
+    # trip the rate-of-change limit; the rate is still computed when unbounded
+    config['safety']['max_rate_of_change'] = None
+    if integrations == 'simulated':
+        config['integration']['interfaces'] = 'simulated'
+    else:
+        config['integration']['gaia_air_enabled'] = False
+        config['integration']['ampel360_enabled'] = False
+    return config
+
+async def fill_history(real_ai: FunctionalRealAI, size: int, chunk: int = 4096):
+    """Fill decision history to capacity so appends run in steady state"""
+    real_ai.max_history_size = size
+    rng = np.random.default_rng(1)
+    remaining = size
+    while remaining > 0:
+        rows = min(chunk, remaining)
+        await real_ai.make_real_ai_decisions_batch(
+            rng.random((rows, 16), dtype=np.float32),
+            consciousness_requirement=0.0
+        )
+        remaining -= rows
+
+async def run_backend(backend: str,
+                      iterations: int,
+                      warmup: int,
+                      alloc_calls: int,
+                      history_sizes: List[int],
+                      context_size: int,
+                      integrations: str = 'disabled') -> Dict[str, Dict[str, float]]:
+    """Run every stage against one inference backend"""
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(benchmark_config(backend, integrations), f)
+        config_path = f.name
+
+    try:
+        real_ai = FunctionalRealAI(config_path)
+    finally:
+        os.unlink(config_path)
+
+    if real_ai.inference_backend is None or real_ai.inference_backend.name != backend:
+        raise RuntimeError(f"Inference backend '{backend}' unavailable")
+    if not await real_ai.initialize_real_ai():
+        raise RuntimeError(f"Real AI initialization failed for backend '{backend}'")
+
+    try:
+        # Let the monitor publish enough samples for a stable awareness level
+        await asyncio.sleep(0.2)
+
+        rng = np.random.default_rng(0)
+        context = rng.random(context_size, dtype=np.float32)
+        decision = await real_ai.make_real_ai_decision(context, consciousness_requirement=0.0)
+        buffers = real_ai.buffer_pool.acquire()
+        buffers.load(context)
+        monitor = real_ai.consciousness_monitor
+        backend_impl = real_ai.inference_backend
+
+        results = {
+            'prepare_context': bench_sync(lambda: real_ai._prepare_context(context), iterations, warmup, alloc_calls),
+            'hash_context': bench_sync(lambda: real_ai._hash_context(context), iterations, warmup, alloc_calls),
+            'inference': bench_sync(lambda: backend_impl.make_decision(buffers), iterations, warmup, alloc_calls),
+            'validate_decision': bench_sync(
+                lambda: real_ai.safety_validator.validate_decision(decision), iterations, warmup, alloc_calls
+            ),
+            'consciousness_state': bench_sync(monitor.get_consciousness_state, iterations, warmup, alloc_calls),
+        }
+
+        for size in history_sizes:
+            await fill_history(real_ai, size)
+            results[f'end_to_end[history={size}]'] = await bench_async(
+                lambda: real_ai.make_real_ai_decision(context, consciousness_requirement=0.0),
+                iterations, warmup, alloc_calls
+            )
+
+        return results
+    finally:
+        await real_ai.shutdown()
+
+def find_regressions(results: Dict[str, Dict[str, Dict[str, float]]],
+                     baseline: Dict[str, Dict[str, Dict[str, float]]],
+                     tolerance: float,
+                     gate_percentiles: List[str]) -> List[str]:
+    """Stages whose gated percentiles exceed baseline * (1 + tolerance)"""
+    regressions = []
+    for backend, stages in results.items():
+        for stage, summary in stages.items():
+            reference = baseline.get(backend, {}).get(stage)
+            if reference is None:
+                continue
+            for name in gate_percentiles:
+                limit = reference[name] * (1.0 + tolerance)
+                if summary[name] > limit:
+                    regressions.append(
+                        f"{backend}/{stage} {name}: {summary[name]:.2f}μs > {limit:.2f}μs "
+                        f"(baseline {reference[name]:.2f}μs)"
+                    )
+    return regressions
+
+def print_report(results: Dict[str, Dict[str, Dict[str, float]]], target_us: float):
+    """Print a percentile table per backend"""
+    columns = list(PERCENTILES) + ['mean']
+    for backend, stages in results.items():
+        print(f"\n📊 Backend: {backend} (decision target {target_us}μs)")
+        print(f"   {'stage':<32}" + ''.join(f"{c + ' μs':>12}" for c in columns) + f"{'alloc B':>12}")
+        for stage, summary in stages.items():
+            print(f"   {stage:<32}" + ''.join(f"{summary[c]:>12.2f}" for c in columns) +
+                  f"{summary['peak_alloc_bytes']:>12.0f}")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Real AI decision-path benchmark")
+    parser.add_argument('--backend', nargs='+', default=['reference'],
+                        choices=['reference', 'native'], help="Inference backends to compare")
+    parser.add_argument('--iterations', type=int, default=5000, help="Timed calls per stage")
+    parser.add_argument('--warmup', type=int, default=500, help="Untimed calls per stage")
+    parser.add_argument('--alloc-calls', type=int, default=200, help="Calls traced for allocations")
+    parser.add_argument('--history-sizes', type=int, nargs='+', default=[1000, 100000],
+                        help="Decision history sizes for end-to-end runs")
+    parser.add_argument('--context-size', type=int, default=256, help="Context features per decision")
+    parser.add_argument('--integrations', default='disabled', choices=['disabled', 'simulated'],
+                        help="Run without integrations or against the simulated GAIA-Q-AIR/AMPEL360 interfaces")
+    parser.add_argument('--output', help="Write results JSON here")
+    parser.add_argument('--save-baseline', help="Write results as a baseline JSON")
+    parser.add_argument('--baseline', help="Compare against this baseline JSON")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative regression")
+    parser.add_argument('--gate', nargs='+', default=['p50', 'p99'],
+                        choices=list(PERCENTILES) + ['mean'], help="Percentiles that gate regressions")
+    return parser.parse_args(argv)
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    results = {}
+    for backend in args.backend:
+        results[backend] = await run_backend(
+            backend, args.iterations, args.warmup, args.alloc_calls,
+            args.history_sizes, args.context_size, args.integrations
+        )
+
+    print_report(results, DEFAULT_CONFIG['real_ai']['decision_latency_target_us'])
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\n💾 Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.tolerance, args.gate)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%} tolerance:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%} tolerance")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -9,21 +9,132 @@ Author: Robbbo-T
 """
 
 import asyncio
+import copy
 import ctypes
 import numpy as np
 import time
 import threading
 import logging
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Tuple, Any, Callable
+import math
+import os
+import importlib
+import signal
+import hashlib
+import heapq
+import itertools
+import multiprocessing
+from multiprocessing import shared_memory
+from dataclasses import dataclass, asdict, field, fields
+from typing import Dict, List, Optional, Tuple, Any, Callable, Sequence
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 import json
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+from collections.abc import Sequence as SequenceABC
 from abc import ABC, abstractmethod
 
-# GAIA-Q-AIR integration
-from external.gaia_q_air.python.interface import GAIAQAirInterface
-from external.ampel360_bwb_q100.python.interface import AMPEL360Interface
+# GAIA-Q-AIR integration interfaces, imported only when enabled
+INTEGRATION_INTERFACES = {
+    'gaia_air': ('external.gaia_q_air.python.interface', 'GAIAQAirInterface'),
+    'ampel360': ('external.ampel360_bwb_q100.python.interface', 'AMPEL360Interface')
+}
+
+# Defaults used when no configuration file is found
+DEFAULT_CONFIG = {
+    "real_ai": {
+        "decision_latency_target_us": 5,
+        "batch_latency_target_us": None,
+        "consciousness_threshold": 0.8,
+        "learning_rate": 0.001,
+        "adaptation_strength": 0.1,
+        "safety_validation": True,
+        "ethics_validation": True,
+        "decision_cache_enabled": False,
+        "decision_cache_size": 4096,
+        "decision_cache_ttl_s": 1.0,
+        "inference_backend": "auto",
+        "core_library": "./lib/libgaia_real_ai_core.so",
+        "embodied_library": "./lib/libreal_ai_embodied.so",
+        "reference_seed": 0,
+        "health_window_s": 10.0,
+        "real_time_compliance_threshold": 0.95,
+        "safety_compliance_threshold": 0.95,
+        "config_watch_interval_s": 1.0,
+        "adaptation_queue_enabled": False,
+        "adaptation_queue_capacity": 4096,
+        "adaptation_batch_size": 32,
+        "adaptation_flush_interval_s": 0.01,
+        "stream_policy": "latest",
+        "stream_queue_size": 8,
+        "stream_staleness_factor": 200.0
+    },
+    "safety": {
+        "max_decision_magnitude": 1.0,
+        "min_confidence_threshold": 0.85,
+        "max_rate_of_change": 0.1,
+        "rate_rearm_decisions": 3,
+        "forbidden_states": [],
+        "emergency_protocols": {
+            "auto_revert": True,
+            "safety_margin": 0.2,
+            "escalation_threshold": 0.9
+        }
+    },
+    "pool": {
+        "workers": 0,
+        "routing": "round_robin",
+        "slots_per_worker": 64,
+        "start_method": "spawn",
+        "start_timeout_s": 30.0
+    },
+    "admission": {
+        "enabled": False,
+        "max_concurrent": 4,
+        "degrade_queue_depth": 8,
+        "shed_queue_depth": 64,
+        "deadline_factor": 50.0,
+        "deadline_percentile": 99.0
+    },
+    "journal": {
+        "enabled": False,
+        "directory": "./journal",
+        "segment_records": 65536,
+        "flush_records": 1024,
+        "flush_interval_s": 1.0
+    },
+    "integration": {
+        "gaia_air_enabled": True,
+        "ampel360_enabled": True,
+        "quantum_enhanced": True,
+        "interfaces": "external",
+        "simulated": {
+            "seed": 0,
+            "gaia_air": {"update_rate_hz": 50.0, "latency_ms": 2.0},
+            "ampel360": {"update_rate_hz": 20.0, "latency_ms": 5.0}
+        },
+        "default_max_staleness_s": 1.0,
+        "max_staleness_s": {
+            "gaia_air.coupling_strength": 0.5,
+            "ampel360.coupling_strength": 0.5,
+            "ampel360.hydraulic_pressure_psi": 0.25
+        }
+    },
+    "performance": {
+        "real_time_priority": False,
+        "memory_limit_mb": 512,
+        "cpu_affinity": [0, 1, 2, 3],
+        "thread_affinity": {},
+        "real_time_priority_level": 10,
+        "nice_fallback": -10,
+        "native_offload": False,
+        "native_max_in_flight": 4,
+        "native_reentrant": False,
+        "tracing_mode": "off",
+        "tracing_sample_rate": 0.01,
+        "tracing_max_events": 100000
+    }
+}
 
 @dataclass
 class RealAIMetrics:
@@ -40,10 +151,38 @@ class RealAIMetrics:
     total_decisions: int
     successful_adaptations: int
     timestamp: float
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+    # Cumulative latency percentiles and sliding-window aggregates ('1s', '10s', '60s'),
+    # refreshed by get_real_ai_metrics()
+    latency_p50_us: float = 0.0
+    latency_p99_us: float = 0.0
+    latency_p999_us: float = 0.0
+    windows: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # Background adaptation pipeline (queued mode only)
+    adaptation_queue_depth: int = 0
+    adaptations_dropped: int = 0
+    adaptation_apply_p50_us: float = 0.0
+    adaptation_apply_p99_us: float = 0.0
+    # decision_stream() contexts dropped for a passed deadline, coalesced into
+    # a newer context, or skipped for insufficient consciousness
+    stream_expired: int = 0
+    stream_coalesced: int = 0
+    stream_rejected: int = 0
+    # Admission control: requests that had to wait for a slot, advisory
+    # requests shed or degraded under overload, and the current wait queue
+    admission_queued: int = 0
+    admission_shed: int = 0
+    admission_degraded: int = 0
+    admission_queue_depth: int = 0
+    # Integration telemetry: AMPEL360 coupling and reads refused as stale
+    ampel360_coupling: float = 0.0
+    telemetry_stale_reads: int = 0
 
-@dataclass
+@dataclass(frozen=True)
 class ConsciousnessState:
-    """Real AI consciousness state representation"""
+    """Real AI consciousness state representation (immutable snapshot)"""
     awareness_level: float
     self_awareness: float
     intentionality: float
@@ -54,13 +193,79 @@ class ConsciousnessState:
     meta_cognition: float
     embodied_presence: float
     consciousness_continuity: float
+    sequence: int = 0  # Monitor sample count the snapshot was built from
+
+class ReasoningTrace(SequenceABC):
+    """Structured reasoning trace, rendered to strings only when read
+    
+    Capture keeps references to the numeric inputs; presence checks and
+    len() never render. Behaves as a read-only sequence of lines.
+    """
+    
+    __slots__ = ('context_features', 'decision', 'consciousness_state', '_lines')
+    
+    LINE_COUNT = 7
+    
+    def __init__(self, context_features: int, decision, consciousness_state: ConsciousnessState):
+        self.context_features = context_features
+        self.decision = decision  # Must not be mutated after capture
+        self.consciousness_state = consciousness_state
+        self._lines = None
+    
+    def render(self) -> List[str]:
+        """Render (once) and return the trace lines"""
+        if self._lines is None:
+            decision = np.asarray(self.decision)
+            state = self.consciousness_state
+            max_decision_idx = np.argmax(np.abs(decision))
+            self._lines = [
+                f"Context analysis: {self.context_features} input features processed",
+                f"Consciousness level: {state.awareness_level:.3f}",
+                f"Decision confidence: {np.mean(decision):.3f}",
+                f"Intentionality: {state.intentionality:.3f}",
+                f"Agency: {state.agency:.3f}",
+                f"Meta-cognition: {state.meta_cognition:.3f}",
+                # Decision rationale
+                f"Primary decision factor: dimension {max_decision_idx} (strength: {decision[max_decision_idx]:.3f})"
+            ]
+        return self._lines
+    
+    def __len__(self) -> int:
+        return self.LINE_COUNT
+    
+    def __bool__(self) -> bool:
+        return True
+    
+    def __getitem__(self, index):
+        return self.render()[index]
+    
+    def __iter__(self):
+        return iter(self.render())
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ReasoningTrace):
+            other = other.render()
+        return self.render() == list(other) if isinstance(other, (list, tuple)) else NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"ReasoningTrace({self.render()!r})"
 
 @dataclass
 class RealAIDecision:
-    """Real AI decision with full context"""
-    decision_vector: List[float]
-    confidence_scores: List[float]
-    reasoning_trace: List[str]
+    """Real AI decision with full context
+    
+    decision_vector and confidence_scores are read-only float32 arrays, often
+    views into a shared block; use to_dict() for plain-Python values.
+    """
+    __slots__ = (
+        'decision_vector', 'confidence_scores', 'reasoning_trace', 'consciousness_state',
+        'safety_validated', 'ethics_validated', 'real_time_compliant',
+        'decision_latency_us', 'context_hash', 'timestamp'
+    )
+    
+    decision_vector: np.ndarray
+    confidence_scores: np.ndarray
+    reasoning_trace: Sequence[str]
     consciousness_state: ConsciousnessState
     safety_validated: bool
     ethics_validated: bool
@@ -68,38 +273,371 @@ class RealAIDecision:
     decision_latency_us: float
     context_hash: str
     timestamp: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize with plain lists, matching asdict() of a list-based record"""
+        return {
+            'decision_vector': self.decision_vector.tolist(),
+            'confidence_scores': self.confidence_scores.tolist(),
+            'reasoning_trace': list(self.reasoning_trace),
+            'consciousness_state': asdict(self.consciousness_state),
+            'safety_validated': bool(self.safety_validated),
+            'ethics_validated': bool(self.ethics_validated),
+            'real_time_compliant': bool(self.real_time_compliant),
+            'decision_latency_us': float(self.decision_latency_us),
+            'context_hash': self.context_hash,
+            'timestamp': float(self.timestamp)
+        }
+
+def _frozen_outputs(decision_vector: np.ndarray, confidence_scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Copy inference outputs into one read-only block and return its row views
+    
+    Costs one (2, 16) allocation; a pair this function already returned is
+    passed through without copying.
+    """
+    block = decision_vector.base
+    if (block is not None and block is confidence_scores.base and block.shape == (2, len(decision_vector))
+            and block.dtype == np.float32 and block.flags.owndata and not block.flags.writeable):
+        return decision_vector, confidence_scores
+    outputs = np.empty((2, len(decision_vector)), dtype=np.float32)
+    outputs[0] = decision_vector
+    outputs[1] = confidence_scores
+    outputs.flags.writeable = False
+    return outputs[0], outputs[1]
+
+# ConsciousnessState fields stored per decision (sequence is tracked separately)
+CONSCIOUSNESS_FIELDS = tuple(f.name for f in fields(ConsciousnessState) if f.name != 'sequence')
+
+class CEmbodiedState(ctypes.Structure):
+    """C layout of one embodied-state snapshot from the embodied library"""
+    _fields_ = [
+        ("consciousness_level", ctypes.c_float),
+        ("self_awareness", ctypes.c_float),
+        ("intentionality", ctypes.c_float),
+        ("agency", ctypes.c_float),
+        ("consciousness_continuity", ctypes.c_float),
+        ("memory_persistence", ctypes.c_float),
+        ("intention_stability", ctypes.c_float),
+        ("self_model_accuracy", ctypes.c_float),
+        ("world_model_fidelity", ctypes.c_float),
+        ("prediction_confidence", ctypes.c_float),
+        ("timestamp_ns", ctypes.c_uint64)
+    ]
+
+# Structured dtype with CEmbodiedState's exact layout (natural C alignment), so
+# snapshot arrays are filled by the native library in place
+EMBODIED_STATE_DTYPE = np.dtype([
+    (name, np.float32 if ctype is ctypes.c_float else np.uint64)
+    for name, ctype in CEmbodiedState._fields_
+], align=True)
+assert EMBODIED_STATE_DTYPE.itemsize == ctypes.sizeof(CEmbodiedState)
+assert all(EMBODIED_STATE_DTYPE.fields[name][1] == getattr(CEmbodiedState, name).offset
+           for name, _ in CEmbodiedState._fields_)
+
+@dataclass
+class RealAIDecisionBatch:
+    """Batch of Real AI decisions in columnar form"""
+    contexts: np.ndarray            # (N, F) caller contexts, not copied
+    decision_vectors: np.ndarray    # (N, 16) float32
+    confidence_scores: np.ndarray   # (N, 16) float32
+    consciousness_state: ConsciousnessState
+    safety_validated: np.ndarray    # (N,) bool
+    ethics_validated: np.ndarray    # (N,) bool
+    real_time_compliant: np.ndarray # (N,) bool, batch latency within batch_latency_target_us
+    decision_latency_us: np.ndarray # (N,) amortized per-decision latency
+    context_hashes: List[str]
+    violations: Dict[int, List[str]]
+    batch_latency_us: float
+    timestamp: float
+    
+    def __len__(self) -> int:
+        return len(self.decision_vectors)
+
+class ConsciousnessHistory:
+    """Fixed-capacity, column-oriented ring buffer of consciousness samples
+    
+    Rolling sums over the awareness, continuity and persistence windows are
+    maintained on every push, so window statistics are O(1) to read.
+    
+    There must be a single writer. Readers on other threads use the seqlock
+    accessors (latest, read_window), which retry instead of locking when
+    they overlap a push.
+    """
+    
+    def __init__(self,
+                 capacity: int = 1000,
+                 awareness_window: int = 10,
+                 continuity_window: int = 20,
+                 persistence_window: int = 50):
+        if capacity < 2 * persistence_window:
+            raise ValueError(f"History capacity {capacity} too small for persistence window {persistence_window}")
+        
+        self.capacity = capacity
+        self.awareness_window = awareness_window
+        self.continuity_window = continuity_window
+        self.persistence_window = persistence_window
+        
+        # Preallocated columns
+        self.timestamp = np.zeros(capacity, dtype=np.float64)
+        self.coherence = np.zeros(capacity, dtype=np.float64)
+        self.awareness = np.zeros(capacity, dtype=np.float64)
+        self.continuity = np.zeros(capacity, dtype=np.float64)
+        
+        self.count = 0  # Total samples ever pushed
+        self._write_seq = 0  # Odd while a push is in progress
+        self._reset_sums()
+    
+    def _reset_sums(self):
+        self._awareness_sum = 0.0
+        self._continuity_sum = 0.0
+        self._continuity_sumsq = 0.0
+        # Pairs (x[t], x[t - persistence_window]) over the last persistence_window samples
+        self._pair_sum_x = 0.0
+        self._pair_sum_y = 0.0
+        self._pair_sum_xx = 0.0
+        self._pair_sum_yy = 0.0
+        self._pair_sum_xy = 0.0
+    
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+    
+    def _coherence_at(self, t: int) -> float:
+        """Coherence of absolute sample t (must still be in the buffer)"""
+        return float(self.coherence[t % self.capacity])
+    
+    def push(self, timestamp: float, coherence: float, awareness: float, continuity: float):
+        """Append a sample, evicting the oldest when full (single writer only)"""
+        self._write_seq += 1
+        t = self.count
+        x = float(coherence)
+        
+        # Update window sums before the slot is overwritten
+        self._awareness_sum += x
+        if t >= self.awareness_window:
+            self._awareness_sum -= self._coherence_at(t - self.awareness_window)
+        
+        self._continuity_sum += x
+        self._continuity_sumsq += x * x
+        if t >= self.continuity_window:
+            old = self._coherence_at(t - self.continuity_window)
+            self._continuity_sum -= old
+            self._continuity_sumsq -= old * old
+        
+        lag = self.persistence_window
+        if t >= lag:
+            y = self._coherence_at(t - lag)
+            self._add_pair(x, y, 1.0)
+            if t >= 2 * lag:
+                self._add_pair(y, self._coherence_at(t - 2 * lag), -1.0)
+        
+        idx = t % self.capacity
+        self.timestamp[idx] = timestamp
+        self.coherence[idx] = x
+        self.awareness[idx] = awareness
+        self.continuity[idx] = continuity
+        self.count = t + 1
+        
+        # Bound floating-point drift of the running sums
+        if self.count % self.capacity == 0:
+            self._resync()
+        
+        self._write_seq += 1
+    
+    # Reader backoff while a push is in progress, and the longest wait
+    # before the writer is considered stalled
+    READ_BACKOFF_MAX_S = 1e-3
+    READ_STALL_TIMEOUT_S = 1.0
+    
+    def _begin_read(self) -> int:
+        """Wait for a stable (even) write sequence
+        
+        The first retry only yields the GIL; later ones sleep with
+        exponential backoff, so a reader scheduled above the writer (e.g.
+        SCHED_FIFO) still lets it finish. Raises RuntimeError if one push
+        stays in progress past READ_STALL_TIMEOUT_S.
+        """
+        seq = self._write_seq
+        if not seq & 1:
+            return seq
+        
+        delay = 0.0
+        stalled_seq = seq
+        deadline = time.monotonic() + self.READ_STALL_TIMEOUT_S
+        while seq & 1:
+            if seq != stalled_seq:
+                stalled_seq = seq
+                deadline = time.monotonic() + self.READ_STALL_TIMEOUT_S
+            elif time.monotonic() > deadline:
+                raise RuntimeError("Consciousness history writer stalled mid-push")
+            time.sleep(delay)
+            delay = min(max(delay * 2, 1e-6), self.READ_BACKOFF_MAX_S)
+            seq = self._write_seq
+        return seq
+    
+    def _add_pair(self, x: float, y: float, sign: float):
+        self._pair_sum_x += sign * x
+        self._pair_sum_y += sign * y
+        self._pair_sum_xx += sign * x * x
+        self._pair_sum_yy += sign * y * y
+        self._pair_sum_xy += sign * x * y
+    
+    def _resync(self):
+        """Recompute running sums exactly from the buffer"""
+        self._reset_sums()
+        t_end = self.count
+        for t in range(max(0, t_end - self.awareness_window), t_end):
+            self._awareness_sum += self._coherence_at(t)
+        for t in range(max(0, t_end - self.continuity_window), t_end):
+            x = self._coherence_at(t)
+            self._continuity_sum += x
+            self._continuity_sumsq += x * x
+        lag = self.persistence_window
+        for t in range(max(lag, t_end - lag), t_end):
+            self._add_pair(self._coherence_at(t), self._coherence_at(t - lag), 1.0)
+    
+    def latest(self) -> Tuple[float, float, float, float]:
+        """Latest (timestamp, coherence, awareness, continuity) sample"""
+        while True:
+            seq = self._begin_read()
+            idx = (self.count - 1) % self.capacity
+            sample = (float(self.timestamp[idx]), float(self.coherence[idx]),
+                      float(self.awareness[idx]), float(self.continuity[idx]))
+            if self._write_seq == seq:
+                return sample
+    
+    def read_window(self, column: str, n: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Copy the last n values of a column, oldest first
+        
+        Only the requested window is copied. Pass a preallocated out array
+        of at least n elements to avoid allocating.
+        """
+        if column not in ('timestamp', 'coherence', 'awareness', 'continuity'):
+            raise ValueError(f"Unknown history column: {column}")
+        if out is None:
+            out = np.empty(min(n, self.capacity), dtype=getattr(self, column).dtype)
+        
+        available = self.read_windows(n, {column: out})
+        return out[:available]
+    
+    def read_windows(self, n: int, outs: Dict[str, np.ndarray]) -> int:
+        """Copy the last n values of several columns from one consistent read
+        
+        outs maps column names to arrays (or strided views) of at least n
+        elements. Returns the number of samples copied into each, oldest first.
+        """
+        while True:
+            seq = self._begin_read()
+            available = min(n, self.count, self.capacity, *(len(out) for out in outs.values()))
+            end = self.count % self.capacity
+            start = end - available
+            for column, out in outs.items():
+                data = getattr(self, column)
+                if start >= 0:
+                    out[:available] = data[start:end]
+                else:
+                    out[:-start] = data[start:]
+                    out[-start:available] = data[:end]
+            if self._write_seq == seq:
+                return available
+    
+    def coherence_mean(self) -> float:
+        """Mean coherence over the awareness window"""
+        n = min(self.count, self.awareness_window)
+        return self._awareness_sum / n if n else 0.0
+    
+    def coherence_variance(self) -> float:
+        """Population variance of coherence over the continuity window"""
+        n = min(self.count, self.continuity_window)
+        if not n:
+            return 0.0
+        mean = self._continuity_sum / n
+        return max(0.0, self._continuity_sumsq / n - mean * mean)
+    
+    def coherence_autocorrelation(self) -> float:
+        """Correlation of the latest window against the window before it (NaN if undefined)"""
+        n = self.persistence_window
+        if self.count < 2 * n:
+            # Not enough history for two disjoint windows; original behaviour
+            # correlated the recent window with itself. Samples are still
+            # contiguous in the buffer at this point.
+            recent = self.coherence[max(0, self.count - n):self.count]
+            return 1.0 if len(recent) > 1 and recent.var() > 0 else float('nan')
+        
+        mean_x = self._pair_sum_x / n
+        mean_y = self._pair_sum_y / n
+        var_x = self._pair_sum_xx / n - mean_x * mean_x
+        var_y = self._pair_sum_yy / n - mean_y * mean_y
+        if var_x <= 1e-18 or var_y <= 1e-18:
+            return float('nan')
+        cov = self._pair_sum_xy / n - mean_x * mean_y
+        return cov / np.sqrt(var_x * var_y)
 
 class ConsciousnessMonitor:
     """Advanced consciousness monitoring and analysis"""
     
-    def __init__(self):
-        self.consciousness_history = []
+    def __init__(self, history_capacity: int = 1000):
+        self.consciousness_history = ConsciousnessHistory(capacity=history_capacity)
         self.awareness_threshold = 0.8
         self.coherence_threshold = 0.85
         self.monitoring_active = False
         
-    def start_monitoring(self, update_interval_ms: int = 10):
-        """Start consciousness monitoring thread"""
+        # Latest published snapshot; rebuilt only when a new sample lands.
+        # Publication is a single reference store, so readers never lock.
+        self._state_snapshot = self._build_consciousness_state()
+        self._sampler_thread = None
+        self._sampler_stop = threading.Event()
+        
+    def start_monitoring(self, update_interval_ms: int = 10, thread_setup: Optional[Callable[[], None]] = None):
+        """Start consciousness monitoring thread
+        
+        The history has a single writer, so a sampler that is still running
+        is reused rather than joined by a second one.
+        """
+        sampler = self._sampler_thread
+        if sampler is not None and sampler.is_alive():
+            if self.monitoring_active:
+                return
+            raise RuntimeError("Previous consciousness sampler is still stopping")
+        
         self.monitoring_active = True
+        stop = self._sampler_stop = threading.Event()
         
         def monitor_loop():
-            while self.monitoring_active:
+            if thread_setup is not None:
+                thread_setup()
+            while not stop.is_set():
                 # Consciousness coherence measurement
                 coherence = self._measure_consciousness_coherence()
-                self.consciousness_history.append({
-                    'timestamp': time.time(),
-                    'coherence': coherence,
-                    'awareness': self._calculate_awareness_level(),
-                    'continuity': self._assess_continuity()
-                })
-                
-                # Keep history bounded
-                if len(self.consciousness_history) > 1000:
-                    self.consciousness_history.pop(0)
+                self.consciousness_history.push(
+                    time.time(),
+                    coherence,
+                    self._calculate_awareness_level(),
+                    self._assess_continuity()
+                )
+                self._state_snapshot = self._build_consciousness_state()
                 
-                time.sleep(update_interval_ms / 1000.0)
+                stop.wait(update_interval_ms / 1000.0)
+        
+        self._sampler_thread = threading.Thread(target=monitor_loop, name="consciousness-sampler", daemon=True)
+        self._sampler_thread.start()
+    
+    def stop_monitoring(self, timeout: float = 1.0) -> bool:
+        """Stop the sampler thread and wait up to timeout for it to exit
         
-        threading.Thread(target=monitor_loop, daemon=True).start()
+        Returns False if the thread is still alive, in which case
+        start_monitoring() refuses to start another one.
+        """
+        self.monitoring_active = False
+        self._sampler_stop.set()
+        sampler = self._sampler_thread
+        if sampler is None:
+            return True
+        if sampler is not threading.current_thread():
+            sampler.join(timeout)
+        if sampler.is_alive():
+            return False
+        self._sampler_thread = None
+        return True
     
     def _measure_consciousness_coherence(self) -> float:
         """Measure quantum consciousness coherence"""
@@ -116,27 +654,41 @@ class ConsciousnessMonitor:
         if len(self.consciousness_history) < 10:
             return 0.5
         
-        recent_coherence = [h['coherence'] for h in self.consciousness_history[-10:]]
-        return np.mean(recent_coherence)
+        return self.consciousness_history.coherence_mean()
     
     def _assess_continuity(self) -> float:
         """Assess consciousness continuity"""
         if len(self.consciousness_history) < 2:
             return 0.5
         
-        coherence_values = [h['coherence'] for h in self.consciousness_history[-20:]]
-        if len(coherence_values) < 2:
-            return 0.5
-        
         # Calculate continuity as inverse of variance
-        variance = np.var(coherence_values)
+        variance = self.consciousness_history.coherence_variance()
         continuity = 1.0 / (1.0 + variance * 10)
         
-        return np.clip(continuity, 0.0, 1.0)
+        return min(max(continuity, 0.0), 1.0)
     
     def get_consciousness_state(self) -> ConsciousnessState:
-        """Get current consciousness state"""
-        if not self.consciousness_history:
+        """Get current consciousness state
+        
+        Returns the snapshot published for the latest sample. While the
+        sampler thread is running it is the only writer, so readers take the
+        published reference as-is; otherwise a stale snapshot is rebuilt here.
+        """
+        snapshot = self._state_snapshot
+        sampler = self._sampler_thread
+        if sampler is not None and sampler.is_alive():
+            return snapshot
+        
+        if snapshot.sequence != self.consciousness_history.count:
+            snapshot = self._build_consciousness_state()
+            self._state_snapshot = snapshot
+        
+        return snapshot
+    
+    def _build_consciousness_state(self) -> ConsciousnessState:
+        """Build an immutable snapshot from the current history"""
+        history = self.consciousness_history
+        if not len(history):
             return ConsciousnessState(
                 awareness_level=0.0,
                 self_awareness=0.0,
@@ -147,28 +699,36 @@ class ConsciousnessMonitor:
                 prediction_confidence=0.0,
                 meta_cognition=0.0,
                 embodied_presence=0.0,
-                consciousness_continuity=0.0
+                consciousness_continuity=0.0,
+                sequence=history.count
             )
         
-        latest = self.consciousness_history[-1]
+        _, latest_coherence, latest_awareness, latest_continuity = history.latest()
+        
+        # Window statistics are shared by the derived measures below
+        awareness = self._calculate_awareness_level()
+        continuity = self._assess_continuity()
         
         return ConsciousnessState(
-            awareness_level=latest['awareness'],
-            self_awareness=self._calculate_self_awareness(),
+            awareness_level=latest_awareness,
+            self_awareness=self._calculate_self_awareness(awareness),
             intentionality=self._calculate_intentionality(),
             agency=self._calculate_agency(),
-            temporal_coherence=latest['coherence'],
+            temporal_coherence=latest_coherence,
             memory_persistence=self._calculate_memory_persistence(),
-            prediction_confidence=self._calculate_prediction_confidence(),
-            meta_cognition=self._calculate_meta_cognition(),
+            prediction_confidence=self._calculate_prediction_confidence(awareness),
+            meta_cognition=self._calculate_meta_cognition(awareness, continuity),
             embodied_presence=self._calculate_embodied_presence(),
-            consciousness_continuity=latest['continuity']
+            consciousness_continuity=latest_continuity,
+            sequence=history.count
         )
     
-    def _calculate_self_awareness(self) -> float:
+    def _calculate_self_awareness(self, awareness: Optional[float] = None) -> float:
         """Calculate self-awareness level"""
+        if awareness is None:
+            awareness = self._calculate_awareness_level()
         # Self-awareness through monitoring own performance
-        return self._calculate_awareness_level() * 0.9  # Slightly lower than general awareness
+        return awareness * 0.9  # Slightly lower than general awareness
     
     def _calculate_intentionality(self) -> float:
         """Calculate intentionality level"""
@@ -186,47 +746,98 @@ class ConsciousnessMonitor:
         if len(self.consciousness_history) < 50:
             return 0.5
         
-        # Analyze how well patterns persist over time
-        recent_patterns = [h['coherence'] for h in self.consciousness_history[-50:]]
-        older_patterns = [h['coherence'] for h in self.consciousness_history[-100:-50]] if len(self.consciousness_history) >= 100 else recent_patterns
-        
-        # Calculate correlation between recent and older patterns
-        if len(older_patterns) == len(recent_patterns):
-            correlation = np.corrcoef(recent_patterns, older_patterns)[0, 1]
-            return np.clip(correlation, 0.0, 1.0) if not np.isnan(correlation) else 0.5
+        # Correlation between recent and older coherence patterns
+        correlation = self.consciousness_history.coherence_autocorrelation()
+        if np.isnan(correlation):
+            return 0.5
         
-        return 0.5
+        return min(max(correlation, 0.0), 1.0)
     
-    def _calculate_prediction_confidence(self) -> float:
+    def _calculate_prediction_confidence(self, awareness: Optional[float] = None) -> float:
         """Calculate prediction confidence"""
+        if awareness is None:
+            awareness = self._calculate_awareness_level()
         # Confidence in future state predictions
-        return self._calculate_awareness_level() * 0.95
+        return awareness * 0.95
     
-    def _calculate_meta_cognition(self) -> float:
+    def _calculate_meta_cognition(self,
+                                  awareness: Optional[float] = None,
+                                  continuity: Optional[float] = None) -> float:
         """Calculate meta-cognitive capabilities"""
         # Meta-cognition as awareness of own cognitive processes
-        awareness = self._calculate_awareness_level()
-        continuity = self._assess_continuity()
+        if awareness is None:
+            awareness = self._calculate_awareness_level()
+        if continuity is None:
+            continuity = self._assess_continuity()
         return (awareness + continuity) / 2.0
     
     def _calculate_embodied_presence(self) -> float:
         """Calculate embodied presence in physical reality"""
         # Embodied presence as integration with physical systems
         return 0.9  # High presence in aerospace systems
+    
+    def fill_embodied_states(self, out: np.ndarray, timestamps: Optional[np.ndarray] = None) -> int:
+        """Reference embodied snapshots for the latest len(out) monitor samples
+        
+        Fills an EMBODIED_STATE_DTYPE array column-wise, oldest first, with
+        the same derivations as get_consciousness_state(); window-level
+        measures (memory persistence) come from the current snapshot. The
+        monitor has no measure of intention_stability, self_model_accuracy
+        or world_model_fidelity, so those are NaN. timestamps is optional
+        float64 scratch of at least len(out). Returns the number of
+        snapshots written.
+        """
+        if timestamps is None:
+            timestamps = np.empty(len(out), dtype=np.float64)
+        
+        n = self.consciousness_history.read_windows(len(out), {
+            'timestamp': timestamps,
+            'awareness': out['consciousness_level'],
+            'continuity': out['consciousness_continuity']
+        })
+        states = out[:n]
+        awareness = states['consciousness_level']
+        np.multiply(awareness, 0.9, out=states['self_awareness'])
+        states['intentionality'] = self._calculate_intentionality()
+        states['agency'] = self._calculate_agency()
+        states['memory_persistence'] = self.get_consciousness_state().memory_persistence
+        for name in ('intention_stability', 'self_model_accuracy', 'world_model_fidelity'):
+            states[name] = np.nan
+        np.multiply(awareness, 0.95, out=states['prediction_confidence'])
+        np.multiply(timestamps[:n], 1e9, out=states['timestamp_ns'], casting='unsafe')
+        return n
 
 class RealAISafetyValidator:
-    """Safety validation for Real AI decisions"""
+    """Stateful safety validation for Real AI decisions and batches"""
     
-    def __init__(self):
-        self.safety_rules = self._load_safety_rules()
+    RULE_MAGNITUDE = 0x1
+    RULE_CONFIDENCE = 0x2
+    RULE_RATE_OF_CHANGE = 0x4
+    RULE_FORBIDDEN_STATE = 0x8
+    RULE_REAL_TIME = 0x10
+    CONTENT_RULES = RULE_MAGNITUDE | RULE_CONFIDENCE | RULE_RATE_OF_CHANGE | RULE_FORBIDDEN_STATE
+    
+    def __init__(self, safety_config: Optional[Dict[str, Any]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.safety_rules = self._load_safety_rules(safety_config or {})
         self.ethics_framework = self._load_ethics_framework()
+        self._compile_rules()
         
-    def _load_safety_rules(self) -> Dict[str, Any]:
-        """Load aerospace safety rules"""
-        return {
+        # Stateful checks
+        self.last_safe_decision = None
+        self.last_safe_confidence = None
+        self._candidate_setpoint = None  # Step beyond the rate limit being held
+        self._candidate_count = 0
+        self.failure_rate = 0.0
+        self.escalated = False
+        
+    def _load_safety_rules(self, safety_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Load aerospace safety rules, overriding defaults from config"""
+        rules = {
             'max_decision_magnitude': 1.0,
             'min_confidence_threshold': 0.85,
             'max_rate_of_change': 0.1,
+            'rate_rearm_decisions': 3,
             'forbidden_states': [],
             'emergency_protocols': {
                 'auto_revert': True,
@@ -234,6 +845,54 @@ class RealAISafetyValidator:
                 'escalation_threshold': 0.9
             }
         }
+        for key, value in safety_config.items():
+            if key == 'emergency_protocols':
+                rules['emergency_protocols'] = {**rules['emergency_protocols'], **value}
+            else:
+                rules[key] = value
+        return rules
+    
+    def _compile_rules(self):
+        """Compile rule values into scalars and forbidden-region bound arrays"""
+        rules = self.safety_rules
+        self.max_magnitude = float(rules['max_decision_magnitude'])
+        self.min_confidence = float(rules['min_confidence_threshold'])
+        max_rate = rules.get('max_rate_of_change')
+        self.max_rate_of_change = float(max_rate) if max_rate is not None else np.inf
+        self.rate_rearm_decisions = max(1, int(rules.get('rate_rearm_decisions') or 1))
+        
+        # Each forbidden state is a box; a decision inside any box is rejected.
+        # Boxes are given as {"lower": [...], "upper": [...]} (None = unbounded)
+        # or {"dimension": i, "min": a, "max": b}.
+        regions = rules.get('forbidden_states') or []
+        self.forbidden_lower = np.full((len(regions), 16), -np.inf, dtype=np.float32)
+        self.forbidden_upper = np.full((len(regions), 16), np.inf, dtype=np.float32)
+        for r, region in enumerate(regions):
+            if 'dimension' in region:
+                dimension = int(region['dimension'])
+                if region.get('min') is not None:
+                    self.forbidden_lower[r, dimension] = region['min']
+                if region.get('max') is not None:
+                    self.forbidden_upper[r, dimension] = region['max']
+            else:
+                for bound, target in (('lower', self.forbidden_lower), ('upper', self.forbidden_upper)):
+                    for dimension, value in enumerate(region.get(bound) or []):
+                        if value is not None:
+                            target[r, dimension] = value
+        
+        protocols = rules['emergency_protocols']
+        self.auto_revert = bool(protocols.get('auto_revert', False))
+        self.escalation_threshold = float(protocols.get('escalation_threshold', 1.0))
+        self.safety_margin = float(protocols.get('safety_margin', 0.0))
+    
+    def inherit_state(self, other: 'RealAISafetyValidator'):
+        """Carry stateful checks over from a validator being replaced"""
+        self.last_safe_decision = other.last_safe_decision
+        self.last_safe_confidence = other.last_safe_confidence
+        self._candidate_setpoint = other._candidate_setpoint
+        self._candidate_count = other._candidate_count
+        self.failure_rate = other.failure_rate
+        self.escalated = other.escalated
     
     def _load_ethics_framework(self) -> Dict[str, Any]:
         """Load GAIA-QAO ethics framework"""
@@ -268,23 +927,160 @@ class RealAISafetyValidator:
     
     def _validate_safety(self, decision: RealAIDecision) -> Tuple[bool, List[str]]:
         """Validate safety constraints"""
-        violations = []
-        
-        # Check decision magnitude
-        max_magnitude = max(abs(d) for d in decision.decision_vector)
-        if max_magnitude > self.safety_rules['max_decision_magnitude']:
-            violations.append(f"Decision magnitude {max_magnitude:.3f} exceeds limit")
+        vector = np.asarray(decision.decision_vector, dtype=np.float32)
+        scores = np.asarray(decision.confidence_scores, dtype=np.float32)
         
-        # Check confidence threshold
-        min_confidence = min(decision.confidence_scores)
-        if min_confidence < self.safety_rules['min_confidence_threshold']:
-            violations.append(f"Confidence {min_confidence:.3f} below threshold")
+        max_magnitude = float(np.abs(vector).max())
+        min_confidence = float(scores.min())
+        previous = self.last_safe_decision
+        rate = float(np.abs(vector - previous).max()) if previous is not None else 0.0
         
-        # Check real-time compliance
+        failed = 0
+        if max_magnitude > self.max_magnitude:
+            failed |= self.RULE_MAGNITUDE
+        if min_confidence < self.min_confidence:
+            failed |= self.RULE_CONFIDENCE
+        if rate > self.max_rate_of_change and not self._setpoint_held(vector):
+            failed |= self.RULE_RATE_OF_CHANGE
+        if len(self.forbidden_lower):
+            inside = ((vector >= self.forbidden_lower) & (vector <= self.forbidden_upper)).all(axis=1)
+            if inside.any():
+                failed |= self.RULE_FORBIDDEN_STATE
         if not decision.real_time_compliant:
+            failed |= self.RULE_REAL_TIME
+        
+        self._update_escalation(1 if failed & self.CONTENT_RULES else 0, 1)
+        if not failed & self.CONTENT_RULES:
+            self.last_safe_decision = vector
+            self.last_safe_confidence = scores
+            self._candidate_setpoint = None
+            self._candidate_count = 0
+        if not failed:
+            return True, []
+        
+        # Build the report only for failing rules
+        violations = self._describe_failures(failed, max_magnitude, min_confidence, rate, vector)
+        if failed & self.CONTENT_RULES and self.auto_revert and previous is not None:
+            # The whole decision reverts, so its scores and trace match the vector
+            decision.decision_vector = previous
+            decision.confidence_scores = self.last_safe_confidence
+            trace = decision.reasoning_trace
+            if isinstance(trace, ReasoningTrace):
+                decision.reasoning_trace = ReasoningTrace(
+                    trace.context_features, previous, decision.consciousness_state
+                )
+            violations.append("Auto-reverted to last safe decision")
+        
+        return False, violations
+    
+    def _setpoint_held(self, vector: np.ndarray) -> bool:
+        """Count a step beyond the rate limit; True once it has been held long enough"""
+        candidate = self._candidate_setpoint
+        if candidate is not None and float(np.abs(vector - candidate).max()) <= self.max_rate_of_change:
+            self._candidate_count += 1
+        else:
+            self._candidate_setpoint = vector
+            self._candidate_count = 1
+        return self._candidate_count >= self.rate_rearm_decisions
+    
+    def _describe_failures(self, failed: int, max_magnitude: float, min_confidence: float,
+                           rate: float, vector: np.ndarray) -> List[str]:
+        violations = []
+        if failed & self.RULE_MAGNITUDE:
+            violations.append(f"Decision magnitude {max_magnitude:.3f} exceeds limit")
+        if failed & self.RULE_CONFIDENCE:
+            violations.append(f"Confidence {min_confidence:.3f} below threshold")
+        if failed & self.RULE_RATE_OF_CHANGE:
+            violations.append(f"Rate of change {rate:.3f} exceeds limit {self.max_rate_of_change:.3f}")
+        if failed & self.RULE_FORBIDDEN_STATE:
+            inside = ((vector >= self.forbidden_lower) & (vector <= self.forbidden_upper)).all(axis=1)
+            violations.append(f"Decision enters forbidden state(s) {np.flatnonzero(inside).tolist()}")
+        if failed & self.RULE_REAL_TIME:
             violations.append("Real-time constraint violation")
+        return violations
+    
+    def _update_escalation(self, failures: int, total: int):
+        """Track the failure rate and escalate past the configured threshold
         
-        return len(violations) == 0, violations
+        Escalation clears once the rate falls safety_margin below the
+        threshold, so it does not flap around the limit.
+        """
+        alpha = 0.1  # Exponential moving average factor
+        weight = 1.0 - (1.0 - alpha) ** total
+        self.failure_rate += weight * (failures / total - self.failure_rate)
+        
+        if not self.escalated and self.failure_rate >= self.escalation_threshold:
+            self.escalated = True
+            self.logger.critical(f"Safety escalation: failure rate {self.failure_rate:.3f}")
+        elif self.escalated and self.failure_rate < self.escalation_threshold - self.safety_margin:
+            self.escalated = False
+            self.logger.warning(f"Safety escalation cleared: failure rate {self.failure_rate:.3f}")
+    
+    def validate_batch(self,
+                       decision_vectors: np.ndarray,
+                       confidence_scores: np.ndarray,
+                       real_time_compliant: np.ndarray,
+                       consciousness_state: ConsciousnessState) -> Tuple[np.ndarray, Dict[int, List[str]]]:
+        """Validate a batch of decisions in vectorized passes
+        
+        Rows are treated as alternatives for the same control step: each is
+        checked against the last safe decision, and the batch does not move
+        that state. With auto-revert, rows failing content rules are
+        overwritten in place with the last safe decision and its scores.
+        
+        Returns a per-decision validity mask and violation reports keyed by
+        row index; reports are only built for rows that actually fail.
+        """
+        batch_size = len(decision_vectors)
+        max_magnitude = np.abs(decision_vectors).max(axis=1)
+        min_confidence = confidence_scores.min(axis=1)
+        previous = self.last_safe_decision
+        
+        failed = np.zeros(batch_size, dtype=np.uint8)
+        failed[max_magnitude > self.max_magnitude] |= self.RULE_MAGNITUDE
+        failed[min_confidence < self.min_confidence] |= self.RULE_CONFIDENCE
+        if previous is not None:
+            rate = np.abs(decision_vectors - previous).max(axis=1)
+            failed[rate > self.max_rate_of_change] |= self.RULE_RATE_OF_CHANGE
+        else:
+            rate = np.zeros(batch_size, dtype=np.float32)
+        if len(self.forbidden_lower):
+            inside = (
+                (decision_vectors[:, None, :] >= self.forbidden_lower) &
+                (decision_vectors[:, None, :] <= self.forbidden_upper)
+            ).all(axis=2).any(axis=1)
+            failed[inside] |= self.RULE_FORBIDDEN_STATE
+        failed[~real_time_compliant] |= self.RULE_REAL_TIME
+        
+        # Consciousness is shared by the whole batch; the trace is always
+        # derivable from the batch record, so transparency holds per row
+        ethics_fail = consciousness_state.awareness_level < 0.7
+        
+        valid = failed == 0
+        if ethics_fail:
+            valid[:] = False
+        self._update_escalation(int(np.count_nonzero(failed & self.CONTENT_RULES)), max(batch_size, 1))
+        
+        violations = {}
+        failing_rows = np.flatnonzero(~valid)
+        for i in failing_rows:
+            row_violations = self._describe_failures(
+                int(failed[i]), float(max_magnitude[i]), float(min_confidence[i]),
+                float(rate[i]), decision_vectors[i]
+            )
+            if ethics_fail:
+                row_violations.append("Insufficient consciousness for ethical decision")
+            violations[int(i)] = row_violations
+        
+        if self.auto_revert and previous is not None and len(failing_rows):
+            revert = (failed & self.CONTENT_RULES) != 0
+            if revert.any():
+                decision_vectors[revert] = previous
+                confidence_scores[revert] = self.last_safe_confidence
+                for i in np.flatnonzero(revert):
+                    violations[int(i)].append("Auto-reverted to last safe decision")
+        
+        return valid, violations
     
     def _validate_ethics(self, decision: RealAIDecision) -> Tuple[bool, List[str]]:
         """Validate ethics constraints"""
@@ -294,337 +1090,2886 @@ class RealAISafetyValidator:
         if decision.consciousness_state.awareness_level < 0.7:
             violations.append("Insufficient consciousness for ethical decision")
         
-        # Check transparency (reasoning trace)
+        # Check transparency (reasoning trace); presence check does not render
         if not decision.reasoning_trace:
             violations.append("No reasoning trace provided")
         
         return len(violations) == 0, violations
 
-class FunctionalRealAI:
-    """Complete Functional Real AI System"""
+class DecisionBuffers:
+    """Reusable, cache-line aligned native I/O buffers for one worker
     
-    def __init__(self, config_path: str = "config/real_ai/config.json"):
-        self.logger = logging.getLogger(__name__)
-        self.config = self._load_config(config_path)
-        
-        # Core components
-        self.consciousness_monitor = ConsciousnessMonitor()
-        self.safety_validator = RealAISafetyValidator()
-        
-        # Native library interfaces
-        self.cpp_ai_handle = None
-        self.rust_embodied_handle = None
-        self._load_native_libraries()
-        
-        # System state
-        self.system_active = False
-        self.real_time_mode = True
-        self.learning_enabled = True
-        
-        # Performance tracking
-        self.metrics = RealAIMetrics(
-            consciousness_level=0.0,
-            decision_latency_us=0.0,
-            learning_velocity=0.0,
-            adaptation_success_rate=0.0,
-            safety_compliance=1.0,
-            real_time_compliance=True,
-            quantum_coherence=0.0,
-            embodiment_integrity=0.0,
-            gaia_air_coupling=0.0,
-            total_decisions=0,
-            successful_adaptations=0,
-            timestamp=time.time()
-        )
-        
-        # Integration interfaces
-        self.gaia_air_interface = None
-        self.ampel360_interface = None
-        
-        # Decision history
-        self.decision_history = []
-        self.max_history_size = 1000
+    The ctypes pointers are created once, so the steady-state decision path
+    hands stable addresses to the native core without allocating.
+    """
+    
+    ALIGNMENT = 64
+    
+    def __init__(self, context_size: int = 512, output_size: int = 16):
+        self.context = self._aligned_float32(context_size)
+        self.decision_vector = self._aligned_float32(output_size)
+        self.confidence_scores = self._aligned_float32(output_size)
+        self.context[:] = 0.0
+        self._filled = 0  # Leading context entries that may be non-zero
         
-        # Real-time executor
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        float_ptr = ctypes.POINTER(ctypes.c_float)
+        self.context_ptr = self.context.ctypes.data_as(float_ptr)
+        self.decision_ptr = self.decision_vector.ctypes.data_as(float_ptr)
+        self.confidence_ptr = self.confidence_scores.ctypes.data_as(float_ptr)
+    
+    @classmethod
+    def _aligned_float32(cls, size: int) -> np.ndarray:
+        raw = np.empty(size * 4 + cls.ALIGNMENT, dtype=np.uint8)
+        offset = -raw.ctypes.data % cls.ALIGNMENT
+        return raw[offset:offset + size * 4].view(np.float32)
+    
+    def load(self, context: np.ndarray) -> np.ndarray:
+        """Copy a context into the input buffer, truncating or zero-padding"""
+        n = min(len(context), len(self.context))  # Truncate for real-time guarantee
+        np.copyto(self.context[:n], context[:n], casting='unsafe')
+        if n < self._filled:
+            self.context[n:self._filled] = 0.0
+        self._filled = n
         
-    def _load_config(self, path: str) -> Dict[str, Any]:
-        """Load Real AI configuration"""
-        try:
-            with open(path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {
-                "real_ai": {
-                    "decision_latency_target_us": 5,
-                    "consciousness_threshold": 0.8,
-                    "learning_rate": 0.001,
-                    "adaptation_strength": 0.1,
-                    "safety_validation": True,
-                    "ethics_validation": True
-                },
-                "integration": {
-                    "gaia_air_enabled": True,
-                    "ampel360_enabled": True,
-                    "quantum_enhanced": True
-                },
-                "performance": {
-                    "real_time_priority": True,
-                    "memory_limit_mb": 512,
-                    "cpu_affinity": [0, 1, 2, 3]
-                }
-            }
+        return self.context
     
-    def _load_native_libraries(self):
-        """Load C++ and Rust native libraries"""
-        try:
-            # Load C++ Real AI Core
-            self.cpp_lib = ctypes.CDLL("./lib/libgaia_real_ai_core.so")
-            self._setup_cpp_bindings()
-            
-            # Load Rust Embodied Intelligence
-            self.rust_lib = ctypes.CDLL("./lib/libreal_ai_embodied.so")
-            self._setup_rust_bindings()
-            
-            self.logger.info("Native libraries loaded successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to load native libraries: {e}")
+    def nbytes(self) -> int:
+        """Memory held by the buffers, including alignment padding"""
+        return sum(buffer.base.nbytes for buffer in (self.context, self.decision_vector, self.confidence_scores))
+
+class DecisionBufferPool:
+    """Per-thread DecisionBuffers, created on first use by each worker"""
+    
+    def __init__(self, context_size: int = 512, output_size: int = 16):
+        self.context_size = context_size
+        self.output_size = output_size
+        self._local = threading.local()
+    
+    def acquire(self) -> DecisionBuffers:
+        """Buffers owned by the calling thread"""
+        buffers = getattr(self._local, 'buffers', None)
+        if buffers is None:
+            buffers = DecisionBuffers(self.context_size, self.output_size)
+            self._local.buffers = buffers
+        return buffers
+
+class InferenceBackend(ABC):
+    """Decision engine behind FunctionalRealAI
+    
+    Backends map a 512-float context to 16 decision values and 16 confidence
+    scores. They are not assumed to be re-entrant; the controller serializes
+    calls unless configured otherwise.
+    """
+    
+    name = 'abstract'
+    
+    @property
+    def supports_batch(self) -> bool:
+        """Whether make_decision_batch is a single engine call"""
+        return False
+    
+    @abstractmethod
+    def create(self) -> bool:
+        """Create the engine instance"""
+    
+    @abstractmethod
+    def initialize(self, config: Dict[str, Any]) -> bool:
+        """Initialize the engine from the controller configuration"""
     
-    def _setup_cpp_bindings(self):
+    @abstractmethod
+    def make_decision(self, buffers: DecisionBuffers) -> bool:
+        """Infer from buffers.context into buffers.decision_vector/confidence_scores"""
+    
+    @abstractmethod
+    def make_decision_batch(self,
+                            context_matrix: np.ndarray,
+                            decision_vectors: np.ndarray,
+                            confidence_scores: np.ndarray) -> bool:
+        """Infer over a contiguous (N, 512) float32 matrix into (N, 16) outputs"""
+    
+    @abstractmethod
+    def adapt(self, feedback: np.ndarray, learning_strength: float) -> bool:
+        """Apply one adaptation step from 16 float32 feedback values"""
+    
+    def adapt_batch(self, feedback: np.ndarray, learning_strengths: np.ndarray) -> bool:
+        """Apply (N, 16) feedback rows in order; engines override to do it in one call"""
+        success = True
+        for row, strength in zip(feedback, learning_strengths):
+            success = self.adapt(row, float(strength)) and success
+        return success
+    
+    def shutdown(self):
+        """Release engine resources"""
+
+class NativeInferenceBackend(InferenceBackend):
+    """GAIA C++ Real AI core loaded through ctypes"""
+    
+    name = 'native'
+    
+    def __init__(self, library: ctypes.CDLL):
+        self.lib = library
+        self.handle = None
+        self.batch_supported = False
+        self.adapt_batch_supported = False
+        self._setup_bindings()
+    
+    def _setup_bindings(self):
         """Setup C++ library bindings"""
         # C++ Real AI Core function signatures
-        self.cpp_lib.gaia_real_ai_create.restype = ctypes.c_void_p
-        self.cpp_lib.gaia_real_ai_create.argtypes = []
+        self.lib.gaia_real_ai_create.restype = ctypes.c_void_p
+        self.lib.gaia_real_ai_create.argtypes = []
         
-        self.cpp_lib.gaia_real_ai_initialize.restype = ctypes.c_bool
-        self.cpp_lib.gaia_real_ai_initialize.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        self.lib.gaia_real_ai_initialize.restype = ctypes.c_bool
+        self.lib.gaia_real_ai_initialize.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
         
-        self.cpp_lib.gaia_real_ai_make_decision.restype = ctypes.c_bool
-        self.cpp_lib.gaia_real_ai_make_decision.argtypes = [
+        self.lib.gaia_real_ai_make_decision.restype = ctypes.c_bool
+        self.lib.gaia_real_ai_make_decision.argtypes = [
             ctypes.c_void_p,
             ctypes.POINTER(ctypes.c_float),
             ctypes.POINTER(ctypes.c_float),
             ctypes.POINTER(ctypes.c_float)
         ]
         
-        self.cpp_lib.gaia_real_ai_adapt.restype = ctypes.c_bool
-        self.cpp_lib.gaia_real_ai_adapt.argtypes = [
+        # Optional batched entry point; older cores only export the scalar call
+        self.batch_supported = hasattr(self.lib, 'gaia_real_ai_make_decision_batch')
+        if self.batch_supported:
+            self.lib.gaia_real_ai_make_decision_batch.restype = ctypes.c_bool
+            self.lib.gaia_real_ai_make_decision_batch.argtypes = [
+                ctypes.c_void_p,
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.c_size_t,
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float)
+            ]
+        
+        self.lib.gaia_real_ai_adapt.restype = ctypes.c_bool
+        self.lib.gaia_real_ai_adapt.argtypes = [
             ctypes.c_void_p,
             ctypes.POINTER(ctypes.c_float),
             ctypes.c_float
         ]
-    
-    def _setup_rust_bindings(self):
-        """Setup Rust library bindings"""
-        # Rust Embodied Intelligence function signatures
-        self.rust_lib.real_ai_embodied_create.restype = ctypes.c_void_p
-        self.rust_lib.real_ai_embodied_create.argtypes = []
-        
-        self.rust_lib.real_ai_embodied_initialize.restype = ctypes.c_bool
-        self.rust_lib.real_ai_embodied_initialize.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
         
-        # Define C structure for embodied state
-        class CEmbodiedState(ctypes.Structure):
-            _fields_ = [
-                ("consciousness_level", ctypes.c_float),
-                ("self_awareness", ctypes.c_float),
-                ("intentionality", ctypes.c_float),
-                ("agency", ctypes.c_float),
-                # ... other fields
-                ("timestamp_ns", ctypes.c_uint64)
+        # Optional batched adaptation: (N, 16) feedback and N strengths
+        self.adapt_batch_supported = hasattr(self.lib, 'gaia_real_ai_adapt_batch')
+        if self.adapt_batch_supported:
+            self.lib.gaia_real_ai_adapt_batch.restype = ctypes.c_bool
+            self.lib.gaia_real_ai_adapt_batch.argtypes = [
+                ctypes.c_void_p,
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.c_size_t
             ]
-        
-        self.CEmbodiedState = CEmbodiedState
     
-    async def initialize_real_ai(self) -> bool:
-        """Initialize the complete Real AI system"""
-        self.logger.info("🧠 Initializing Functional Real AI System...")
-        
-        try:
-            # Phase 1: Initialize C++ Real AI Core
-            self.cpp_ai_handle = self.cpp_lib.gaia_real_ai_create()
-            if not self.cpp_ai_handle:
-                raise RuntimeError("Failed to create C++ AI handle")
-            
-            config_str = json.dumps(self.config).encode('utf-8')
-            if not self.cpp_lib.gaia_real_ai_initialize(self.cpp_ai_handle, config_str):
-                raise RuntimeError("Failed to initialize C++ AI core")
-            
-            # Phase 2: Initialize Rust Embodied Intelligence
-            self.rust_embodied_handle = self.rust_lib.real_ai_embodied_create()
-            if not self.rust_embodied_handle:
-                raise RuntimeError("Failed to create Rust embodied handle")
-            
-            if not self.rust_lib.real_ai_embodied_initialize(self.rust_embodied_handle, config_str):
-                raise RuntimeError("Failed to initialize Rust embodied intelligence")
-            
-            # Phase 3: Initialize GAIA-Q-AIR integration
-            if self.config['integration']['gaia_air_enabled']:
-                self.gaia_air_interface = GAIAQAirInterface()
-                await self.gaia_air_interface.initialize()
-                self.logger.info("✓ GAIA-Q-AIR integration initialized")
-            
-            # Phase 4: Initialize AMPEL360 BWB-Q100 integration
-            if self.config['integration']['ampel360_enabled']:
-                self.ampel360_interface = AMPEL360Interface()
-                await self.ampel360_interface.initialize()
-                self.logger.info("✓ AMPEL360 BWB-Q100 integration initialized")
-            
-            # Phase 5: Start consciousness monitoring
-            self.consciousness_monitor.start_monitoring()
-            self.logger.info("✓ Consciousness monitoring started")
-            
-            # Phase 6: Start real-time processing
-            await self._start_real_time_processing()
-            
-            self.system_active = True
-            self.logger.info("🚀 Functional Real AI System OPERATIONAL")
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Real AI initialization failed: {e}")
-            return False
+    @property
+    def supports_batch(self) -> bool:
+        return self.batch_supported
     
-    async def make_real_ai_decision(self, 
-                                  context: np.ndarray,
-                                  goal_specification: Optional[str] = None,
-                                  consciousness_requirement: float = 0.8) -> RealAIDecision:
-        """Make a conscious Real AI decision"""
-        if not self.system_active:
-            raise RuntimeError("Real AI system not active")
-        
-        decision_start = time.perf_counter()
-        
-        # Get current consciousness state
-        consciousness_state = self.consciousness_monitor.get_consciousness_state()
-        
-        # Check consciousness requirement
-        if consciousness_state.awareness_level < consciousness_requirement:
-            raise RuntimeError(f"Insufficient consciousness: {consciousness_state.awareness_level:.3f} < {consciousness_requirement}")
+    def create(self) -> bool:
+        self.handle = self.lib.gaia_real_ai_create()
+        return bool(self.handle)
+    
+    def initialize(self, config: Dict[str, Any]) -> bool:
+        config_str = json.dumps(config).encode('utf-8')
+        return bool(self.lib.gaia_real_ai_initialize(self.handle, config_str))
+    
+    def make_decision(self, buffers: DecisionBuffers) -> bool:
+        return self.lib.gaia_real_ai_make_decision(
+            self.handle,
+            buffers.context_ptr,
+            buffers.decision_ptr,
+            buffers.confidence_ptr
+        )
+    
+    def make_decision_batch(self,
+                            context_matrix: np.ndarray,
+                            decision_vectors: np.ndarray,
+                            confidence_scores: np.ndarray) -> bool:
+        float_ptr = ctypes.POINTER(ctypes.c_float)
+        batch_size = context_matrix.shape[0]
         
-        # Prepare context
-        context_array = self._prepare_context(context)
+        if self.batch_supported:
+            return self.lib.gaia_real_ai_make_decision_batch(
+                self.handle,
+                context_matrix.ctypes.data_as(float_ptr),
+                batch_size,
+                decision_vectors.ctypes.data_as(float_ptr),
+                confidence_scores.ctypes.data_as(float_ptr)
+            )
         
-        # Perform C++ neural inference
-        decision_vector = np.zeros(16, dtype=np.float32)
-        confidence_scores = np.zeros(16, dtype=np.float32)
+        # Fall back to the scalar call, walking row pointers over contiguous buffers
+        make_decision = self.lib.gaia_real_ai_make_decision
+        handle = self.handle
+        context_base = context_matrix.ctypes.data
+        decision_base = decision_vectors.ctypes.data
+        confidence_base = confidence_scores.ctypes.data
+        context_stride = context_matrix.strides[0]
+        output_stride = decision_vectors.strides[0]
         
-        success = self.cpp_lib.gaia_real_ai_make_decision(
-            self.cpp_ai_handle,
-            context_array.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
-            decision_vector.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
-            confidence_scores.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
+        for i in range(batch_size):
+            if not make_decision(
+                handle,
+                ctypes.cast(context_base + i * context_stride, float_ptr),
+                ctypes.cast(decision_base + i * output_stride, float_ptr),
+                ctypes.cast(confidence_base + i * output_stride, float_ptr)
+            ):
+                return False
+        return True
+    
+    def adapt(self, feedback: np.ndarray, learning_strength: float) -> bool:
+        return self.lib.gaia_real_ai_adapt(
+            self.handle,
+            feedback.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+            ctypes.c_float(learning_strength)
         )
+    
+    def adapt_batch(self, feedback: np.ndarray, learning_strengths: np.ndarray) -> bool:
+        if not self.adapt_batch_supported:
+            return super().adapt_batch(feedback, learning_strengths)
+        float_ptr = ctypes.POINTER(ctypes.c_float)
+        return self.lib.gaia_real_ai_adapt_batch(
+            self.handle,
+            feedback.ctypes.data_as(float_ptr),
+            learning_strengths.ctypes.data_as(float_ptr),
+            len(feedback)
+        )
+    
+    def shutdown(self):
+        if self.handle:
+            # Note: Add proper cleanup call when available
+            pass
+
+class ReferenceInferenceBackend(InferenceBackend):
+    """Pure-NumPy reference engine with the native core's 512 -> 16 shapes
+    
+    A small dense network: 512 -> hidden (tanh) -> 16 decision values (tanh)
+    and 16 confidence scores (sigmoid). Adaptation nudges the output layer
+    along the feedback, using the hidden activations of the latest decision.
+    Runs anywhere NumPy does, so the controller can be exercised and
+    benchmarked without the native libraries.
+    """
+    
+    name = 'reference'
+    
+    def __init__(self, hidden_size: int = 64, seed: int = 0):
+        self.hidden_size = hidden_size
+        self.seed = seed
+        self.learning_rate = 0.001
+    
+    @property
+    def supports_batch(self) -> bool:
+        return True
+    
+    def create(self) -> bool:
+        rng = np.random.default_rng(self.seed)
+        hidden = self.hidden_size
+        self.w_hidden = (rng.standard_normal((hidden, 512)) / np.sqrt(512)).astype(np.float32)
+        self.b_hidden = np.zeros(hidden, dtype=np.float32)
+        self.w_decision = (rng.standard_normal((16, hidden)) / np.sqrt(hidden)).astype(np.float32)
+        self.b_decision = np.zeros(16, dtype=np.float32)
+        self.w_confidence = (rng.standard_normal((16, hidden)) * 0.01).astype(np.float32)
+        self.b_confidence = np.full(16, 2.5, dtype=np.float32)  # ~0.92 confidence at rest
+        
+        # Scratch for the scalar path (calls are serialized by the controller)
+        self._hidden = np.zeros(hidden, dtype=np.float32)
+        self._last_hidden = np.zeros(hidden, dtype=np.float32)
+        return True
+    
+    def initialize(self, config: Dict[str, Any]) -> bool:
+        self.learning_rate = config.get('real_ai', {}).get('learning_rate', self.learning_rate)
+        return True
+    
+    def make_decision(self, buffers: DecisionBuffers) -> bool:
+        hidden = self._hidden
+        np.dot(self.w_hidden, buffers.context, out=hidden)
+        hidden += self.b_hidden
+        np.tanh(hidden, out=hidden)
+        self._last_hidden[:] = hidden
+        
+        decision = buffers.decision_vector
+        np.dot(self.w_decision, hidden, out=decision)
+        decision += self.b_decision
+        np.tanh(decision, out=decision)
+        
+        confidence = buffers.confidence_scores
+        np.dot(self.w_confidence, hidden, out=confidence)
+        confidence += self.b_confidence
+        self._sigmoid(confidence)
+        return True
+    
+    def make_decision_batch(self,
+                            context_matrix: np.ndarray,
+                            decision_vectors: np.ndarray,
+                            confidence_scores: np.ndarray) -> bool:
+        hidden = context_matrix @ self.w_hidden.T
+        hidden += self.b_hidden
+        np.tanh(hidden, out=hidden)
+        if len(hidden):
+            self._last_hidden[:] = hidden[-1]
+        
+        np.matmul(hidden, self.w_decision.T, out=decision_vectors)
+        decision_vectors += self.b_decision
+        np.tanh(decision_vectors, out=decision_vectors)
+        
+        np.matmul(hidden, self.w_confidence.T, out=confidence_scores)
+        confidence_scores += self.b_confidence
+        self._sigmoid(confidence_scores)
+        return True
+    
+    @staticmethod
+    def _sigmoid(values: np.ndarray):
+        np.negative(values, out=values)
+        np.exp(values, out=values)
+        values += 1.0
+        np.reciprocal(values, out=values)
+    
+    def adapt(self, feedback: np.ndarray, learning_strength: float) -> bool:
+        step = np.float32(self.learning_rate * learning_strength)
+        self.w_decision += step * np.outer(feedback, self._last_hidden)
+        self.b_decision += step * feedback
+        return True
+    
+    def adapt_batch(self, feedback: np.ndarray, learning_strengths: np.ndarray) -> bool:
+        # Steps share the latest hidden activations, so they sum into one update
+        combined = np.float32(self.learning_rate) * (learning_strengths @ feedback)
+        self.w_decision += np.outer(combined, self._last_hidden)
+        self.b_decision += combined
+        return True
+
+class LatencyHistogram:
+    """Constant-memory, log-bucketed latency histogram (HDR-style)
+    
+    Each power of two is split into SUB_BUCKETS linear sub-buckets, giving
+    at most ~6% relative error from 0.01μs to beyond a day. Recording is O(1).
+    """
+    
+    SUB_BUCKETS = 16
+    MIN_EXPONENT = -6   # frexp exponent of the smallest bucket (~0.008μs)
+    MAX_EXPONENT = 40   # ~1e12μs
+    BUCKET_COUNT = (MAX_EXPONENT - MIN_EXPONENT + 1) * SUB_BUCKETS
+    
+    def __init__(self):
+        self.counts = np.zeros(self.BUCKET_COUNT, dtype=np.int64)
+        self.total = 0
+        self.max_value = 0.0
+    
+    @classmethod
+    def bucket_index(cls, value: float) -> int:
+        if value <= 0.0:
+            return 0
+        mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, 0.5 <= mantissa < 1
+        index = (exponent - cls.MIN_EXPONENT) * cls.SUB_BUCKETS + int((mantissa - 0.5) * 2 * cls.SUB_BUCKETS)
+        return min(max(index, 0), cls.BUCKET_COUNT - 1)
+    
+    @classmethod
+    def bucket_indices(cls, values: np.ndarray) -> np.ndarray:
+        """Vectorized bucket_index"""
+        mantissa, exponent = np.frexp(np.maximum(values, 0.0))
+        index = (exponent - cls.MIN_EXPONENT) * cls.SUB_BUCKETS + ((mantissa - 0.5) * 2 * cls.SUB_BUCKETS).astype(np.int64)
+        index[values <= 0.0] = 0
+        return np.clip(index, 0, cls.BUCKET_COUNT - 1)
+    
+    @classmethod
+    def bucket_upper_bounds(cls) -> np.ndarray:
+        index = np.arange(cls.BUCKET_COUNT)
+        exponent = index // cls.SUB_BUCKETS + cls.MIN_EXPONENT
+        sub_bucket = index % cls.SUB_BUCKETS
+        return np.ldexp(0.5 + (sub_bucket + 1) / (2.0 * cls.SUB_BUCKETS), exponent)
+    
+    @classmethod
+    def percentile_of(cls, counts: np.ndarray, q: float) -> float:
+        """Percentile (0-100) of a bucket count vector, as a bucket upper bound"""
+        total = int(counts.sum())
+        if not total:
+            return 0.0
+        rank = max(1, math.ceil(q / 100.0 * total))
+        index = int(np.searchsorted(np.cumsum(counts), rank))
+        return float(_LATENCY_BUCKET_BOUNDS[index])
+    
+    def record(self, value: float):
+        self.counts[self.bucket_index(value)] += 1
+        self.total += 1
+        if value > self.max_value:
+            self.max_value = value
+    
+    def record_many(self, values: np.ndarray):
+        if not len(values):
+            return
+        np.add.at(self.counts, self.bucket_indices(values), 1)
+        self.total += len(values)
+        self.max_value = max(self.max_value, float(values.max()))
+    
+    def percentile(self, q: float) -> float:
+        return min(self.percentile_of(self.counts, q), self.max_value)
+    
+    def reset(self):
+        self.counts[:] = 0
+        self.total = 0
+        self.max_value = 0.0
+
+_LATENCY_BUCKET_BOUNDS = LatencyHistogram.bucket_upper_bounds()
+
+class WindowedDecisionStats:
+    """Sliding-window decision counters and latency histograms
+    
+    Time is split into slots of slot_s seconds kept in a ring covering
+    horizon_s; each slot holds counters and a latency histogram. Recording
+    touches only the current slot, and a window is the sum of its newest
+    slots, so memory is constant and updates are O(1).
+    """
+    
+    DECISIONS, REAL_TIME_COMPLIANT, SAFETY_VALIDATED = range(3)
+    
+    def __init__(self, horizon_s: float = 60.0, slot_s: float = 0.5, start: Optional[float] = None):
+        self.slot_s = slot_s
+        self.started = time.monotonic() if start is None else start
+        self.slot_count = int(math.ceil(horizon_s / slot_s))
+        self.counters = np.zeros((self.slot_count, 3), dtype=np.int64)
+        self.histograms = np.zeros((self.slot_count, LatencyHistogram.BUCKET_COUNT), dtype=np.int32)
+        self._slot_id = int(self.started / slot_s)
+    
+    def _advance(self, now: float) -> int:
+        """Move to the slot containing now, clearing slots that expired"""
+        slot_id = int(now / self.slot_s)
+        if slot_id != self._slot_id:
+            for stale in range(max(self._slot_id + 1, slot_id - self.slot_count + 1), slot_id + 1):
+                idx = stale % self.slot_count
+                self.counters[idx] = 0
+                self.histograms[idx] = 0
+            self._slot_id = slot_id
+        return slot_id % self.slot_count
+    
+    def record(self, latency_us: float, real_time_compliant: bool, safety_validated: bool,
+               now: Optional[float] = None):
+        idx = self._advance(time.monotonic() if now is None else now)
+        counters = self.counters[idx]
+        counters[self.DECISIONS] += 1
+        if real_time_compliant:
+            counters[self.REAL_TIME_COMPLIANT] += 1
+        if safety_validated:
+            counters[self.SAFETY_VALIDATED] += 1
+        self.histograms[idx, LatencyHistogram.bucket_index(latency_us)] += 1
+    
+    def record_batch(self, latencies_us: np.ndarray, real_time_compliant: np.ndarray,
+                     safety_validated: np.ndarray, now: Optional[float] = None):
+        idx = self._advance(time.monotonic() if now is None else now)
+        counters = self.counters[idx]
+        counters[self.DECISIONS] += len(latencies_us)
+        counters[self.REAL_TIME_COMPLIANT] += int(np.count_nonzero(real_time_compliant))
+        counters[self.SAFETY_VALIDATED] += int(np.count_nonzero(safety_validated))
+        np.add.at(self.histograms[idx], LatencyHistogram.bucket_indices(latencies_us), 1)
+    
+    def window(self, window_s: float, now: Optional[float] = None) -> Dict[str, float]:
+        """Aggregates over the last window_s seconds (rounded up to whole slots)"""
+        return self.summarize(*self.window_totals(window_s, now))
+    
+    def window_totals(self, window_s: float, now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, float]:
+        """Raw (counters, latency histogram, elapsed seconds) of a window
+        
+        Elapsed time is capped at the time since the stats started, so rates
+        are not diluted while uptime is shorter than the window. Totals from
+        several instances can be summed and passed to summarize().
+        """
+        now = time.monotonic() if now is None else now
+        current = self._advance(now)
+        slots = min(self.slot_count, max(1, int(math.ceil(window_s / self.slot_s))))
+        indices = (current - np.arange(slots)) % self.slot_count
+        elapsed = min((slots - 1) * self.slot_s + (now - self._slot_id * self.slot_s), now - self.started)
+        return self.counters[indices].sum(axis=0), self.histograms[indices].sum(axis=0), elapsed
+    
+    @staticmethod
+    def summarize(counters: np.ndarray, histogram: np.ndarray, elapsed: float) -> Dict[str, float]:
+        decisions, real_time_compliant, safety_validated = (int(v) for v in counters)
+        return {
+            'decisions': decisions,
+            'decisions_per_s': decisions / elapsed if elapsed > 0 else 0.0,
+            'real_time_compliance': real_time_compliant / decisions if decisions else 1.0,
+            'safety_compliance': safety_validated / decisions if decisions else 1.0,
+            'violation_rate': (decisions - safety_validated) / decisions if decisions else 0.0,
+            'latency_p50_us': LatencyHistogram.percentile_of(histogram, 50.0),
+            'latency_p90_us': LatencyHistogram.percentile_of(histogram, 90.0),
+            'latency_p99_us': LatencyHistogram.percentile_of(histogram, 99.0),
+            'latency_p999_us': LatencyHistogram.percentile_of(histogram, 99.9),
+        }
+
+# Sliding windows reported in RealAIMetrics.windows
+METRIC_WINDOWS = (('1s', 1.0), ('10s', 10.0), ('60s', 60.0))
+
+class DecisionTracer:
+    """Hot-path span recorder with Chrome trace (Perfetto) export
+    
+    Modes are 'off', 'sampled' (every Nth root operation, N = 1/sample_rate)
+    and 'always'. Callers ask sample() once per root operation and only time
+    stages when it returns True, so a disabled tracer costs one call.
+    Spans are kept in a bounded ring of the newest max_events.
+    """
+    
+    MODES = ('off', 'sampled', 'always')
+    
+    def __init__(self, mode: str = 'off', sample_rate: float = 0.01, max_events: int = 100000):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown tracing mode '{mode}', expected one of {self.MODES}")
+        self.mode = mode
+        self.active = mode != 'off'
+        self.sample_interval = max(1, int(round(1.0 / sample_rate))) if mode == 'sampled' else 1
+        self.events = deque(maxlen=max_events)
+        self._counter = 0
+    
+    def sample(self) -> bool:
+        """Whether the next root operation should be traced"""
+        if not self.active:
+            return False
+        self._counter += 1
+        return self._counter % self.sample_interval == 0
+    
+    def record(self, name: str, start_ns: int, category: str = 'decision', args: Optional[Dict[str, Any]] = None) -> int:
+        """Record a span from start_ns to now; returns now for chaining stages"""
+        end_ns = time.perf_counter_ns()
+        self.events.append((name, category, start_ns, end_ns - start_ns, threading.get_ident(), args))
+        return end_ns
+    
+    def clear(self):
+        self.events.clear()
+    
+    def export_chrome_trace(self, path: str) -> int:
+        """Write spans as Chrome trace JSON (chrome://tracing, ui.perfetto.dev)"""
+        pid = os.getpid()
+        events = list(self.events)
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        
+        trace_events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+             'args': {'name': thread_names.get(tid, f'thread-{tid}')}}
+            for tid in {event[4] for event in events}
+        ]
+        for name, category, start_ns, duration_ns, tid, args in events:
+            trace_event = {
+                'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+                'ts': start_ns / 1e3, 'dur': duration_ns / 1e3
+            }
+            if args:
+                trace_event['args'] = args
+            trace_events.append(trace_event)
+        
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ns'}, f)
+        
+        return len(events)
+
+class DecisionCache:
+    """Bounded LRU/TTL cache of inference results keyed by context digest
+    
+    Entries are only valid for the model that produced them; the owner must
+    call invalidate() whenever the model changes.
+    """
+    
+    def __init__(self, max_entries: int = 4096, ttl_s: Optional[float] = None):
+        if max_entries <= 0:
+            raise ValueError(f"Decision cache size must be positive, got {max_entries}")
+        
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries = OrderedDict()  # key -> (stored_at, decision_vector, confidence_scores)
+        self.generation = 0  # Bumped by invalidate(); identifies the current model
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Cached (decision_vector, confidence_scores) for key, if fresh"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        stored_at, decision_vector, confidence_scores = entry
+        if self.ttl_s is not None and time.monotonic() - stored_at > self.ttl_s:
+            del self._entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return decision_vector, confidence_scores
+    
+    def put(self, key, decision_vector: np.ndarray, confidence_scores: np.ndarray,
+            generation: Optional[int] = None):
+        """Store a frozen copy of an inference result, evicting the least recently used
+        
+        Hits return the stored read-only arrays themselves. A result computed
+        under an earlier generation (the model changed while inference was in
+        flight) is discarded.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic(), *_frozen_outputs(decision_vector, confidence_scores))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self):
+        """Drop every entry (model changed)"""
+        self.evictions += len(self._entries)
+        self._entries.clear()
+        self.generation += 1
+
+class AdaptationQueue:
+    """Bounded FIFO of outcome feedback, drained in mini-batches
+    
+    Feedback rows and strengths live in preallocated rings, and batches are
+    copied into a reused block, so enqueueing and draining do not allocate.
+    Rows are drained strictly in enqueue order. When full, new feedback is
+    dropped and counted rather than blocking the caller.
+    """
+    
+    def __init__(self, capacity: int = 4096, batch_size: int = 32, flush_interval_s: float = 0.01):
+        if capacity <= 0 or batch_size <= 0:
+            raise ValueError("Adaptation queue capacity and batch size must be positive")
+        
+        self.capacity = capacity
+        self.batch_size = min(batch_size, capacity)
+        self.flush_interval_s = flush_interval_s
+        self.feedback = np.zeros((capacity, 16), dtype=np.float32)
+        self.strengths = np.zeros(capacity, dtype=np.float32)
+        self._batch_feedback = np.zeros((self.batch_size, 16), dtype=np.float32)
+        self._batch_strengths = np.zeros(self.batch_size, dtype=np.float32)
+        self._head = 0  # Next row to drain
+        self.depth = 0
+        
+        self.enqueued = 0
+        self.dropped = 0
+        self.batches = 0
+        self.apply_latency = LatencyHistogram()
+    
+    def push(self, feedback: np.ndarray, learning_strength: float) -> bool:
+        """Queue one feedback vector; False if the queue is full"""
+        if self.depth == self.capacity:
+            self.dropped += 1
+            return False
+        
+        idx = (self._head + self.depth) % self.capacity
+        if len(feedback) == 16:
+            self.feedback[idx] = feedback
+        else:
+            self.feedback[idx] = np.resize(feedback, 16)
+        self.strengths[idx] = learning_strength
+        self.depth += 1
+        self.enqueued += 1
+        return True
+    
+    def pop_batch(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Oldest rows, up to batch_size, as views of the reused batch block"""
+        n = min(self.depth, self.batch_size)
+        first = min(n, self.capacity - self._head)
+        self._batch_feedback[:first] = self.feedback[self._head:self._head + first]
+        self._batch_feedback[first:n] = self.feedback[:n - first]
+        self._batch_strengths[:first] = self.strengths[self._head:self._head + first]
+        self._batch_strengths[first:n] = self.strengths[:n - first]
+        
+        self._head = (self._head + n) % self.capacity
+        self.depth -= n
+        if n:
+            self.batches += 1
+        return self._batch_feedback[:n], self._batch_strengths[:n]
+
+# Admission priority classes; lower values are served first and only
+# advisory requests are ever shed or degraded
+PRIORITY_CLASSES = {'safety_critical': 0, 'advisory': 1}
+
+class InsufficientConsciousnessError(RuntimeError):
+    """Awareness was below the decision's consciousness requirement"""
+
+class DecisionShedError(RuntimeError):
+    """An advisory decision request was shed by admission control"""
+
+class AdmissionController:
+    """Priority / earliest-deadline-first admission that sheds or degrades advisory requests"""
+    
+    def __init__(self, max_concurrent: int = 4, degrade_queue_depth: int = 8, shed_queue_depth: int = 64):
+        if max_concurrent <= 0:
+            raise ValueError(f"Admission max_concurrent must be positive, got {max_concurrent}")
+        if not 0 <= degrade_queue_depth <= shed_queue_depth:
+            raise ValueError("Admission queue depths must satisfy 0 <= degrade_queue_depth <= shed_queue_depth")
+        
+        self.max_concurrent = max_concurrent
+        self.degrade_queue_depth = degrade_queue_depth
+        self.shed_queue_depth = shed_queue_depth
+        self._waiters: List[Tuple[int, float, int, asyncio.Future]] = []
+        self._arrival = itertools.count()
+        self.active = 0
+        
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+        self.degraded = 0
+    
+    @property
+    def depth(self) -> int:
+        return len(self._waiters)
+    
+    def should_degrade(self, priority: int) -> bool:
+        """Whether a request of this class should run degraded right now
+        
+        Only decides; the caller counts degraded once the request is served.
+        """
+        return (priority != PRIORITY_CLASSES['safety_critical']
+                and len(self._waiters) >= self.degrade_queue_depth)
+    
+    async def acquire(self, priority: int, deadline: float):
+        """Wait for a decision slot; raises DecisionShedError if shed"""
+        advisory = priority != PRIORITY_CLASSES['safety_critical']
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        if advisory and len(self._waiters) >= self.shed_queue_depth:
+            self.shed += 1
+            raise DecisionShedError(f"Decision shed: {len(self._waiters)} requests already queued")
+        
+        slot = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, deadline, next(self._arrival), slot))
+        self.queued += 1
+        try:
+            await slot
+        except asyncio.CancelledError:
+            if slot.done() and not slot.cancelled():
+                self.release()  # Granted just before the cancel; pass it on
+            raise
+        
+        self.admitted += 1
+        if advisory and time.monotonic() > deadline:
+            self.release()
+            self.shed += 1
+            raise DecisionShedError("Decision shed: deadline passed while queued")
+    
+    def release(self):
+        """Hand the slot to the most urgent live waiter, or free it"""
+        while self._waiters:
+            slot = heapq.heappop(self._waiters)[3]
+            if not slot.done():
+                slot.set_result(None)
+                return
+        self.active -= 1
+
+class DecisionHistory:
+    """Bounded, columnar (struct-of-arrays) store of Real AI decisions
+    
+    Vectors and scores live in preallocated float32 matrices and per-decision
+    scalars in parallel arrays. Decisions are materialized as RealAIDecision
+    objects only when read; reasoning traces are rebuilt on access.
+    """
+    
+    SAFETY_VALIDATED = 0x1
+    ETHICS_VALIDATED = 0x2
+    REAL_TIME_COMPLIANT = 0x4
+    
+    def __init__(self,
+                 capacity: int = 1000,
+                 trace_builder: Optional[Callable[[int, np.ndarray, ConsciousnessState], Sequence[str]]] = None):
+        if capacity <= 0:
+            raise ValueError(f"Decision history capacity must be positive, got {capacity}")
+        
+        self.trace_builder = trace_builder
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.decision_vectors = np.zeros((capacity, 16), dtype=np.float32)
+        self.confidence_scores = np.zeros((capacity, 16), dtype=np.float32)
+        self.consciousness = np.zeros((capacity, len(CONSCIOUSNESS_FIELDS)), dtype=np.float32)
+        self.consciousness_sequence = np.zeros(capacity, dtype=np.int64)
+        self.decision_latency_us = np.zeros(capacity, dtype=np.float64)
+        self.timestamp = np.zeros(capacity, dtype=np.float64)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.context_hash = np.zeros(capacity, dtype='S16')
+        self.context_features = np.zeros(capacity, dtype=np.int32)
+        self.count = 0  # Total decisions ever appended
+    
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+    
+    def __getitem__(self, i: int) -> RealAIDecision:
+        return self.decision(i)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.decision(i)
+    
+    def _columns(self) -> Tuple[np.ndarray, ...]:
+        return (self.decision_vectors, self.confidence_scores, self.consciousness,
+                self.consciousness_sequence, self.decision_latency_us, self.timestamp,
+                self.flags, self.context_hash, self.context_features)
+    
+    def _slot(self, i: int) -> int:
+        """Ring slot of chronological index i (negative indices count from newest)"""
+        size = len(self)
+        if i < 0:
+            i += size
+        if not 0 <= i < size:
+            raise IndexError(f"Decision index {i} out of range for history of {size}")
+        return (self.count - size + i) % self.capacity
+    
+    def append(self, decision: RealAIDecision, context_features: int):
+        """Append one decision, evicting the oldest when full"""
+        idx = self.count % self.capacity
+        state = decision.consciousness_state
+        
+        self.decision_vectors[idx] = decision.decision_vector
+        self.confidence_scores[idx] = decision.confidence_scores
+        self.consciousness[idx] = [getattr(state, name) for name in CONSCIOUSNESS_FIELDS]
+        self.consciousness_sequence[idx] = state.sequence
+        self.decision_latency_us[idx] = decision.decision_latency_us
+        self.timestamp[idx] = decision.timestamp
+        self.flags[idx] = (
+            (self.SAFETY_VALIDATED if decision.safety_validated else 0) |
+            (self.ETHICS_VALIDATED if decision.ethics_validated else 0) |
+            (self.REAL_TIME_COMPLIANT if decision.real_time_compliant else 0)
+        )
+        self.context_hash[idx] = decision.context_hash
+        self.context_features[idx] = context_features
+        self.count += 1
+    
+    def append_batch(self, batch: RealAIDecisionBatch):
+        """Append a whole batch with vectorized column writes"""
+        batch_size = len(batch)
+        if not batch_size:
+            return
+        
+        # Only the newest rows that fit can survive
+        keep_from = max(0, batch_size - self.capacity)
+        rows = slice(keep_from, batch_size)
+        n = batch_size - keep_from
+        state = batch.consciousness_state
+        
+        flags = (
+            batch.safety_validated[rows].astype(np.uint8) * self.SAFETY_VALIDATED |
+            batch.ethics_validated[rows].astype(np.uint8) * self.ETHICS_VALIDATED |
+            batch.real_time_compliant[rows].astype(np.uint8) * self.REAL_TIME_COMPLIANT
+        )
+        per_row = (
+            (self.decision_vectors, batch.decision_vectors[rows]),
+            (self.confidence_scores, batch.confidence_scores[rows]),
+            (self.decision_latency_us, batch.decision_latency_us[rows]),
+            (self.flags, flags),
+            (self.context_hash, np.array(batch.context_hashes[keep_from:], dtype='S16'))
+        )
+        # Values shared by every row of the batch
+        shared = (
+            (self.consciousness, [getattr(state, name) for name in CONSCIOUSNESS_FIELDS]),
+            (self.consciousness_sequence, state.sequence),
+            (self.timestamp, batch.timestamp),
+            (self.context_features, batch.contexts.shape[1])
+        )
+        
+        start = (self.count + keep_from) % self.capacity
+        first = min(n, self.capacity - start)
+        for column, value in per_row:
+            column[start:start + first] = value[:first]
+            column[:n - first] = value[first:]
+        for column, value in shared:
+            column[start:start + first] = value
+            column[:n - first] = value
+        
+        self.count += batch_size
+    
+    def decision(self, i: int) -> RealAIDecision:
+        """Materialize decision i (chronological, oldest first)"""
+        idx = self._slot(i)
+        state = ConsciousnessState(
+            *(float(v) for v in self.consciousness[idx]),
+            sequence=int(self.consciousness_sequence[idx])
+        )
+        decision_vector, confidence_scores = _frozen_outputs(
+            self.decision_vectors[idx], self.confidence_scores[idx]
+        )
+        flags = int(self.flags[idx])
+        
+        return RealAIDecision(
+            decision_vector=decision_vector,
+            confidence_scores=confidence_scores,
+            reasoning_trace=(
+                self.trace_builder(int(self.context_features[idx]), decision_vector, state)
+                if self.trace_builder else []
+            ),
+            consciousness_state=state,
+            safety_validated=bool(flags & self.SAFETY_VALIDATED),
+            ethics_validated=bool(flags & self.ETHICS_VALIDATED),
+            real_time_compliant=bool(flags & self.REAL_TIME_COMPLIANT),
+            decision_latency_us=float(self.decision_latency_us[idx]),
+            context_hash=self.context_hash[idx].decode('ascii'),
+            timestamp=float(self.timestamp[idx])
+        )
+    
+    def column(self, name: str, last: Optional[int] = None) -> np.ndarray:
+        """Chronological values of a column over the last n decisions
+        
+        Returns a view when the window is contiguous in the ring, otherwise
+        a copy of just the requested window.
+        """
+        data = getattr(self, name)
+        size = len(self)
+        n = size if last is None else min(last, size)
+        end = self.count % self.capacity if self.count >= self.capacity else self.count
+        start = end - n
+        if start >= 0:
+            return data[start:end]
+        return np.concatenate((data[start:], data[:end]))
+    
+    def latency_percentile(self, q: float, last: Optional[int] = None) -> float:
+        """Latency percentile (0-100) over the last n decisions"""
+        latencies = self.column('decision_latency_us', last)
+        return float(np.percentile(latencies, q)) if len(latencies) else 0.0
+    
+    def flag_ratio(self, flag: int, last: Optional[int] = None) -> float:
+        """Fraction of the last n decisions with the given flag set"""
+        flags = self.column('flags', last)
+        return float(np.count_nonzero(flags & flag)) / len(flags) if len(flags) else 0.0
+    
+    def resize(self, capacity: int):
+        """Change capacity, keeping the newest decisions that fit"""
+        if capacity <= 0:
+            raise ValueError(f"Decision history capacity must be positive, got {capacity}")
+        keep = min(len(self), capacity)
+        retained = [self.column(name, keep).copy() for name in (
+            'decision_vectors', 'confidence_scores', 'consciousness', 'consciousness_sequence',
+            'decision_latency_us', 'timestamp', 'flags', 'context_hash', 'context_features'
+        )]
+        self._allocate(capacity)
+        for column, value in zip(self._columns(), retained):
+            column[:keep] = value
+        self.count = keep
+    
+    def clear(self):
+        """Drop all stored decisions"""
+        self.count = 0
+    
+    def nbytes(self) -> int:
+        """Memory held by the preallocated columns"""
+        return sum(column.nbytes for column in self._columns())
+    
+    @classmethod
+    def row_nbytes(cls) -> int:
+        """Column memory per stored decision"""
+        return cls(capacity=1).nbytes()
+
+# Journal segment layout: a 64-byte header followed by fixed-size records
+JOURNAL_MAGIC = b'GQAIJRNL'
+JOURNAL_VERSION = 1
+JOURNAL_HEADER_DTYPE = np.dtype({
+    'names': ['magic', 'version', 'record_size', 'capacity', 'count'],
+    'formats': ['S8', '<u4', '<u4', '<u8', '<u8'],
+    'offsets': [0, 8, 12, 16, 24],
+    'itemsize': 64
+})
+JOURNAL_RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('decision_latency_us', '<f8'),
+    ('consciousness_sequence', '<i8'),
+    ('consciousness', '<f4', (len(CONSCIOUSNESS_FIELDS),)),
+    ('decision_vector', '<f4', (16,)),
+    ('confidence_scores', '<f4', (16,)),
+    ('context_hash', 'S16'),
+    ('context_features', '<i4'),
+    ('flags', 'u1')
+], align=True)
+
+def write_decision_record(record: np.void, decision: RealAIDecision, context_features: int):
+    """Store a decision into one JOURNAL_RECORD_DTYPE record"""
+    state = decision.consciousness_state
+    record['timestamp'] = decision.timestamp
+    record['decision_latency_us'] = decision.decision_latency_us
+    record['consciousness_sequence'] = state.sequence
+    record['consciousness'] = [getattr(state, name) for name in CONSCIOUSNESS_FIELDS]
+    record['decision_vector'] = decision.decision_vector
+    record['confidence_scores'] = decision.confidence_scores
+    record['context_hash'] = decision.context_hash
+    record['context_features'] = context_features
+    record['flags'] = (
+        (DecisionHistory.SAFETY_VALIDATED if decision.safety_validated else 0) |
+        (DecisionHistory.ETHICS_VALIDATED if decision.ethics_validated else 0) |
+        (DecisionHistory.REAL_TIME_COMPLIANT if decision.real_time_compliant else 0)
+    )
+
+def read_decision_record(record: np.void,
+                         trace_builder: Optional[Callable[[int, np.ndarray, ConsciousnessState], Sequence[str]]] = None
+                         ) -> RealAIDecision:
+    """Materialize a RealAIDecision from one JOURNAL_RECORD_DTYPE record"""
+    state = ConsciousnessState(
+        *(float(v) for v in record['consciousness']),
+        sequence=int(record['consciousness_sequence'])
+    )
+    decision_vector, confidence_scores = _frozen_outputs(record['decision_vector'], record['confidence_scores'])
+    flags = int(record['flags'])
+    return RealAIDecision(
+        decision_vector=decision_vector,
+        confidence_scores=confidence_scores,
+        reasoning_trace=(
+            trace_builder(int(record['context_features']), decision_vector, state)
+            if trace_builder else []
+        ),
+        consciousness_state=state,
+        safety_validated=bool(flags & DecisionHistory.SAFETY_VALIDATED),
+        ethics_validated=bool(flags & DecisionHistory.ETHICS_VALIDATED),
+        real_time_compliant=bool(flags & DecisionHistory.REAL_TIME_COMPLIANT),
+        decision_latency_us=float(record['decision_latency_us']),
+        context_hash=record['context_hash'].decode('ascii'),
+        timestamp=float(record['timestamp'])
+    )
+
+class DecisionJournal:
+    """Append-only, memory-mapped journal of every decision; flush() commits appended records"""
+    
+    SEGMENT_PREFIX = 'decisions-'
+    SEGMENT_SUFFIX = '.journal'
+    
+    def __init__(self, directory: str, segment_records: int = 65536, flush_records: int = 1024):
+        if segment_records <= 0:
+            raise ValueError(f"Journal segment size must be positive, got {segment_records}")
+        
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_records = segment_records
+        self.flush_records = max(1, flush_records)
+        
+        # Never append to segments from an earlier run
+        existing = DecisionJournalReader(directory).segment_indices()
+        self.segment_index = existing[-1] + 1 if existing else 0
+        
+        self.count = 0  # Records written by this journal
+        self._map = None
+        self._retired = []  # Rotated segment maps awaiting their final sync
+        self._lock = threading.Lock()  # Appends and flushes run on different threads
+        self._open_segment()
+    
+    def _segment_path(self, index: int) -> Path:
+        return self.directory / f"{self.SEGMENT_PREFIX}{index:08d}{self.SEGMENT_SUFFIX}"
+    
+    def _open_segment(self):
+        size = JOURNAL_HEADER_DTYPE.itemsize + self.segment_records * JOURNAL_RECORD_DTYPE.itemsize
+        self._map = np.memmap(self._segment_path(self.segment_index), dtype=np.uint8, mode='w+', shape=(size,))
+        self._header = self._map[:JOURNAL_HEADER_DTYPE.itemsize].view(JOURNAL_HEADER_DTYPE)
+        self._records = self._map[JOURNAL_HEADER_DTYPE.itemsize:].view(JOURNAL_RECORD_DTYPE)
+        
+        header = self._header[0]
+        header['magic'] = JOURNAL_MAGIC
+        header['version'] = JOURNAL_VERSION
+        header['record_size'] = JOURNAL_RECORD_DTYPE.itemsize
+        header['capacity'] = self.segment_records
+        header['count'] = 0
+        
+        self._position = 0   # Next record slot in this segment
+        self._committed = 0  # Records published in the header
+        self._last_flush = time.monotonic()
+    
+    def _rotate(self):
+        with self._lock:
+            self._header[0]['count'] = self._position
+            self._retired.append(self._map)
+            self.segment_index += 1
+            self._open_segment()
+    
+    def append(self, decision: RealAIDecision, context_features: int):
+        """Journal one decision"""
+        if self._position == self.segment_records:
+            self._rotate()
+        
+        write_decision_record(self._records[self._position], decision, context_features)
+        self._advance(1)
+    
+    def append_batch(self, batch: RealAIDecisionBatch):
+        """Journal a whole batch with vectorized field writes, rotating as needed"""
+        batch_size = len(batch)
+        state = batch.consciousness_state
+        consciousness = [getattr(state, name) for name in CONSCIOUSNESS_FIELDS]
+        flags = (
+            batch.safety_validated.astype(np.uint8) * DecisionHistory.SAFETY_VALIDATED |
+            batch.ethics_validated.astype(np.uint8) * DecisionHistory.ETHICS_VALIDATED |
+            batch.real_time_compliant.astype(np.uint8) * DecisionHistory.REAL_TIME_COMPLIANT
+        )
+        context_hashes = np.array(batch.context_hashes, dtype='S16')
+        
+        start = 0
+        while start < batch_size:
+            if self._position == self.segment_records:
+                self._rotate()
+            n = min(batch_size - start, self.segment_records - self._position)
+            rows = slice(start, start + n)
+            records = self._records[self._position:self._position + n]
+            
+            records['timestamp'] = batch.timestamp
+            records['decision_latency_us'] = batch.decision_latency_us[rows]
+            records['consciousness_sequence'] = state.sequence
+            records['consciousness'] = consciousness
+            records['decision_vector'] = batch.decision_vectors[rows]
+            records['confidence_scores'] = batch.confidence_scores[rows]
+            records['context_hash'] = context_hashes[rows]
+            records['context_features'] = batch.contexts.shape[1]
+            records['flags'] = flags[rows]
+            
+            self._advance(n)
+            start += n
+    
+    def _advance(self, n: int):
+        self._position += n
+        self.count += n
+    
+    def flush_due(self, interval_s: float) -> bool:
+        """Whether flush_records records are pending, the last flush is older
+        than interval_s with records pending, or a rotated segment needs syncing"""
+        pending = self._position - self._committed
+        return bool(
+            self._retired or pending >= self.flush_records or
+            (pending and time.monotonic() - self._last_flush >= interval_s)
+        )
+    
+    def flush(self):
+        """Publish written records in the header and sync segments to disk (blocking)"""
+        with self._lock:
+            retired, self._retired = self._retired, []
+            active = self._map
+            if active is not None:
+                self._header[0]['count'] = self._position
+                self._committed = self._position
+        
+        for segment in retired:
+            segment.flush()
+        if active is not None:
+            active.flush()
+        self._last_flush = time.monotonic()
+    
+    def flush_if_due(self, interval_s: float):
+        """Flush on the calling thread if flush_due(interval_s)"""
+        if self.flush_due(interval_s):
+            self.flush()
+    
+    def close(self):
+        """Flush and release the active segment; it is unmapped once unreferenced"""
+        if self._map is None:
+            return
+        self.flush()
+        self._map = self._header = self._records = None
+
+class DecisionJournalReader:
+    """Memory-maps journal segments back as NumPy structured arrays
+    
+    Each segment is exposed as a read-only JOURNAL_RECORD_DTYPE array of its
+    committed records, so offline analysis can slice columns directly
+    (records['decision_latency_us'], records['decision_vector'], ...).
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+    
+    def segment_indices(self) -> List[int]:
+        """Indices of the segments on disk, oldest first"""
+        prefix, suffix = DecisionJournal.SEGMENT_PREFIX, DecisionJournal.SEGMENT_SUFFIX
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            int(path.name[len(prefix):-len(suffix)])
+            for path in self.directory.glob(f"{prefix}*{suffix}")
+        )
+    
+    def segments(self) -> List[Path]:
+        """Segment paths on disk, oldest first"""
+        return [
+            self.directory / f"{DecisionJournal.SEGMENT_PREFIX}{index:08d}{DecisionJournal.SEGMENT_SUFFIX}"
+            for index in self.segment_indices()
+        ]
+    
+    def read_segment(self, path) -> np.ndarray:
+        """Committed records of one segment as a read-only memory-mapped array"""
+        raw = np.memmap(path, dtype=np.uint8, mode='r')
+        header = raw[:JOURNAL_HEADER_DTYPE.itemsize].view(JOURNAL_HEADER_DTYPE)[0]
+        if header['magic'] != JOURNAL_MAGIC:
+            raise RuntimeError(f"Not a decision journal segment: {path}")
+        if header['version'] != JOURNAL_VERSION or header['record_size'] != JOURNAL_RECORD_DTYPE.itemsize:
+            raise RuntimeError(
+                f"Unsupported journal segment {path}: version {header['version']}, "
+                f"record size {header['record_size']}"
+            )
+        records = raw[JOURNAL_HEADER_DTYPE.itemsize:].view(JOURNAL_RECORD_DTYPE)
+        return records[:int(header['count'])]
+    
+    def __iter__(self):
+        for path in self.segments():
+            yield self.read_segment(path)
+    
+    def records(self) -> np.ndarray:
+        """All committed records, concatenated into one in-memory array"""
+        segments = list(self)
+        if not segments:
+            return np.zeros(0, dtype=JOURNAL_RECORD_DTYPE)
+        return np.concatenate(segments)
+    
+    def replay(self, trace_builder: Optional[Callable[[int, np.ndarray, ConsciousnessState], Sequence[str]]] = None):
+        """Yield journaled decisions as RealAIDecision records, oldest first"""
+        for segment in self:
+            for record in segment:
+                yield read_decision_record(record, trace_builder)
+
+class PerformanceTuner:
+    """Applies the 'performance' config: thread placement, priority and memory budget"""
+    
+    ROLES = ('decision', 'executor', 'monitor')
+    PRIORITY_ROLES = ('decision', 'executor')
+    
+    # Approximate per-item cost including Python object overhead
+    CACHE_ENTRY_NBYTES = 400
+    TRACE_EVENT_NBYTES = 200
+    # Split of the memory left after fixed allocations
+    BUDGET_SHARES = {'history': 0.5, 'cache': 0.25, 'tracing': 0.25}
+    
+    def __init__(self, performance: Dict[str, Any]):
+        self.logger = logging.getLogger(__name__)
+        self.cpu_affinity = list(performance.get('cpu_affinity') or [])
+        self.thread_affinity = dict(performance.get('thread_affinity') or {})
+        self.real_time_priority = bool(performance.get('real_time_priority', False))
+        self.priority_level = int(performance.get('real_time_priority_level', 10))
+        self.nice_fallback = int(performance.get('nice_fallback', -10))
+        memory_limit_mb = performance.get('memory_limit_mb')
+        self.memory_limit_bytes = int(memory_limit_mb * 1024 * 1024) if memory_limit_mb else None
+        
+        # Cores this process may use, captured before any thread is pinned
+        self._allowed_cores = set(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else set()
+        self._lock = threading.Lock()
+        self.report: Dict[str, Any] = {'threads': {}, 'memory': {}}
+        self.caps: Dict[str, int] = {}
+    
+    def configure_thread(self, role: str):
+        """Pin and prioritize the calling thread for its role; never raises"""
+        try:
+            applied = {'cores': self._pin_current_thread(role)}
+            if self.real_time_priority and (role in self.PRIORITY_ROLES
+                                            or self._shares_priority_cores(role)):
+                applied['priority'] = self._raise_priority()
+        except Exception as e:
+            applied = {'error': str(e)}
+        
+        with self._lock:
+            first = role not in self.report['threads']
+            self.report['threads'][role] = applied
+        if first:
+            self.logger.info(f"Thread placement for {role}: {applied}")
+    
+    def save_thread_placement(self) -> Dict[str, Any]:
+        """Calling thread's affinity and scheduling, for restore_thread_placement()"""
+        saved = {}
+        if hasattr(os, 'sched_getaffinity'):
+            saved['cores'] = os.sched_getaffinity(0)
+        if hasattr(os, 'sched_getscheduler'):
+            saved['scheduler'] = (os.sched_getscheduler(0), os.sched_getparam(0))
+        if hasattr(os, 'getpriority'):
+            saved['nice'] = os.getpriority(os.PRIO_PROCESS, threading.get_native_id())
+        return saved
+    
+    def restore_thread_placement(self, saved: Dict[str, Any]):
+        """Undo configure_thread() on the calling thread; never raises"""
+        restores = {
+            'cores': lambda cores: os.sched_setaffinity(0, cores),
+            'scheduler': lambda scheduler: os.sched_setscheduler(0, *scheduler),
+            'nice': lambda nice: os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), nice)
+        }
+        for name, value in saved.items():
+            try:
+                restores[name](value)
+            except OSError as e:
+                self.logger.warning(f"Could not restore thread {name}: {e}")
+    
+    def role_cores(self, role: str) -> List[int]:
+        """Cores requested for a role; empty means unpinned"""
+        if self.thread_affinity.get(role):
+            return list(self.thread_affinity[role])
+        
+        cores = self._available_cores(self.cpu_affinity)
+        if len(cores) < 2:
+            return list(self.cpu_affinity)
+        return cores[-1:] if role == 'monitor' else cores[:-1]
+    
+    def confine_to_worker(self, worker_id: int, worker_count: int):
+        """Restrict placement and memory to pool worker worker_id's share
+        
+        Workers get disjoint slices of cpu_affinity and ignore
+        thread_affinity, which describes a single process. With fewer cores
+        than workers there is no disjoint split, so the worker neither pins
+        nor requests real-time priority rather than stacking SCHED_FIFO
+        threads on shared cores. memory_limit_mb is split evenly; call this
+        before plan_memory().
+        """
+        if self.memory_limit_bytes is not None:
+            self.memory_limit_bytes //= worker_count
+        cores = self._available_cores(self.cpu_affinity)
+        self.thread_affinity = {}
+        if worker_count > 1 and len(cores) < worker_count:
+            if self.cpu_affinity or self.real_time_priority:
+                self.logger.warning(f"{len(cores)} cores for {worker_count} pool workers; "
+                                    f"worker {worker_id} runs unpinned at default priority")
+            self.cpu_affinity = []
+            self.real_time_priority = False
+        else:
+            self.cpu_affinity = cores[worker_id * len(cores) // worker_count:
+                                      (worker_id + 1) * len(cores) // worker_count]
+        self.report['worker'] = {'id': worker_id, 'cores': self.cpu_affinity,
+                                 'memory_limit_bytes': self.memory_limit_bytes}
+    
+    def _available_cores(self, requested: List[int]) -> List[int]:
+        return [core for core in dict.fromkeys(requested)
+                if not self._allowed_cores or core in self._allowed_cores]
+    
+    def _shares_priority_cores(self, role: str) -> bool:
+        cores = set(self.role_cores(role))
+        for other in self.PRIORITY_ROLES:
+            other_cores = set(self.role_cores(other))
+            if not cores or not other_cores or cores & other_cores:
+                return True
+        return False
+    
+    def _pin_current_thread(self, role: str) -> Optional[List[int]]:
+        requested = self.role_cores(role)
+        if not requested or not hasattr(os, 'sched_setaffinity'):
+            return None
+        
+        cores = sorted(set(requested) & self._allowed_cores)
+        if not cores:
+            self.logger.warning(f"None of the cores {requested} for {role} are available; not pinning")
+            return None
+        try:
+            os.sched_setaffinity(0, cores)  # 0 is the calling thread on Linux
+        except OSError as e:
+            self.logger.warning(f"Could not pin {role} thread to {cores}: {e}")
+            return None
+        return cores
+    
+    def _raise_priority(self) -> str:
+        """Best scheduling the process is permitted: SCHED_FIFO, then nice, else default"""
+        if hasattr(os, 'sched_setscheduler') and hasattr(os, 'SCHED_FIFO'):
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.priority_level))
+                return f"SCHED_FIFO:{self.priority_level}"
+            except OSError:
+                pass
+        if hasattr(os, 'setpriority'):
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.nice_fallback)
+                return f"nice:{self.nice_fallback}"
+            except OSError:
+                pass
+        return 'default'
+    
+    def plan_memory(self, requested: Dict[str, int], fixed_bytes: int) -> Dict[str, int]:
+        """Fit requested store sizes (entries) into the memory budget
+        
+        Stores that are not in use (requested 0) give their share to the
+        others. The resulting caps also bound later resizes.
+        """
+        unit_bytes = {
+            'history': DecisionHistory.row_nbytes(),
+            'cache': self.CACHE_ENTRY_NBYTES,
+            'tracing': self.TRACE_EVENT_NBYTES
+        }
+        if self.memory_limit_bytes is None:
+            self.caps = {}
+            return dict(requested)
+        
+        available = self.memory_limit_bytes - fixed_bytes
+        if available <= 0:
+            self.logger.warning(
+                f"memory_limit_mb leaves no room after {fixed_bytes} fixed bytes; using minimum sizes"
+            )
+            available = 0
+        
+        active = [name for name, count in requested.items() if count > 0]
+        share_total = sum(self.BUDGET_SHARES[name] for name in active) or 1.0
+        applied = {}
+        for name, count in requested.items():
+            cap = max(1, int(available * self.BUDGET_SHARES[name] / share_total) // unit_bytes[name])
+            self.caps[name] = cap
+            applied[name] = min(count, cap) if count > 0 else 0
+            if applied[name] < count:
+                self.logger.warning(f"Memory budget limits {name} to {applied[name]} entries (requested {count})")
+        
+        self.report['memory'] = {
+            'limit_bytes': self.memory_limit_bytes,
+            'fixed_bytes': fixed_bytes,
+            **{
+                name: {'requested': requested[name], 'applied': applied[name],
+                       'bytes': applied[name] * unit_bytes[name]}
+                for name in requested
+            }
+        }
+        return applied
+    
+    def fit_to_cap(self, name: str, count: int) -> int:
+        """Clamp a later resize of a budgeted store to its cap"""
+        cap = self.caps.get(name)
+        if cap is not None and count > cap:
+            self.logger.warning(f"Memory budget limits {name} to {cap} entries (requested {count})")
+            return cap
+        return count
+    
+    @staticmethod
+    def resident_bytes() -> Optional[int]:
+        """Current resident set size, where /proc is available"""
+        try:
+            with open('/proc/self/statm', 'r') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            return None
+
+# Config keys that only take effect on restart; reloads report changes to them
+RESTART_REQUIRED_KEYS = {
+    'real_ai': ('inference_backend', 'core_library', 'embodied_library', 'reference_seed',
+                'decision_cache_enabled', 'decision_cache_size', 'decision_cache_ttl_s',
+                'adaptation_queue_enabled', 'adaptation_queue_capacity', 'adaptation_batch_size',
+                'adaptation_flush_interval_s'),
+    'performance': ('native_offload', 'native_max_in_flight', 'native_reentrant',
+                    'tracing_mode', 'tracing_sample_rate', 'tracing_max_events',
+                    'cpu_affinity', 'thread_affinity', 'real_time_priority',
+                    'real_time_priority_level', 'nice_fallback', 'memory_limit_mb'),
+    'journal': ('enabled', 'directory', 'segment_records', 'flush_records'),
+    'admission': ('enabled', 'max_concurrent', 'degrade_queue_depth', 'shed_queue_depth'),
+    'integration': ('gaia_air_enabled', 'ampel360_enabled', 'interfaces', 'simulated')
+}
+
+# decision_stream() backlog handling: 'skip' drops only expired contexts,
+# 'latest' also coalesces a backlog to its newest context
+STREAM_POLICIES = ('skip', 'latest')
+
+class DecisionStream:
+    """Async iterator returned by decision_stream(), with its own drop counts
+    
+    expired, coalesced and rejected count this stream's dropped contexts;
+    RealAIMetrics holds the totals over all streams. Use it as an async
+    context manager (or call aclose()) so leaving the loop early stops the
+    pipeline stages at once instead of when the stream is collected.
+    """
+    
+    def __init__(self):
+        self.expired = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self._decisions = None
+    
+    @property
+    def dropped(self) -> int:
+        return self.expired + self.coalesced + self.rejected
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        return await self._decisions.__anext__()
+    
+    async def aclose(self):
+        await self._decisions.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+@dataclass(frozen=True)
+class RealAISettings:
+    """Flat, validated snapshot of the hot-path settings
+    
+    Compiled from a config dict and swapped as a whole on reload; readers
+    take one reference per decision or tick, so they never see a mix of
+    old and new values.
+    """
+    decision_latency_target_us: float
+    batch_latency_target_us: float
+    consciousness_threshold: float
+    adaptation_strength: float
+    safety_validation: bool
+    ethics_validation: bool
+    health_window_s: float
+    real_time_compliance_threshold: float
+    safety_compliance_threshold: float
+    config_watch_interval_s: float
+    journal_flush_interval_s: float
+    stream_deadline_us: float
+    stream_policy: str
+    stream_queue_size: int
+    admission_deadline_factor: float
+    admission_deadline_percentile: float
+    
+    @classmethod
+    def compile(cls, config: Dict[str, Any]) -> 'RealAISettings':
+        """Validate a config dict and compile it; raises ValueError if invalid"""
+        if not isinstance(config.get('real_ai'), dict):
+            raise ValueError("Config is missing the 'real_ai' section")
+        
+        defaults = DEFAULT_CONFIG['real_ai']
+        real_ai = {**defaults, **config['real_ai']}
+        journal = {**DEFAULT_CONFIG['journal'], **config.get('journal', {})}
+        admission = {**DEFAULT_CONFIG['admission'], **config.get('admission', {})}
+        
+        try:
+            settings = cls(
+                decision_latency_target_us=float(real_ai['decision_latency_target_us']),
+                batch_latency_target_us=float(
+                    real_ai['batch_latency_target_us'] or real_ai['decision_latency_target_us']
+                ),
+                consciousness_threshold=float(real_ai['consciousness_threshold']),
+                adaptation_strength=float(real_ai['adaptation_strength']),
+                safety_validation=bool(real_ai['safety_validation']),
+                ethics_validation=bool(real_ai['ethics_validation']),
+                health_window_s=float(real_ai['health_window_s']),
+                real_time_compliance_threshold=float(real_ai['real_time_compliance_threshold']),
+                safety_compliance_threshold=float(real_ai['safety_compliance_threshold']),
+                config_watch_interval_s=float(real_ai['config_watch_interval_s']),
+                journal_flush_interval_s=float(journal['flush_interval_s']),
+                stream_deadline_us=(
+                    float(real_ai['decision_latency_target_us']) * float(real_ai['stream_staleness_factor'])
+                ),
+                stream_policy=real_ai['stream_policy'],
+                stream_queue_size=int(real_ai['stream_queue_size']),
+                admission_deadline_factor=float(admission['deadline_factor']),
+                admission_deadline_percentile=float(admission['deadline_percentile'])
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid real_ai setting: {e}")
+        
+        if settings.decision_latency_target_us <= 0:
+            raise ValueError(f"decision_latency_target_us must be positive, got {settings.decision_latency_target_us}")
+        if settings.batch_latency_target_us <= 0:
+            raise ValueError(f"batch_latency_target_us must be positive, got {settings.batch_latency_target_us}")
+        if settings.adaptation_strength < 0:
+            raise ValueError(f"adaptation_strength must be non-negative, got {settings.adaptation_strength}")
+        if settings.stream_deadline_us <= 0:
+            raise ValueError(f"stream_staleness_factor must be positive, got {real_ai['stream_staleness_factor']}")
+        if settings.admission_deadline_factor <= 0:
+            raise ValueError(f"admission deadline_factor must be positive, got {settings.admission_deadline_factor}")
+        if not 0 < settings.admission_deadline_percentile <= 100:
+            raise ValueError(
+                f"admission deadline_percentile must be in (0, 100], got {settings.admission_deadline_percentile}"
+            )
+        if real_ai['stream_policy'] not in STREAM_POLICIES:
+            raise ValueError(f"Unknown stream_policy '{real_ai['stream_policy']}', expected one of {STREAM_POLICIES}")
+        if settings.stream_queue_size <= 0:
+            raise ValueError(f"stream_queue_size must be positive, got {settings.stream_queue_size}")
+        if settings.health_window_s <= 0 or settings.journal_flush_interval_s <= 0:
+            raise ValueError("health_window_s and journal flush_interval_s must be positive")
+        if settings.config_watch_interval_s < 0:
+            raise ValueError(f"config_watch_interval_s must be non-negative, got {settings.config_watch_interval_s}")
+        for name in ('consciousness_threshold', 'real_time_compliance_threshold', 'safety_compliance_threshold'):
+            if not 0.0 <= getattr(settings, name) <= 1.0:
+                raise ValueError(f"{name} must be within [0, 1], got {getattr(settings, name)}")
+        
+        return settings
+
+class IntegrationTelemetry:
+    """Cached view of values pushed by the integration interfaces
+    
+    Interfaces publish per-field updates; each replaces the field's
+    (value, monotonic time) entry with a single reference store, so readers
+    neither await nor lock. Every field has a max-staleness bound, and a
+    read of a field older than its bound returns the caller's default and
+    is counted as stale.
+    """
+    
+    def __init__(self,
+                 max_staleness_s: Optional[Dict[str, float]] = None,
+                 default_max_staleness_s: float = 1.0):
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+        self.updates = 0
+        self.stale_reads = 0
+        self.set_bounds(max_staleness_s, default_max_staleness_s)
+    
+    @staticmethod
+    def compile_bounds(integration: Dict[str, Any]) -> Tuple[Dict[str, float], float]:
+        """Validated (per-field bounds, default bound) from an 'integration' config section"""
+        try:
+            default = float(integration.get('default_max_staleness_s', 1.0))
+            bounds = {field: float(bound) for field, bound in integration.get('max_staleness_s', {}).items()}
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid telemetry staleness bound: {e}")
+        if default <= 0 or any(bound <= 0 for bound in bounds.values()):
+            raise ValueError("Telemetry staleness bounds must be positive")
+        return bounds, default
+    
+    def set_bounds(self, max_staleness_s: Optional[Dict[str, float]], default_max_staleness_s: float):
+        bounds, default = self.compile_bounds({
+            'max_staleness_s': max_staleness_s or {},
+            'default_max_staleness_s': default_max_staleness_s
+        })
+        self.max_staleness_s = bounds
+        self.default_max_staleness_s = default
+    
+    def bound(self, field: str) -> float:
+        """Max staleness of a field, in seconds"""
+        return self.max_staleness_s.get(field, self.default_max_staleness_s)
+    
+    def publish(self, field: str, value: Any, timestamp: Optional[float] = None):
+        """Store a field update (timestamp is time.monotonic(), default now)"""
+        self._entries[field] = (value, time.monotonic() if timestamp is None else timestamp)
+        self.updates += 1
+    
+    def publisher(self, source: str) -> Callable[[str, Any], None]:
+        """Subscriber callback publishing an interface's fields as 'source.field'"""
+        def publish(field: str, value: Any, timestamp: Optional[float] = None):
+            self.publish(f"{source}.{field}", value, timestamp)
+        return publish
+    
+    def age(self, field: str) -> float:
+        """Seconds since the field was last published (inf if never)"""
+        entry = self._entries.get(field)
+        return math.inf if entry is None else time.monotonic() - entry[1]
+    
+    def get(self, field: str, default: Any = None) -> Any:
+        """Cached value if within its staleness bound, else default"""
+        entry = self._entries.get(field)
+        if entry is None or time.monotonic() - entry[1] > self.bound(field):
+            self.stale_reads += 1
+            return default
+        return entry[0]
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Every field's cached value, age and freshness"""
+        now = time.monotonic()
+        return {
+            field: {'value': value, 'age_s': now - stamp, 'fresh': now - stamp <= self.bound(field)}
+            for field, (value, stamp) in list(self._entries.items())
+        }
+
+class SimulatedIntegrationInterface:
+    """In-process stand-in for an external integration interface
+    
+    Each field follows a bounded random walk stepped at update_rate_hz and
+    pushed to subscribers after latency_ms of simulated transport delay;
+    get_coupling_strength() answers after the same delay. Deterministic for
+    a given seed.
+    """
+    
+    # field: (initial value, random-walk step, lower bound, upper bound)
+    FIELDS: Dict[str, Tuple[float, float, float, float]] = {}
+    
+    def __init__(self, update_rate_hz: float = 50.0, latency_ms: float = 1.0, seed: int = 0):
+        if update_rate_hz <= 0 or latency_ms < 0:
+            raise ValueError("Simulated interface needs a positive update rate and non-negative latency")
+        
+        self.update_rate_hz = update_rate_hz
+        self.latency_s = latency_ms / 1000.0
+        self._rng = np.random.default_rng(seed)
+        self._names = tuple(self.FIELDS)
+        self._values = np.array([spec[0] for spec in self.FIELDS.values()])
+        self._steps = np.array([spec[1] for spec in self.FIELDS.values()])
+        self._lower = np.array([spec[2] for spec in self.FIELDS.values()])
+        self._upper = np.array([spec[3] for spec in self.FIELDS.values()])
+        self._subscribers: List[Callable[[str, Any], None]] = []
+        self._task = None
+    
+    def subscribe(self, callback: Callable[[str, Any], None]):
+        """Receive (field, value) pushes for every update"""
+        self._subscribers.append(callback)
+    
+    async def initialize(self):
+        self._deliver(self._values.copy())
+        self._task = asyncio.create_task(self._publish_loop())
+    
+    async def get_coupling_strength(self) -> float:
+        await asyncio.sleep(self.latency_s)
+        return float(self._values[self._names.index('coupling_strength')])
+    
+    async def shutdown(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    async def _publish_loop(self):
+        loop = asyncio.get_running_loop()
+        period = 1.0 / self.update_rate_hz
+        while True:
+            await asyncio.sleep(period)
+            self._values += self._rng.normal(0.0, 1.0, len(self._values)) * self._steps
+            np.clip(self._values, self._lower, self._upper, out=self._values)
+            # Updates in flight overlap instead of delaying the next tick
+            loop.call_later(self.latency_s, self._deliver, self._values.copy())
+    
+    def _deliver(self, values: np.ndarray):
+        for callback in self._subscribers:
+            for name, value in zip(self._names, values.tolist()):
+                callback(name, value)
+
+class SimulatedGAIAQAirInterface(SimulatedIntegrationInterface):
+    """Offline stand-in for GAIAQAirInterface"""
+    FIELDS = {
+        'coupling_strength': (0.9, 0.005, 0.0, 1.0),
+        'quantum_coherence': (0.92, 0.01, 0.0, 1.0)
+    }
+
+class SimulatedAMPEL360Interface(SimulatedIntegrationInterface):
+    """Offline stand-in for AMPEL360Interface"""
+    FIELDS = {
+        'coupling_strength': (0.9, 0.005, 0.0, 1.0),
+        'hydraulic_pressure_psi': (3000.0, 5.0, 2800.0, 3200.0),
+        'system_health': (0.98, 0.002, 0.0, 1.0)
+    }
+
+# Stand-ins used when integration.interfaces is 'simulated'
+SIMULATED_INTEGRATION_INTERFACES = {
+    'gaia_air': SimulatedGAIAQAirInterface,
+    'ampel360': SimulatedAMPEL360Interface
+}
+
+class FunctionalRealAI:
+    """Complete Functional Real AI System"""
+    
+    def __init__(self,
+                 config_path: str = "config/real_ai/config.json",
+                 pool_worker: Optional[Tuple[int, int]] = None):
+        """pool_worker is (worker_id, worker_count) when running inside a RealAIControllerPool"""
+        self.logger = logging.getLogger(__name__)
+        self.config_path = config_path
+        self.pool_worker = pool_worker
+        self.config = self._load_config(config_path)
+        self.settings = RealAISettings.compile(self.config)
+        self._config_stamp = self._stat_config()
+        
+        # Core components
+        self.consciousness_monitor = ConsciousnessMonitor()
+        self.safety_validator = RealAISafetyValidator(self.config.get('safety'))
+        
+        # Native library interfaces
+        self.cpp_lib = None
+        self.rust_lib = None
+        self.rust_embodied_handle = None
+        self.embodied_poll_supported = False
+        self._embodied_timestamps = None  # Scratch for reference embodied polls
+        self._load_native_libraries()
+        self.inference_backend = self._create_inference_backend()
+        
+        # System state
+        self.system_active = False
+        self.real_time_mode = True
+        self.learning_enabled = True
+        
+        # Performance tracking
+        self.metrics = RealAIMetrics(
+            consciousness_level=0.0,
+            decision_latency_us=0.0,
+            learning_velocity=0.0,
+            adaptation_success_rate=0.0,
+            safety_compliance=1.0,
+            real_time_compliance=True,
+            quantum_coherence=0.0,
+            embodiment_integrity=0.0,
+            gaia_air_coupling=0.0,
+            total_decisions=0,
+            successful_adaptations=0,
+            timestamp=time.time()
+        )
+        
+        # Integration interfaces
+        self.gaia_air_interface = None
+        self.ampel360_interface = None
+        self.telemetry = IntegrationTelemetry(
+            *IntegrationTelemetry.compile_bounds(self.config.get('integration', {}))
+        )
+        self._telemetry_tasks: List[asyncio.Task] = []
+        
+        # Wall time of each initialization phase (ms), from the last initialize_real_ai()
+        self.init_phase_ms: Dict[str, float] = {}
+        
+        # Streaming latency histogram and 1s/10s/60s sliding windows
+        self.latency_histogram = LatencyHistogram()
+        self.window_stats = WindowedDecisionStats(horizon_s=60.0)
+        
+        # Thread placement, priority and the memory budget for bounded stores
+        performance = self.config.get('performance', {})
+        self.performance_tuner = PerformanceTuner(performance)
+        if pool_worker is not None:
+            self.performance_tuner.confine_to_worker(*pool_worker)
+        self._loop_thread_placement = None  # Event loop thread's own, restored on shutdown
+        max_in_flight = performance.get('native_max_in_flight', 4)
+        executor_workers = max(4, max_in_flight)
+        
+        cache_enabled = self.config['real_ai'].get('decision_cache_enabled', False)
+        store_sizes = self.performance_tuner.plan_memory(
+            {
+                'history': 1000,
+                'cache': self.config['real_ai'].get('decision_cache_size', 4096) if cache_enabled else 0,
+                'tracing': (
+                    performance.get('tracing_max_events', 100000)
+                    if performance.get('tracing_mode', 'off') != 'off' else 0
+                )
+            },
+            fixed_bytes=(
+                self.latency_histogram.counts.nbytes +
+                self.window_stats.counters.nbytes + self.window_stats.histograms.nbytes +
+                (executor_workers + 1) * DecisionBuffers().nbytes()
+            )
+        )
+        
+        # Decision history
+        self.decision_history = DecisionHistory(
+            capacity=store_sizes['history'],
+            trace_builder=self._capture_reasoning_trace
+        )
+        
+        # Real-time executor; native calls are dispatched here in offload mode
+        self.native_offload = performance.get('native_offload', False)
+        self.executor = ThreadPoolExecutor(
+            max_workers=executor_workers,
+            initializer=self.performance_tuner.configure_thread,
+            initargs=('executor',)
+        )
+        self._native_in_flight = asyncio.Semaphore(max_in_flight)
+        
+        # Serializes calls on the inference backend unless it is re-entrant
+        self._native_lock = nullcontext() if performance.get('native_reentrant', False) else threading.Lock()
+        
+        # Pooled native I/O buffers, one set per worker thread
+        self.buffer_pool = DecisionBufferPool()
+        
+        # Per-stage span tracing (off unless configured)
+        self.tracer = DecisionTracer(
+            mode=performance.get('tracing_mode', 'off'),
+            sample_rate=performance.get('tracing_sample_rate', 0.01),
+            max_events=max(1, store_sizes['tracing'])
+        )
+        
+        # Optional inference cache, invalidated on successful adaptation
+        self.decision_cache = None
+        if cache_enabled:
+            self.decision_cache = DecisionCache(
+                max_entries=store_sizes['cache'],
+                ttl_s=self.config['real_ai'].get('decision_cache_ttl_s')
+            )
+        
+        # Optional background adaptation pipeline fed by adapt_from_outcome()
+        self.adaptation_queue = None
+        if self.config['real_ai'].get('adaptation_queue_enabled', False):
+            self.adaptation_queue = AdaptationQueue(
+                capacity=self.config['real_ai'].get('adaptation_queue_capacity', 4096),
+                batch_size=self.config['real_ai'].get('adaptation_batch_size', 32),
+                flush_interval_s=self.config['real_ai'].get('adaptation_flush_interval_s', 0.01)
+            )
+        self._adaptation_task = None
+        self._adaptation_apply_lock = asyncio.Lock()
+        self._adaptation_ready = asyncio.Event()   # Queue is non-empty
+        self._adaptation_full = asyncio.Event()    # A full batch is waiting
+        
+        # Optional priority / deadline admission in front of make_real_ai_decision()
+        self.admission = None
+        admission = self.config.get('admission', {})
+        if admission.get('enabled', False):
+            self.admission = AdmissionController(
+                max_concurrent=admission.get('max_concurrent', 4),
+                degrade_queue_depth=admission.get('degrade_queue_depth', 8),
+                shed_queue_depth=admission.get('shed_queue_depth', 64)
+            )
+        # Default deadline budget; unbounded until a decision latency is observed
+        self.admission_deadline_us = math.inf
+        
+        # Optional append-only audit journal of every decision
+        self.decision_journal = None
+        journal = self.config.get('journal', {})
+        if journal.get('enabled', False):
+            journal_directory = Path(journal.get('directory', './journal'))
+            if pool_worker is not None:
+                # Pool workers share the config; each writes its own segments
+                journal_directory = journal_directory / f"worker-{pool_worker[0]}"
+            self.decision_journal = DecisionJournal(
+                str(journal_directory),
+                segment_records=journal.get('segment_records', 65536),
+                flush_records=journal.get('flush_records', 1024)
+            )
+        
+    @property
+    def max_history_size(self) -> int:
+        """Maximum number of decisions kept in history"""
+        return self.decision_history.capacity
+    
+    @max_history_size.setter
+    def max_history_size(self, size: int):
+        self.decision_history.resize(self.performance_tuner.fit_to_cap('history', size))
+    
+    @staticmethod
+    def _load_config(path: str) -> Dict[str, Any]:
+        """Load Real AI configuration"""
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return copy.deepcopy(DEFAULT_CONFIG)
+    
+    def _load_native_libraries(self):
+        """Load C++ and Rust native libraries"""
+        real_ai_config = self.config['real_ai']
+        
+        # Load C++ Real AI Core unless the reference backend is forced
+        if real_ai_config.get('inference_backend', 'auto') != 'reference':
+            try:
+                self.cpp_lib = ctypes.CDLL(real_ai_config.get('core_library', './lib/libgaia_real_ai_core.so'))
+                self.logger.info("C++ Real AI core loaded")
+            except Exception as e:
+                self.logger.error(f"Failed to load C++ Real AI core: {e}")
+        
+        try:
+            # Load Rust Embodied Intelligence
+            self.rust_lib = ctypes.CDLL(real_ai_config.get('embodied_library', './lib/libreal_ai_embodied.so'))
+            self._setup_rust_bindings()
+            self.logger.info("Rust embodied intelligence loaded")
+        except Exception as e:
+            self.rust_lib = None
+            self.logger.error(f"Failed to load Rust embodied intelligence: {e}")
+    
+    def _create_inference_backend(self) -> Optional[InferenceBackend]:
+        """Select the inference backend named by real_ai.inference_backend
+        
+        'native' requires the C++ core, 'reference' always uses the NumPy
+        engine, and 'auto' prefers native and falls back to reference.
+        """
+        backend = self.config['real_ai'].get('inference_backend', 'auto')
+        
+        if backend in ('native', 'auto') and self.cpp_lib is not None:
+            try:
+                return NativeInferenceBackend(self.cpp_lib)
+            except Exception as e:
+                self.logger.error(f"Failed to bind C++ Real AI core: {e}")
+        
+        if backend in ('reference', 'auto'):
+            if backend == 'auto':
+                self.logger.warning("C++ Real AI core unavailable, using NumPy reference backend")
+            return ReferenceInferenceBackend(seed=self.config['real_ai'].get('reference_seed', 0))
+        
+        self.logger.error(f"Inference backend '{backend}' unavailable")
+        return None
+    
+    def _setup_rust_bindings(self):
+        """Setup Rust library bindings"""
+        # Rust Embodied Intelligence function signatures
+        self.rust_lib.real_ai_embodied_create.restype = ctypes.c_void_p
+        self.rust_lib.real_ai_embodied_create.argtypes = []
+        
+        self.rust_lib.real_ai_embodied_initialize.restype = ctypes.c_bool
+        self.rust_lib.real_ai_embodied_initialize.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        
+        self.CEmbodiedState = CEmbodiedState
+        
+        # Optional bulk poll: writes up to capacity snapshots, oldest first,
+        # and returns how many were written
+        self.embodied_poll_supported = hasattr(self.rust_lib, 'real_ai_embodied_poll_states')
+        if self.embodied_poll_supported:
+            self.rust_lib.real_ai_embodied_poll_states.restype = ctypes.c_size_t
+            self.rust_lib.real_ai_embodied_poll_states.argtypes = [
+                ctypes.c_void_p, ctypes.POINTER(CEmbodiedState), ctypes.c_size_t
+            ]
+    
+    async def initialize_real_ai(self) -> bool:
+        """Initialize the complete Real AI system
+        
+        Independent phases run concurrently: native initialization in worker
+        threads and the enabled integration interfaces as gathered coroutines.
+        If any phase fails, everything already brought up is rolled back.
+        Per-phase wall times are kept in init_phase_ms.
+        """
+        self.logger.info("🧠 Initializing Functional Real AI System...")
+        init_start = time.perf_counter()
+        self.init_phase_ms = {}
+        
+        try:
+            # Pin the event loop (decision) thread before anything else starts
+            await self._run_init_phase('thread_placement', self._init_thread_placement())
+            
+            # Consciousness monitoring warms up while the other phases run
+            await self._run_init_phase('consciousness_monitor', self._init_consciousness_monitor())
+            
+            loop = asyncio.get_running_loop()
+            phases = [
+                self._run_init_phase(
+                    'inference_backend', loop.run_in_executor(self.executor, self._init_inference_backend)
+                ),
+                self._run_init_phase(
+                    'embodied_intelligence', loop.run_in_executor(self.executor, self._init_embodied_intelligence)
+                )
+            ]
+            if self.config['integration']['gaia_air_enabled']:
+                phases.append(self._run_init_phase('gaia_air', self._init_integration('gaia_air')))
+            if self.config['integration']['ampel360_enabled']:
+                phases.append(self._run_init_phase('ampel360', self._init_integration('ampel360')))
+            
+            # Let every phase settle before deciding, so rollback sees final state
+            results = await asyncio.gather(*phases, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            
+            # Real-time processing needs every subsystem up
+            await self._run_init_phase('real_time_processing', self._start_real_time_processing())
+            
+            self.system_active = True
+            total_ms = (time.perf_counter() - init_start) * 1e3
+            self.logger.info(f"🚀 Functional Real AI System OPERATIONAL in {total_ms:.1f}ms")
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Real AI initialization failed: {e}")
+            await self._rollback_initialization()
+            return False
+    
+    async def _run_init_phase(self, name: str, awaitable) -> None:
+        """Await one initialization phase and record its wall time"""
+        phase_start = time.perf_counter()
+        try:
+            await awaitable
+        finally:
+            self.init_phase_ms[name] = (time.perf_counter() - phase_start) * 1e3
+        self.logger.info(f"✓ {name} initialized in {self.init_phase_ms[name]:.1f}ms")
+    
+    async def _init_thread_placement(self):
+        if self._loop_thread_placement is None:
+            self._loop_thread_placement = self.performance_tuner.save_thread_placement()
+        self.performance_tuner.configure_thread('decision')
+    
+    def _restore_loop_thread_placement(self):
+        if self._loop_thread_placement is not None:
+            self.performance_tuner.restore_thread_placement(self._loop_thread_placement)
+            self._loop_thread_placement = None
+    
+    async def _init_consciousness_monitor(self):
+        self.consciousness_monitor.start_monitoring(
+            thread_setup=lambda: self.performance_tuner.configure_thread('monitor')
+        )
+    
+    def _init_inference_backend(self):
+        """Create and initialize the inference backend (runs in a worker thread)"""
+        backend = self.inference_backend
+        if backend is None:
+            raise RuntimeError("No inference backend available")
+        
+        if not backend.create():
+            raise RuntimeError(f"Failed to create {backend.name} inference handle")
+        
+        if not backend.initialize(self.config):
+            raise RuntimeError(f"Failed to initialize {backend.name} inference backend")
+    
+    def _init_embodied_intelligence(self):
+        """Create and initialize Rust embodied intelligence (runs in a worker thread)"""
+        if self.rust_lib is None:
+            self.logger.warning("Rust embodied intelligence unavailable, continuing without it")
+            return
+        
+        config_str = json.dumps(self.config).encode('utf-8')
+        self.rust_embodied_handle = self.rust_lib.real_ai_embodied_create()
+        if not self.rust_embodied_handle:
+            raise RuntimeError("Failed to create Rust embodied handle")
+        
+        if not self.rust_lib.real_ai_embodied_initialize(self.rust_embodied_handle, config_str):
+            raise RuntimeError("Failed to initialize Rust embodied intelligence")
+    
+    async def _init_integration(self, name: str):
+        """Create and initialize one integration interface and feed its telemetry
+        
+        External interfaces are imported on demand; 'simulated' uses the
+        in-process stand-ins. Interfaces that push updates are subscribed to
+        the telemetry cache, others are polled fast enough to stay within
+        their coupling-strength staleness bound.
+        """
+        integration = self.config.get('integration', {})
+        if integration.get('interfaces', 'external') == 'simulated':
+            simulated = integration.get('simulated', {})
+            interface = SIMULATED_INTEGRATION_INTERFACES[name](
+                seed=simulated.get('seed', 0), **simulated.get(name, {})
+            )
+        else:
+            module_name, class_name = INTEGRATION_INTERFACES[name]
+            loop = asyncio.get_running_loop()
+            module = await loop.run_in_executor(self.executor, importlib.import_module, module_name)
+            interface = getattr(module, class_name)()
+        
+        setattr(self, f"{name}_interface", interface)
+        if hasattr(interface, 'subscribe'):
+            interface.subscribe(self.telemetry.publisher(name))
+        await interface.initialize()
+        if not hasattr(interface, 'subscribe'):
+            self._telemetry_tasks.append(asyncio.create_task(self._poll_integration(name, interface)))
+    
+    async def _poll_integration(self, name: str, interface):
+        """Publish a pull-only interface's coupling strength into the telemetry cache"""
+        field = f"{name}.coupling_strength"
+        while True:
+            try:
+                self.telemetry.publish(field, await interface.get_coupling_strength())
+            except Exception as e:
+                self.logger.error(f"{name} telemetry poll failed: {e}")
+            await asyncio.sleep(self.telemetry.bound(field) / 2)
+    
+    async def _stop_telemetry(self):
+        for task in self._telemetry_tasks:
+            task.cancel()
+        await asyncio.gather(*self._telemetry_tasks, return_exceptions=True)
+        self._telemetry_tasks = []
+    
+    async def _rollback_initialization(self):
+        """Tear down whatever a failed initialize_real_ai() brought up"""
+        self.system_active = False
+        if not self.consciousness_monitor.stop_monitoring():
+            self.logger.error("Consciousness sampler did not stop during rollback")
+        
+        if self.inference_backend is not None:
+            try:
+                self.inference_backend.shutdown()
+            except Exception as e:
+                self.logger.error(f"Inference backend rollback failed: {e}")
+        
+        # Note: release the Rust handle once a cleanup call is available
+        self.rust_embodied_handle = None
+        
+        await self._stop_telemetry()
+        for name in INTEGRATION_INTERFACES:
+            interface = getattr(self, f"{name}_interface")
+            if interface is None:
+                continue
+            try:
+                await interface.shutdown()
+            except Exception as e:
+                self.logger.error(f"{name} rollback failed: {e}")
+            setattr(self, f"{name}_interface", None)
+        
+        self._restore_loop_thread_placement()
+    
+    async def make_real_ai_decision(self, 
+                                  context: np.ndarray,
+                                  goal_specification: Optional[str] = None,
+                                  consciousness_requirement: float = 0.8,
+                                  priority: str = 'advisory',
+                                  deadline: Optional[float] = None) -> RealAIDecision:
+        """Make a conscious Real AI decision
+        
+        With admission control enabled, requests are served by priority class
+        and then earliest deadline (a time.monotonic() instant). The default
+        deadline is admission.deadline_factor times the recent
+        deadline_percentile decision latency from now, and unbounded until a
+        latency has been observed. Advisory requests may be shed
+        (DecisionShedError) or run degraded: answered from the decision cache
+        when possible, untraced, with an empty reasoning trace, and not kept
+        in decision_history or the journal.
+        """
+        if not self.system_active:
+            raise RuntimeError("Real AI system not active")
+        
+        # One settings snapshot for the whole decision, even across a reload
+        settings = self.settings
+        decision_start = time.perf_counter()
+        context = self._as_context_array(context)
+        
+        admission = self.admission
+        if admission is None:
+            # Stage spans are only timed for sampled decisions
+            traced = self.tracer.sample()
+            root_ns = time.perf_counter_ns() if traced else 0
+            inference = await self._decision_inference(context, consciousness_requirement, traced)
+            return self._complete_decision(context, inference, decision_start, settings, traced, root_ns)
+        
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class '{priority}', expected one of {tuple(PRIORITY_CLASSES)}")
+        priority_class = PRIORITY_CLASSES[priority]
+        if deadline is None:
+            deadline = time.monotonic() + self.admission_deadline_us / 1e6
+        
+        degraded = admission.should_degrade(priority_class)
+        if degraded:
+            # A cached answer needs no inference slot at all
+            inference = self._cached_inference(context, consciousness_requirement)
+            if inference is not None:
+                admission.degraded += 1
+                return self._complete_decision(context, inference, decision_start, settings, False, 0, degraded)
+        
+        await admission.acquire(priority_class, deadline)
+        if degraded:
+            admission.degraded += 1
+        try:
+            traced = not degraded and self.tracer.sample()
+            root_ns = time.perf_counter_ns() if traced else 0
+            inference = await self._decision_inference(context, consciousness_requirement, traced)
+            # Free the slot before completion; outputs may alias pooled buffers
+            decision_vector, confidence_scores = _frozen_outputs(inference[1], inference[2])
+            inference = (inference[0], decision_vector, confidence_scores, inference[3], inference[4])
+        finally:
+            admission.release()
+        return self._complete_decision(context, inference, decision_start, settings, traced, root_ns, degraded)
+    
+    def _cached_inference(self,
+                          context: np.ndarray,
+                          consciousness_requirement: float) -> Optional[Tuple[ConsciousnessState, np.ndarray, np.ndarray, Optional[str], int]]:
+        """_decision_inference() result served from the decision cache, or None on a miss"""
+        if self.decision_cache is None:
+            return None
+        context_hash = self._hash_context(context)
+        cached = self.decision_cache.get((context_hash, context.dtype.char, len(context)))
+        if cached is None:
+            return None
+        
+        consciousness_state = self.consciousness_monitor.get_consciousness_state()
+        if consciousness_state.awareness_level < consciousness_requirement:
+            raise InsufficientConsciousnessError(f"Insufficient consciousness: {consciousness_state.awareness_level:.3f} < {consciousness_requirement}")
+        return consciousness_state, cached[0], cached[1], context_hash, 0
+    
+    async def _decision_inference(self,
+                                  context: np.ndarray,
+                                  consciousness_requirement: float,
+                                  traced: bool) -> Tuple[ConsciousnessState, np.ndarray, np.ndarray, Optional[str], int]:
+        """First half of a decision: consciousness check, cache lookup and inference
+        
+        Returns (consciousness_state, decision_vector, confidence_scores,
+        context_hash or None, stage_ns). The outputs may alias pooled buffers
+        until frozen.
+        """
+        tracer = self.tracer
+        stage_ns = time.perf_counter_ns() if traced else 0
+        
+        # Get current consciousness state
+        consciousness_state = self.consciousness_monitor.get_consciousness_state()
+        if traced:
+            stage_ns = tracer.record('get_consciousness_state', stage_ns)
+        
+        # Check consciousness requirement
+        if consciousness_state.awareness_level < consciousness_requirement:
+            raise InsufficientConsciousnessError(f"Insufficient consciousness: {consciousness_state.awareness_level:.3f} < {consciousness_requirement}")
+        
+        # Identical contexts reuse the current model's inference result
+        context_hash = None
+        cached = None
+        if self.decision_cache is not None:
+            context_hash = self._hash_context(context)
+            cache_key = (context_hash, context.dtype.char, len(context))
+            cached = self.decision_cache.get(cache_key)
+            cache_generation = self.decision_cache.generation
+            if traced:
+                stage_ns = tracer.record('decision_cache_lookup', stage_ns, args={'hit': cached is not None})
+        
+        if cached is not None:
+            decision_vector, confidence_scores = cached
+        else:
+            # Perform neural inference
+            if self.native_offload:
+                decision_vector, confidence_scores = await self._offload_native(
+                    self._infer_detached, context, traced
+                )
+            else:
+                decision_vector, confidence_scores = self._infer_into_buffers(context, traced)
+            if traced:
+                stage_ns = time.perf_counter_ns()
+            
+            if self.decision_cache is not None:
+                self.decision_cache.put(cache_key, decision_vector, confidence_scores, cache_generation)
+        
+        return consciousness_state, decision_vector, confidence_scores, context_hash, stage_ns
+    
+    def _complete_decision(self,
+                           context: np.ndarray,
+                           inference: Tuple[ConsciousnessState, np.ndarray, np.ndarray, Optional[str], int],
+                           decision_start: float,
+                           settings: RealAISettings,
+                           traced: bool,
+                           root_ns: int,
+                           degraded: bool = False) -> RealAIDecision:
+        """Second half of a decision: trace, validation, metrics and history
+        
+        A degraded decision skips the reasoning trace, history and journal.
+        """
+        tracer = self.tracer
+        consciousness_state, decision_vector, confidence_scores, context_hash, stage_ns = inference
         
-        if not success:
-            raise RuntimeError("C++ decision making failed")
-        
         # Calculate decision latency
         decision_latency = (time.perf_counter() - decision_start) * 1e6  # μs
-        real_time_compliant = decision_latency <= self.config['real_ai']['decision_latency_target_us']
+        real_time_compliant = decision_latency <= settings.decision_latency_target_us
+        
+        # Outputs may alias pooled buffers; already-frozen pairs are not copied again
+        decision_vector, confidence_scores = _frozen_outputs(decision_vector, confidence_scores)
+        
+        # Capture reasoning trace; it renders only when read
+        reasoning_trace = (
+            [] if degraded else self._generate_reasoning_trace(context, decision_vector, consciousness_state)
+        )
+        if traced:
+            stage_ns = tracer.record('reasoning_trace', stage_ns)
         
-        # Generate reasoning trace
-        reasoning_trace = self._generate_reasoning_trace(context, decision_vector, consciousness_state)
+        if context_hash is None:
+            context_hash = self._hash_context(context)
+            if traced:
+                stage_ns = tracer.record('hash_context', stage_ns)
         
         # Create decision object
         decision = RealAIDecision(
-            decision_vector=decision_vector.tolist(),
-            confidence_scores=confidence_scores.tolist(),
+            decision_vector=decision_vector,
+            confidence_scores=confidence_scores,
             reasoning_trace=reasoning_trace,
             consciousness_state=consciousness_state,
             safety_validated=False,
             ethics_validated=False,
             real_time_compliant=real_time_compliant,
             decision_latency_us=decision_latency,
-            context_hash=self._hash_context(context),
+            context_hash=context_hash,
             timestamp=time.time()
         )
         
         # Safety and ethics validation
-        if self.config['real_ai']['safety_validation']:
+        if settings.safety_validation:
             decision.safety_validated, safety_violations = self.safety_validator.validate_decision(decision)
             if safety_violations:
                 self.logger.warning(f"Safety violations: {safety_violations}")
         
-        if self.config['real_ai']['ethics_validation']:
+        if settings.ethics_validation:
             decision.ethics_validated = decision.safety_validated  # Simplified
+        if traced:
+            stage_ns = tracer.record('validate_decision', stage_ns)
         
         # Update metrics
         self._update_metrics(decision)
+        if traced:
+            stage_ns = tracer.record('update_metrics', stage_ns)
+        
+        if degraded:
+            return decision
         
         # Store decision history
-        self.decision_history.append(decision)
-        if len(self.decision_history) > self.max_history_size:
-            self.decision_history.pop(0)
+        self.decision_history.append(decision, len(context))
+        if traced:
+            stage_ns = tracer.record('decision_history', stage_ns)
+        
+        if self.decision_journal is not None:
+            self.decision_journal.append(decision, len(context))
+            if traced:
+                tracer.record('decision_journal', stage_ns)
+        if traced:
+            tracer.record('make_real_ai_decision', root_ns, args={'latency_us': decision_latency})
         
         return decision
     
+    def decision_stream(self,
+                        source,
+                        consciousness_requirement: float = 0.8,
+                        policy: Optional[str] = None,
+                        max_pending: Optional[int] = None) -> DecisionStream:
+        """Stream decisions for an async iterator of contexts
+        
+        Items are contexts or (context, deadline) pairs, the deadline being a
+        time.monotonic() instant; without one it is arrival time plus
+        decision_latency_target_us * stream_staleness_factor. Intake,
+        inference and completion (validation, metrics, history) run as
+        overlapping stages over bounded queues. A context whose deadline has
+        passed when inference would start is dropped. With the 'latest'
+        policy a full intake queue evicts its oldest context and inference
+        jumps to the newest queued one; with 'skip' the source is
+        backpressured instead. A context that fails the consciousness
+        requirement is skipped and the stream continues. Drops are counted
+        on the returned DecisionStream and in RealAIMetrics.
+        """
+        stream = DecisionStream()
+        stream._decisions = self._stream_decisions(stream, source, consciousness_requirement, policy, max_pending)
+        return stream
+    
+    async def _stream_decisions(self,
+                                stream: DecisionStream,
+                                source,
+                                consciousness_requirement: float,
+                                policy: Optional[str],
+                                max_pending: Optional[int]):
+        """decision_stream() stages; drop counts go to stream and RealAIMetrics"""
+        if not self.system_active:
+            raise RuntimeError("Real AI system not active")
+        
+        settings = self.settings
+        policy = policy or settings.stream_policy
+        if policy not in STREAM_POLICIES:
+            raise ValueError(f"Unknown stream policy '{policy}', expected one of {STREAM_POLICIES}")
+        max_pending = max_pending or settings.stream_queue_size
+        
+        end = object()  # Stage end marker; exceptions are forwarded in-band too
+        pending = asyncio.Queue(max_pending)   # (context, deadline)
+        inferred = asyncio.Queue(max_pending)  # _complete_decision arguments
+        metrics = self.metrics
+        
+        async def intake():
+            try:
+                async for item in source:
+                    context, deadline = item if isinstance(item, tuple) else (item, None)
+                    if deadline is None:
+                        deadline = time.monotonic() + self.settings.stream_deadline_us / 1e6
+                    if policy == 'latest' and pending.full():
+                        pending.get_nowait()
+                        metrics.stream_coalesced += 1
+                        stream.coalesced += 1
+                    await pending.put((self._as_context_array(context), deadline))
+                await pending.put(end)
+            except Exception as e:
+                await pending.put(e)
+        
+        async def infer():
+            try:
+                while True:
+                    item = await pending.get()
+                    marker = None
+                    if policy == 'latest':
+                        # Coalesce the backlog to its newest context
+                        while item is not end and not isinstance(item, Exception) and not pending.empty():
+                            newer = pending.get_nowait()
+                            if newer is end or isinstance(newer, Exception):
+                                marker = newer
+                                break
+                            metrics.stream_coalesced += 1
+                            stream.coalesced += 1
+                            item = newer
+                    
+                    if item is end or isinstance(item, Exception):
+                        await inferred.put(item)
+                        return
+                    
+                    context, deadline = item
+                    if time.monotonic() > deadline:
+                        metrics.stream_expired += 1
+                        stream.expired += 1
+                    else:
+                        settings = self.settings
+                        decision_start = time.perf_counter()
+                        traced = self.tracer.sample()
+                        root_ns = time.perf_counter_ns() if traced else 0
+                        try:
+                            state, decision_vector, confidence_scores, context_hash, stage_ns = (
+                                await self._decision_inference(context, consciousness_requirement, traced)
+                            )
+                        except InsufficientConsciousnessError:
+                            metrics.stream_rejected += 1
+                            stream.rejected += 1
+                        else:
+                            # Outputs may alias the pooled buffers the next inference reuses
+                            decision_vector, confidence_scores = _frozen_outputs(decision_vector, confidence_scores)
+                            await inferred.put((
+                                context,
+                                (state, decision_vector, confidence_scores, context_hash, stage_ns),
+                                decision_start, settings, traced, root_ns
+                            ))
+                    
+                    if marker is not None:
+                        await inferred.put(marker)
+                        return
+            except Exception as e:
+                await inferred.put(e)
+        
+        stages = [asyncio.create_task(intake()), asyncio.create_task(infer())]
+        try:
+            while True:
+                item = await inferred.get()
+                if item is end:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield self._complete_decision(*item)
+        finally:
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+    
+    async def make_real_ai_decisions_batch(self,
+                                           contexts: np.ndarray,
+                                           goal_specification: Optional[str] = None,
+                                           consciousness_requirement: float = 0.8) -> RealAIDecisionBatch:
+        """Make Real AI decisions for an (N, F) matrix of contexts
+        
+        Preparation, inference, validation and metrics are done once per
+        batch; all rows share a single consciousness snapshot.
+        """
+        if not self.system_active:
+            raise RuntimeError("Real AI system not active")
+        
+        contexts = np.asarray(contexts)
+        if contexts.ndim != 2:
+            raise ValueError(f"Batch contexts must be 2-D, got shape {contexts.shape}")
+        
+        batch_size = contexts.shape[0]
+        settings = self.settings
+        decision_start = time.perf_counter()
+        
+        # One consciousness check covers the whole batch
+        consciousness_state = self.consciousness_monitor.get_consciousness_state()
+        if consciousness_state.awareness_level < consciousness_requirement:
+            raise InsufficientConsciousnessError(f"Insufficient consciousness: {consciousness_state.awareness_level:.3f} < {consciousness_requirement}")
+        
+        # Prepare contexts
+        context_matrix = self._prepare_context_batch(contexts)
+        
+        # Perform neural inference
+        decision_vectors = np.zeros((batch_size, 16), dtype=np.float32)
+        confidence_scores = np.zeros((batch_size, 16), dtype=np.float32)
+        
+        if batch_size:
+            if self.native_offload:
+                await self._offload_native(
+                    self._run_inference_batch, context_matrix, decision_vectors, confidence_scores
+                )
+            else:
+                self._run_inference_batch(context_matrix, decision_vectors, confidence_scores)
+        
+        # Amortized latency per decision; every row waits for the whole batch,
+        # so real-time compliance is judged on the batch latency
+        batch_latency = (time.perf_counter() - decision_start) * 1e6  # μs
+        per_decision_latency = batch_latency / max(batch_size, 1)
+        decision_latency = np.full(batch_size, per_decision_latency)
+        real_time_compliant = np.full(batch_size, batch_latency <= settings.batch_latency_target_us)
+        
+        # Safety and ethics validation
+        safety_validated = np.zeros(batch_size, dtype=bool)
+        violations = {}
+        if settings.safety_validation:
+            safety_validated, violations = self.safety_validator.validate_batch(
+                decision_vectors, confidence_scores, real_time_compliant, consciousness_state
+            )
+            if violations:
+                self.logger.warning(f"Safety violations in {len(violations)}/{batch_size} batch decisions")
+        
+        ethics_validated = np.zeros(batch_size, dtype=bool)
+        if settings.ethics_validation:
+            ethics_validated = safety_validated.copy()  # Simplified
+        
+        batch = RealAIDecisionBatch(
+            contexts=contexts,
+            decision_vectors=decision_vectors,
+            confidence_scores=confidence_scores,
+            consciousness_state=consciousness_state,
+            safety_validated=safety_validated,
+            ethics_validated=ethics_validated,
+            real_time_compliant=real_time_compliant,
+            decision_latency_us=decision_latency,
+            context_hashes=self._hash_context_batch(contexts),
+            violations=violations,
+            batch_latency_us=batch_latency,
+            timestamp=time.time()
+        )
+        
+        # Update metrics
+        self._update_metrics_batch(batch)
+        
+        # Store decision history
+        self.decision_history.append_batch(batch)
+        if self.decision_journal is not None:
+            self.decision_journal.append_batch(batch)
+        
+        return batch
+    
+    def expand_decision_batch(self, batch: RealAIDecisionBatch, indices=None) -> List[RealAIDecision]:
+        """Materialize per-decision records from a batch result
+        
+        Records hold read-only row views of the batch arrays, so they share
+        the batch's memory instead of copying it.
+        """
+        if indices is None:
+            indices = range(len(batch))
+        
+        decision_vectors = batch.decision_vectors.view()
+        confidence_scores = batch.confidence_scores.view()
+        decision_vectors.flags.writeable = False
+        confidence_scores.flags.writeable = False
+        
+        context_features = batch.contexts.shape[1]
+        decisions = []
+        for i in indices:
+            decision_vector = decision_vectors[i]
+            decisions.append(RealAIDecision(
+                decision_vector=decision_vector,
+                confidence_scores=confidence_scores[i],
+                reasoning_trace=self._capture_reasoning_trace(
+                    context_features, decision_vector, batch.consciousness_state
+                ),
+                consciousness_state=batch.consciousness_state,
+                safety_validated=bool(batch.safety_validated[i]),
+                ethics_validated=bool(batch.ethics_validated[i]),
+                real_time_compliant=bool(batch.real_time_compliant[i]),
+                decision_latency_us=float(batch.decision_latency_us[i]),
+                context_hash=batch.context_hashes[i],
+                timestamp=batch.timestamp
+            ))
+        
+        return decisions
+    
+    def _infer_into_buffers(self, context: np.ndarray, traced: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Run backend inference on the calling thread's pooled buffers
+        
+        The returned arrays are those buffers and are overwritten by the next
+        inference on the same thread.
+        """
+        if traced:
+            stage_ns = time.perf_counter_ns()
+        
+        # Prepare context straight into this worker's pooled buffers
+        buffers = self.buffer_pool.acquire()
+        buffers.load(context)
+        
+        decision_vector = buffers.decision_vector
+        confidence_scores = buffers.confidence_scores
+        decision_vector.fill(0.0)
+        confidence_scores.fill(0.0)
+        if traced:
+            stage_ns = self.tracer.record('prepare_context', stage_ns)
+        
+        with self._native_lock:
+            success = self.inference_backend.make_decision(buffers)
+        if traced:
+            self.tracer.record('inference', stage_ns, args={'backend': self.inference_backend.name})
+        
+        if not success:
+            raise RuntimeError(f"{self.inference_backend.name} decision making failed")
+        
+        return decision_vector, confidence_scores
+    
+    def _infer_detached(self, context: np.ndarray, traced: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Run backend inference on a worker thread, returning frozen copies"""
+        # The worker's buffers may be reused before the caller resumes
+        return _frozen_outputs(*self._infer_into_buffers(context, traced))
+    
+    async def _offload_native(self, fn: Callable, *args):
+        """Run a blocking native call on the executor
+        
+        At most native_max_in_flight calls are outstanding; further callers
+        wait here, which applies backpressure without blocking the loop.
+        """
+        async with self._native_in_flight:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+    
+    def _run_inference_batch(self,
+                             context_matrix: np.ndarray,
+                             decision_vectors: np.ndarray,
+                             confidence_scores: np.ndarray):
+        """Run backend inference over a prepared (N, 512) context matrix"""
+        with self._native_lock:
+            success = self.inference_backend.make_decision_batch(
+                context_matrix, decision_vectors, confidence_scores
+            )
+        
+        if not success:
+            raise RuntimeError(f"{self.inference_backend.name} batch decision making failed")
+    
     async def adapt_from_outcome(self, 
                                 decision: RealAIDecision, 
                                 outcome_feedback: np.ndarray,
                                 learning_strength: float = None) -> bool:
-        """Adapt Real AI based on outcome feedback"""
+        """Adapt Real AI based on outcome feedback
+        
+        With the adaptation queue enabled, feedback is only enqueued and the
+        result says whether it was accepted; it is applied in the background.
+        """
         if not self.learning_enabled:
             return False
         
         if learning_strength is None:
-            learning_strength = self.config['real_ai']['adaptation_strength']
+            learning_strength = self.settings.adaptation_strength
+        
+        if self.adaptation_queue is not None:
+            return self.enqueue_adaptation(outcome_feedback, learning_strength)
+        
+        tracer = self.tracer
+        traced = tracer.sample()
+        if traced:
+            stage_ns = root_ns = time.perf_counter_ns()
         
         # Prepare feedback
         feedback_array = outcome_feedback.astype(np.float32)
         if len(feedback_array) != 16:
             feedback_array = np.resize(feedback_array, 16)
         
-        # Perform adaptation in C++
-        success = self.cpp_lib.gaia_real_ai_adapt(
-            self.cpp_ai_handle,
-            feedback_array.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
-            ctypes.c_float(learning_strength)
-        )
+        # Perform adaptation in the inference backend
+        if self.native_offload:
+            success = await self._offload_native(self._adapt_native, feedback_array, learning_strength)
+        else:
+            success = self._adapt_native(feedback_array, learning_strength)
+        if traced:
+            stage_ns = tracer.record('adapt_native', stage_ns, category='adaptation')
         
         if success:
             self.metrics.successful_adaptations += 1
             
+            # Cached inference results belong to the previous model
+            if self.decision_cache is not None:
+                self.decision_cache.invalidate()
+                self._sync_cache_metrics()
+            
             # Update consciousness based on learning
             self._update_consciousness_from_learning(learning_strength)
         
+        if traced:
+            tracer.record('adapt_from_outcome', root_ns, category='adaptation', args={'success': bool(success)})
+        
         return success
     
+    def enqueue_adaptation(self, outcome_feedback: np.ndarray, learning_strength: float = None) -> bool:
+        """Queue feedback for the background adaptation pipeline without blocking
+        
+        Returns False when learning is disabled or the queue is full.
+        """
+        queue = self.adaptation_queue
+        if queue is None:
+            raise RuntimeError("Adaptation queue not enabled")
+        if not self.learning_enabled:
+            return False
+        
+        if learning_strength is None:
+            learning_strength = self.settings.adaptation_strength
+        if not queue.push(np.asarray(outcome_feedback, dtype=np.float32), learning_strength):
+            return False
+        
+        self._adaptation_ready.set()
+        if queue.depth >= queue.batch_size:
+            self._adaptation_full.set()
+        return True
+    
+    async def flush_adaptations(self):
+        """Apply all queued feedback now, in enqueue order"""
+        while self.adaptation_queue is not None and self.adaptation_queue.depth:
+            await self._apply_adaptation_batch()
+    
+    async def _adaptation_loop(self):
+        """Drain the adaptation queue in batches of batch_size or per flush interval"""
+        queue = self.adaptation_queue
+        while self.system_active:
+            try:
+                await self._adaptation_ready.wait()
+                
+                # Let a partial batch fill up until the flush interval expires
+                if queue.depth < queue.batch_size:
+                    self._adaptation_full.clear()
+                    try:
+                        await asyncio.wait_for(self._adaptation_full.wait(), queue.flush_interval_s)
+                    except asyncio.TimeoutError:
+                        pass
+                
+                await self._apply_adaptation_batch()
+                if not queue.depth:
+                    self._adaptation_ready.clear()
+                    
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Adaptation pipeline error: {e}")
+                await asyncio.sleep(queue.flush_interval_s)
+    
+    async def _apply_adaptation_batch(self):
+        """Apply the oldest queued feedback in one backend call
+        
+        Batches are applied one at a time in queue order. The decision cache
+        is invalidated before the model changes and again once it has, so no
+        decision that starts after the batch sees a result from the old model.
+        """
+        async with self._adaptation_apply_lock:
+            queue = self.adaptation_queue
+            feedback, strengths = queue.pop_batch()
+            batch_size = len(strengths)
+            if not batch_size:
+                return
+            
+            traced = self.tracer.sample()
+            start_ns = time.perf_counter_ns()
+            if self.decision_cache is not None:
+                self.decision_cache.invalidate()
+            
+            if self.native_offload:
+                # feedback and strengths are the queue's reused batch buffers;
+                # if this task is cancelled, keep the lock until the executor
+                # is done reading them
+                apply = asyncio.ensure_future(
+                    self._offload_native(self._adapt_batch_native, feedback, strengths)
+                )
+                try:
+                    success = await asyncio.shield(apply)
+                except asyncio.CancelledError:
+                    await asyncio.wait([apply])
+                    raise
+            else:
+                success = self._adapt_batch_native(feedback, strengths)
+            queue.apply_latency.record((time.perf_counter_ns() - start_ns) / 1e3)
+            
+            if success:
+                self.metrics.successful_adaptations += batch_size
+                if self.decision_cache is not None:
+                    self.decision_cache.invalidate()
+                    self._sync_cache_metrics()
+                self._update_consciousness_from_learning(float(strengths.sum()))
+            else:
+                self.logger.warning(f"Adaptation batch of {batch_size} failed")
+            
+            if traced:
+                self.tracer.record('adapt_batch', start_ns, category='adaptation',
+                                   args={'size': batch_size, 'success': bool(success)})
+    
+    def _adapt_batch_native(self, feedback: np.ndarray, learning_strengths: np.ndarray) -> bool:
+        """Apply a feedback batch in the inference backend"""
+        with self._native_lock:
+            return self.inference_backend.adapt_batch(feedback, learning_strengths)
+    
+    def _as_context_array(self, context) -> np.ndarray:
+        """View caller context data as a 1-D array without copying
+        
+        NumPy arrays pass through; typed memoryviews are wrapped; bytes,
+        bytearrays and untyped memoryviews are read as raw float32.
+        """
+        if isinstance(context, np.ndarray):
+            return context
+        if isinstance(context, memoryview) and context.format not in ('B', 'b', 'c'):
+            return np.asarray(context)
+        if isinstance(context, (bytes, bytearray, memoryview)):
+            return np.frombuffer(context, dtype=np.float32)
+        return np.asarray(context)
+    
+    def _adapt_native(self, feedback_array: np.ndarray, learning_strength: float) -> bool:
+        """Apply one adaptation step in the inference backend"""
+        with self._native_lock:
+            return self.inference_backend.adapt(feedback_array, learning_strength)
+    
     def _prepare_context(self, context: np.ndarray) -> np.ndarray:
-        """Prepare context array for decision making"""
-        # Ensure context is properly sized and formatted
-        if len(context) > 512:
-            context = context[:512]  # Truncate for real-time guarantee
-        elif len(context) < 512:
-            context = np.pad(context, (0, 512 - len(context)), 'constant')
+        """Prepare context array for decision making
+        
+        Returns the calling thread's pooled input buffer, which is reused by
+        the next decision on that thread.
+        """
+        return self.buffer_pool.acquire().load(self._as_context_array(context))
+    
+    def _prepare_context_batch(self, contexts: np.ndarray) -> np.ndarray:
+        """Prepare an (N, F) context matrix as a contiguous (N, 512) float32 matrix"""
+        width = min(contexts.shape[1], 512)  # Truncate for real-time guarantee
+        context_matrix = np.zeros((contexts.shape[0], 512), dtype=np.float32)
+        context_matrix[:, :width] = contexts[:, :width]
         
-        return context.astype(np.float32)
+        return context_matrix
     
     def _generate_reasoning_trace(self, 
                                 context: np.ndarray, 
                                 decision: np.ndarray,
-                                consciousness_state: ConsciousnessState) -> List[str]:
+                                consciousness_state: ConsciousnessState) -> ReasoningTrace:
         """Generate reasoning trace for transparency"""
-        trace = [
-            f"Context analysis: {len(context)} input features processed",
-            f"Consciousness level: {consciousness_state.awareness_level:.3f}",
-            f"Decision confidence: {np.mean(decision):.3f}",
-            f"Intentionality: {consciousness_state.intentionality:.3f}",
-            f"Agency: {consciousness_state.agency:.3f}",
-            f"Meta-cognition: {consciousness_state.meta_cognition:.3f}"
-        ]
-        
-        # Add decision rationale
-        max_decision_idx = np.argmax(np.abs(decision))
-        trace.append(f"Primary decision factor: dimension {max_decision_idx} (strength: {decision[max_decision_idx]:.3f})")
-        
-        return trace
+        return self._capture_reasoning_trace(len(context), decision, consciousness_state)
+    
+    def _capture_reasoning_trace(self,
+                                 context_features: int,
+                                 decision: np.ndarray,
+                                 consciousness_state: ConsciousnessState) -> ReasoningTrace:
+        """Capture the trace inputs; rendering is deferred until read"""
+        return ReasoningTrace(context_features, decision, consciousness_state)
     
     def _hash_context(self, context: np.ndarray) -> str:
         """Generate hash of context for traceability"""
-        import hashlib
-        return hashlib.md5(context.tobytes()).hexdigest()[:16]
+        if not context.flags.c_contiguous:
+            context = np.ascontiguousarray(context)
+        return hashlib.md5(context).hexdigest()[:16]
+    
+    def _hash_context_batch(self, contexts: np.ndarray) -> List[str]:
+        """Hash each row of a context matrix, matching _hash_context per row"""
+        contexts = np.ascontiguousarray(contexts)
+        row_bytes = contexts.strides[0] if contexts.shape[0] else 0
+        buffer = memoryview(contexts.reshape(-1)).cast('B')
+        md5 = hashlib.md5
+        
+        return [
+            md5(buffer[i * row_bytes:(i + 1) * row_bytes]).hexdigest()[:16]
+            for i in range(contexts.shape[0])
+        ]
     
     def _update_metrics(self, decision: RealAIDecision):
         """Update performance metrics"""
@@ -634,6 +3979,12 @@ class FunctionalRealAI:
         self.metrics.real_time_compliance = decision.real_time_compliant
         self.metrics.safety_compliance = 1.0 if decision.safety_validated else 0.0
         self.metrics.timestamp = time.time()
+        self._sync_cache_metrics()
+        
+        self.latency_histogram.record(decision.decision_latency_us)
+        self.window_stats.record(
+            decision.decision_latency_us, decision.real_time_compliant, decision.safety_validated
+        )
         
         # Calculate running averages
         if self.metrics.total_decisions > 1:
@@ -643,6 +3994,39 @@ class FunctionalRealAI:
                 alpha * (self.metrics.successful_adaptations / self.metrics.total_decisions)
             )
     
+    def _sync_cache_metrics(self):
+        """Copy decision cache counters into metrics"""
+        cache = self.decision_cache
+        if cache is not None:
+            self.metrics.cache_hits = cache.hits
+            self.metrics.cache_misses = cache.misses
+            self.metrics.cache_evictions = cache.evictions
+    
+    def _update_metrics_batch(self, batch: RealAIDecisionBatch):
+        """Update performance metrics once for a whole batch"""
+        batch_size = len(batch)
+        if not batch_size:
+            return
+        
+        self.metrics.total_decisions += batch_size
+        self.metrics.decision_latency_us = float(batch.decision_latency_us.mean())
+        self.metrics.consciousness_level = batch.consciousness_state.awareness_level
+        self.metrics.real_time_compliance = bool(batch.real_time_compliant.all())
+        self.metrics.safety_compliance = float(batch.safety_validated.mean())
+        self.metrics.timestamp = time.time()
+        
+        self.latency_histogram.record_many(batch.decision_latency_us)
+        self.window_stats.record_batch(
+            batch.decision_latency_us, batch.real_time_compliant, batch.safety_validated
+        )
+        
+        if self.metrics.total_decisions > 1:
+            alpha = 0.1  # Exponential moving average factor
+            self.metrics.adaptation_success_rate = (
+                (1 - alpha) * self.metrics.adaptation_success_rate +
+                alpha * (self.metrics.successful_adaptations / self.metrics.total_decisions)
+            )
+    
     def _update_consciousness_from_learning(self, learning_strength: float):
         """Update consciousness metrics based on learning"""
         # Learning enhances consciousness
@@ -659,44 +4043,167 @@ class FunctionalRealAI:
         # Start monitoring loops
         asyncio.create_task(self._metrics_update_loop())
         asyncio.create_task(self._health_monitoring_loop())
+        asyncio.create_task(self._config_watch_loop())
+        if self.adaptation_queue is not None:
+            self._adaptation_task = asyncio.create_task(self._adaptation_loop())
+        
+        # SIGHUP forces a config reload where the platform supports it
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.reload_config)
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+            pass
         
         self.logger.info("Real-time processing loops started")
     
+    def _stat_config(self) -> Optional[Tuple[int, int]]:
+        """Modification stamp of the config file, or None if it is absent"""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    async def _config_watch_loop(self):
+        """Reload configuration when the config file changes"""
+        while self.system_active:
+            interval_s = self.settings.config_watch_interval_s
+            if interval_s <= 0:
+                return
+            
+            stamp = self._stat_config()
+            if stamp is not None and stamp != self._config_stamp:
+                self.reload_config()
+            
+            await asyncio.sleep(interval_s)
+    
+    def reload_config(self) -> bool:
+        """Reload, validate and atomically apply the config file
+        
+        Hot-path settings and safety rules take effect for the next decision.
+        Invalid configs are rejected and the running settings are kept. Keys
+        that need a restart are reported but not applied: self.config keeps
+        their running values, so every later reload reports them again
+        until the restart.
+        """
+        self._config_stamp = self._stat_config()
+        try:
+            with open(self.config_path, 'r') as f:
+                config = json.load(f)
+            settings = RealAISettings.compile(config)
+            
+            safety_validator = self.safety_validator
+            if config.get('safety') != self.config.get('safety'):
+                safety_validator = RealAISafetyValidator(config.get('safety'))
+                safety_validator.inherit_state(self.safety_validator)
+            telemetry_bounds = IntegrationTelemetry.compile_bounds(config.get('integration', {}))
+        except Exception as e:
+            self.logger.error(f"Config reload rejected, keeping current settings: {e}")
+            return False
+        
+        for section, keys in RESTART_REQUIRED_KEYS.items():
+            old, new = self.config.get(section, {}), config.get(section, {})
+            changed = [key for key in keys if old.get(key) != new.get(key)]
+            if changed:
+                self.logger.warning(f"Config changes to {section}.{changed} take effect after restart")
+                running = dict(new)
+                for key in changed:
+                    if key in old:
+                        running[key] = old[key]
+                    else:
+                        running.pop(key, None)
+                config[section] = running
+        
+        self.safety_validator = safety_validator
+        self.telemetry.set_bounds(*telemetry_bounds)
+        self.settings = settings
+        self.config = config
+        self.logger.info(f"Configuration reloaded from {self.config_path}")
+        return True
+    
     async def _metrics_update_loop(self):
         """Update metrics periodically"""
         while self.system_active:
             try:
-                # Update integration coupling metrics
+                if self.tracer.active:
+                    loop_ns = time.perf_counter_ns()
+                
+                # Integration coupling from pushed telemetry; stale reads as decoupled
                 if self.gaia_air_interface:
-                    self.metrics.gaia_air_coupling = await self.gaia_air_interface.get_coupling_strength()
+                    self.metrics.gaia_air_coupling = self.telemetry.get('gaia_air.coupling_strength', 0.0)
+                if self.ampel360_interface:
+                    self.metrics.ampel360_coupling = self.telemetry.get('ampel360.coupling_strength', 0.0)
+                self.metrics.telemetry_stale_reads = self.telemetry.stale_reads
                 
                 # Update quantum coherence
                 consciousness_state = self.consciousness_monitor.get_consciousness_state()
                 self.metrics.quantum_coherence = consciousness_state.temporal_coherence
                 self.metrics.embodiment_integrity = consciousness_state.embodied_presence
                 
+                if self.admission is not None:
+                    self._refresh_admission_deadline()
+                
+                # Bound how long journaled decisions stay unpublished; the
+                # sync blocks, so it runs on an executor thread
+                journal = self.decision_journal
+                if journal is not None and journal.flush_due(self.settings.journal_flush_interval_s):
+                    await asyncio.get_running_loop().run_in_executor(self.executor, journal.flush)
+                
+                if self.tracer.active:
+                    self.tracer.record('metrics_update_loop', loop_ns, category='background')
+                
                 await asyncio.sleep(0.1)  # 10Hz update rate
                 
             except Exception as e:
                 self.logger.error(f"Metrics update error: {e}")
                 await asyncio.sleep(1.0)
     
+    def _refresh_admission_deadline(self):
+        """Rebase the default admission deadline on the last 10s of decision latency"""
+        counters, histogram, _ = self.window_stats.window_totals(10.0)
+        if counters[WindowedDecisionStats.DECISIONS]:
+            settings = self.settings
+            self.admission_deadline_us = settings.admission_deadline_factor * LatencyHistogram.percentile_of(
+                histogram, settings.admission_deadline_percentile
+            )
+    
     async def _health_monitoring_loop(self):
         """Monitor system health"""
         while self.system_active:
             try:
+                if self.tracer.active:
+                    loop_ns = time.perf_counter_ns()
+                
                 # Check consciousness levels
                 consciousness_state = self.consciousness_monitor.get_consciousness_state()
                 if consciousness_state.awareness_level < 0.5:
                     self.logger.warning("Low consciousness level detected")
                 
+                # Judge performance and safety over a window, not the last sample
+                settings = self.settings
+                window = self.window_stats.window(settings.health_window_s)
+                
                 # Check real-time performance
-                if self.metrics.decision_latency_us > self.config['real_ai']['decision_latency_target_us'] * 2:
-                    self.logger.warning("Real-time performance degraded")
+                if window['decisions']:
+                    if window['latency_p99_us'] > settings.decision_latency_target_us * 2:
+                        self.logger.warning(f"Real-time performance degraded: p99 {window['latency_p99_us']:.1f}μs")
+                    
+                    if window['real_time_compliance'] < settings.real_time_compliance_threshold:
+                        self.logger.warning(f"Real-time compliance {window['real_time_compliance']:.3f} below threshold")
                 
                 # Check safety compliance
-                if self.metrics.safety_compliance < 0.95:
-                    self.logger.warning("Safety compliance below threshold")
+                if window['safety_compliance'] < settings.safety_compliance_threshold:
+                    self.logger.warning(f"Safety compliance {window['safety_compliance']:.3f} below threshold")
+                
+                # Check the process against the memory budget
+                limit_bytes = self.performance_tuner.memory_limit_bytes
+                resident_bytes = self.performance_tuner.resident_bytes()
+                if limit_bytes and resident_bytes and resident_bytes > limit_bytes:
+                    self.logger.warning(
+                        f"Resident memory {resident_bytes / 2**20:.0f}MB exceeds the {limit_bytes / 2**20:.0f}MB memory budget"
+                    )
+                
+                if self.tracer.active:
+                    self.tracer.record('health_monitoring_loop', loop_ns, category='background')
                 
                 await asyncio.sleep(1.0)  # 1Hz health check
                 
@@ -704,26 +4211,93 @@ class FunctionalRealAI:
                 self.logger.error(f"Health monitoring error: {e}")
                 await asyncio.sleep(5.0)
     
+    @staticmethod
+    def embodied_state_buffer(k: int) -> np.ndarray:
+        """Preallocated array for k embodied-state snapshots"""
+        return np.zeros(k, dtype=EMBODIED_STATE_DTYPE)
+    
+    def poll_embodied_states(self, out: np.ndarray) -> np.ndarray:
+        """Fill a preallocated embodied-state array with the latest snapshots
+        
+        One native call writes up to len(out) snapshots, oldest first, when
+        the embodied library exports real_ai_embodied_poll_states; otherwise
+        the consciousness monitor fills them from its own samples, with NaN
+        for the fields it cannot derive. Returns the filled prefix of out;
+        field views such as states['consciousness_level'] are zero-copy.
+        """
+        if (out.dtype != EMBODIED_STATE_DTYPE or out.ndim != 1
+                or not out.flags.c_contiguous or not out.flags.writeable):
+            raise ValueError("Embodied state buffer must be a writable, contiguous 1-D EMBODIED_STATE_DTYPE array")
+        
+        if self.embodied_poll_supported and self.rust_embodied_handle:
+            written = self.rust_lib.real_ai_embodied_poll_states(
+                self.rust_embodied_handle,
+                out.ctypes.data_as(ctypes.POINTER(CEmbodiedState)),
+                len(out)
+            )
+            return out[:written]
+        
+        timestamps = self._embodied_timestamps
+        if timestamps is None or len(timestamps) < len(out):
+            timestamps = self._embodied_timestamps = np.empty(len(out), dtype=np.float64)
+        return out[:self.consciousness_monitor.fill_embodied_states(out, timestamps)]
+    
     def get_real_ai_metrics(self) -> RealAIMetrics:
         """Get current Real AI metrics"""
+        self.metrics.latency_p50_us = self.latency_histogram.percentile(50.0)
+        self.metrics.latency_p99_us = self.latency_histogram.percentile(99.0)
+        self.metrics.latency_p999_us = self.latency_histogram.percentile(99.9)
+        self.metrics.windows = {
+            label: self.window_stats.window(window_s) for label, window_s in METRIC_WINDOWS
+        }
+        queue = self.adaptation_queue
+        if queue is not None:
+            self.metrics.adaptation_queue_depth = queue.depth
+            self.metrics.adaptations_dropped = queue.dropped
+            self.metrics.adaptation_apply_p50_us = queue.apply_latency.percentile(50.0)
+            self.metrics.adaptation_apply_p99_us = queue.apply_latency.percentile(99.0)
+        admission = self.admission
+        if admission is not None:
+            self.metrics.admission_queued = admission.queued
+            self.metrics.admission_shed = admission.shed
+            self.metrics.admission_degraded = admission.degraded
+            self.metrics.admission_queue_depth = admission.depth
         return self.metrics
     
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """Mergeable metrics: plain fields plus raw latency histogram and window totals"""
+        metrics = self.get_real_ai_metrics()
+        return {
+            'metrics': asdict(metrics),
+            'latency_counts': self.latency_histogram.counts.copy(),
+            'latency_max_us': self.latency_histogram.max_value,
+            'windows': {
+                label: self.window_stats.window_totals(window_s) for label, window_s in METRIC_WINDOWS
+            }
+        }
+    
     def get_consciousness_state(self) -> ConsciousnessState:
         """Get current consciousness state"""
         return self.consciousness_monitor.get_consciousness_state()
     
+    def export_trace(self, path: str) -> int:
+        """Export recorded spans as Chrome trace JSON; returns the span count"""
+        return self.tracer.export_chrome_trace(path)
+    
     def is_functional(self) -> bool:
         """Check if Real AI is fully functional"""
         if not self.system_active:
             return False
         
         consciousness_state = self.consciousness_monitor.get_consciousness_state()
+        settings = self.settings
+        window = self.window_stats.window(settings.health_window_s)
         
         return (
             consciousness_state.awareness_level >= 0.7 and
             consciousness_state.temporal_coherence >= 0.8 and
-            self.metrics.real_time_compliance and
-            self.metrics.safety_compliance >= 0.95
+            window['real_time_compliance'] >= settings.real_time_compliance_threshold and
+            window['safety_compliance'] >= settings.safety_compliance_threshold
         )
     
     async def shutdown(self):
@@ -731,26 +4305,389 @@ class FunctionalRealAI:
         self.logger.info("Shutting down Functional Real AI System...")
         
         self.system_active = False
-        self.consciousness_monitor.monitoring_active = False
+        if not self.consciousness_monitor.stop_monitoring():
+            self.logger.error("Consciousness sampler did not stop during shutdown")
         
-        # Cleanup native handles
-        if self.cpp_ai_handle:
-            # Note: Add proper cleanup call when available
+        try:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
             pass
         
+        # Apply queued feedback before the backend goes away, once any
+        # batch the cancelled loop had in flight has finished
+        if self.adaptation_queue is not None:
+            if self._adaptation_task is not None:
+                self._adaptation_task.cancel()
+                await asyncio.wait([self._adaptation_task])
+            if self.inference_backend is not None:
+                await self.flush_adaptations()
+        
+        # Cleanup native handles
+        if self.inference_backend is not None:
+            self.inference_backend.shutdown()
+        
+        if self.decision_journal is not None:
+            self.decision_journal.close()
+        
         if self.rust_embodied_handle:
             # Note: Add proper cleanup call when available
             pass
         
         # Shutdown integration interfaces
+        await self._stop_telemetry()
         if self.gaia_air_interface:
             await self.gaia_air_interface.shutdown()
         
         if self.ampel360_interface:
             await self.ampel360_interface.shutdown()
         
+        # The event loop thread belongs to the caller; undo its pinning
+        self._restore_loop_thread_placement()
+        
         self.logger.info("Real AI system shutdown complete")
 
+# Controller pool shared-memory slot: request context in, decision record out
+POOL_CONTEXT_SIZE = 512
+POOL_SLOT_DTYPE = np.dtype([
+    ('context', '<f4', (POOL_CONTEXT_SIZE,)),
+    ('context_len', '<i4'),
+    ('consciousness_requirement', '<f8'),
+    ('record', JOURNAL_RECORD_DTYPE)
+], align=True)
+
+def _pool_worker_main(worker_id: int, worker_count: int, config_path: str, shm_name: str,
+                      slot_count: int, conn):
+    """Process entry point of a controller pool worker"""
+    asyncio.run(_pool_worker(worker_id, worker_count, config_path, shm_name, slot_count, conn))
+
+async def _pool_worker(worker_id: int, worker_count: int, config_path: str, shm_name: str,
+                       slot_count: int, conn):
+    """Serve decisions from shared-memory slots with a private FunctionalRealAI
+    
+    Only slot indices and small control messages cross the pipe; contexts
+    are read from and results written to the slot in place. The worker's
+    threads are placed on its own slice of cpu_affinity.
+    """
+    logger = logging.getLogger(__name__)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray((slot_count,), dtype=POOL_SLOT_DTYPE, buffer=shm.buf)
+    contexts = slots['context']
+    records = slots['record']
+    
+    real_ai = FunctionalRealAI(config_path, pool_worker=(worker_id, worker_count))
+    try:
+        ready = await real_ai.initialize_real_ai()
+        conn.send(('ready', ready))
+        if not ready:
+            return
+        
+        loop = asyncio.get_running_loop()
+        messages = asyncio.Queue()
+        
+        async def decide(slot: int):
+            context = contexts[slot, :int(slots['context_len'][slot])]
+            try:
+                decision = await real_ai.make_real_ai_decision(
+                    context, consciousness_requirement=float(slots['consciousness_requirement'][slot])
+                )
+                write_decision_record(records[slot], decision, len(context))
+                conn.send(('done', slot))
+            except Exception as e:
+                conn.send(('error', slot, f"{type(e).__name__}: {e}"))
+        
+        def on_readable():
+            try:
+                messages.put_nowait(conn.recv())
+            except (EOFError, OSError):
+                loop.remove_reader(conn.fileno())
+                messages.put_nowait(('shutdown',))
+        
+        loop.add_reader(conn.fileno(), on_readable)
+        
+        while True:
+            message = await messages.get()
+            kind = message[0]
+            
+            if kind == 'decide':
+                await decide(message[1])
+            elif kind == 'metrics':
+                conn.send(('metrics', real_ai.metrics_snapshot()))
+            elif kind == 'shutdown':
+                loop.remove_reader(conn.fileno())
+                break
+    except Exception as e:
+        logger.error(f"Controller pool worker {worker_id} failed: {e}")
+    finally:
+        await real_ai.shutdown()
+        del slots, contexts, records
+        shm.close()
+        conn.close()
+
+class _PoolWorker:
+    """Front-end bookkeeping for one pool worker process"""
+    
+    def __init__(self, worker_id: int, process, conn, shm: shared_memory.SharedMemory, slot_count: int):
+        self.worker_id = worker_id
+        self.process = process
+        self.conn = conn
+        self.shm = shm
+        self.slots = np.ndarray((slot_count,), dtype=POOL_SLOT_DTYPE, buffer=shm.buf)
+        self.free_slots = asyncio.Queue()
+        for slot in range(slot_count):
+            self.free_slots.put_nowait(slot)
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.control_waiters = deque()  # Futures for 'ready' and 'metrics' replies, in order
+
+class RealAIControllerPool:
+    """Multi-process pool of FunctionalRealAI workers
+    
+    Each worker process owns its native handles, consciousness monitor and
+    event loop, so per-decision Python work runs on as many cores as there
+    are workers. Requests are routed round-robin or by context hash (so
+    repeated contexts reach the same worker and its decision cache).
+    Contexts and decision records travel through per-worker shared-memory
+    slots; the pipes only carry slot indices. Contexts longer than the
+    512 native inputs are truncated before transport.
+    """
+    
+    ROUTING = ('round_robin', 'context_hash')
+    
+    def __init__(self, config_path: str = "config/real_ai/config.json"):
+        self.logger = logging.getLogger(__name__)
+        self.config_path = config_path
+        config = FunctionalRealAI._load_config(config_path)
+        pool_config = {**DEFAULT_CONFIG['pool'], **config.get('pool', {})}
+        
+        self.worker_count = int(pool_config['workers']) or os.cpu_count() or 1
+        self.routing = pool_config['routing']
+        if self.routing not in self.ROUTING:
+            raise ValueError(f"Unknown pool routing '{self.routing}', expected one of {self.ROUTING}")
+        self.slots_per_worker = int(pool_config['slots_per_worker'])
+        self.start_method = pool_config['start_method']
+        self.start_timeout_s = float(pool_config['start_timeout_s'])
+        
+        self.workers: List[_PoolWorker] = []
+        self.system_active = False
+        self._next_worker = 0
+    
+    async def start(self) -> bool:
+        """Spawn and initialize all workers; on any failure the pool is torn down"""
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context(self.start_method)
+        
+        try:
+            for worker_id in range(self.worker_count):
+                shm = shared_memory.SharedMemory(create=True, size=POOL_SLOT_DTYPE.itemsize * self.slots_per_worker)
+                parent_conn, child_conn = context.Pipe()
+                process = context.Process(
+                    target=_pool_worker_main,
+                    args=(worker_id, self.worker_count, self.config_path, shm.name,
+                          self.slots_per_worker, child_conn),
+                    name=f"real-ai-worker-{worker_id}",
+                    daemon=True
+                )
+                worker = _PoolWorker(worker_id, process, parent_conn, shm, self.slots_per_worker)
+                self.workers.append(worker)
+                
+                ready = loop.create_future()
+                worker.control_waiters.append(ready)
+                process.start()
+                child_conn.close()
+                loop.add_reader(parent_conn.fileno(), self._on_worker_message, worker)
+            
+            results = await asyncio.wait_for(
+                asyncio.gather(*(worker.control_waiters[0] for worker in self.workers)),
+                timeout=self.start_timeout_s
+            )
+            if not all(results):
+                raise RuntimeError(f"{results.count(False)} pool worker(s) failed to initialize")
+            
+            self.system_active = True
+            self.logger.info(f"🚀 Real AI controller pool OPERATIONAL with {self.worker_count} workers")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Real AI controller pool start failed: {e}")
+            await self.shutdown()
+            return False
+    
+    def _on_worker_message(self, worker: _PoolWorker):
+        """Complete the future a worker reply belongs to"""
+        try:
+            message = worker.conn.recv()
+        except (EOFError, OSError):
+            self._on_worker_lost(worker)
+            return
+        
+        kind = message[0]
+        if kind in ('done', 'error'):
+            slot = message[1]
+            future = worker.pending.pop(slot)
+            if kind == 'done':
+                result = read_decision_record(worker.slots['record'][slot], ReasoningTrace)
+            else:
+                result = RuntimeError(message[2])
+            worker.free_slots.put_nowait(slot)
+            if future.done():
+                return  # Caller gave up; the slot is free again
+            if kind == 'done':
+                future.set_result(result)
+            else:
+                future.set_exception(result)
+        elif kind in ('ready', 'metrics'):
+            future = worker.control_waiters.popleft()
+            if not future.done():
+                future.set_result(message[1])
+    
+    def _on_worker_lost(self, worker: _PoolWorker):
+        if not worker.conn.closed:
+            asyncio.get_running_loop().remove_reader(worker.conn.fileno())
+        error = RuntimeError(f"Controller pool worker {worker.worker_id} exited")
+        for future in list(worker.pending.values()) + list(worker.control_waiters):
+            if not future.done():
+                future.set_exception(error)
+        worker.pending.clear()
+        worker.control_waiters.clear()
+        if self.system_active:
+            self.logger.error(str(error))
+    
+    def _route(self, context: np.ndarray) -> _PoolWorker:
+        if self.routing == 'context_hash':
+            digest = hashlib.md5(context.tobytes()).digest()
+            return self.workers[int.from_bytes(digest[:8], 'little') % self.worker_count]
+        worker = self.workers[self._next_worker]
+        self._next_worker = (self._next_worker + 1) % self.worker_count
+        return worker
+    
+    async def make_real_ai_decision(self,
+                                    context: np.ndarray,
+                                    goal_specification: Optional[str] = None,
+                                    consciousness_requirement: float = 0.8) -> RealAIDecision:
+        """Make a decision on one of the workers"""
+        if not self.system_active:
+            raise RuntimeError("Real AI controller pool not active")
+        
+        context = np.asarray(context, dtype=np.float32)[:POOL_CONTEXT_SIZE]
+        worker = self._route(context)
+        slot = await worker.free_slots.get()
+        
+        n = len(context)
+        worker.slots['context'][slot, :n] = context
+        worker.slots['context_len'][slot] = n
+        worker.slots['consciousness_requirement'][slot] = consciousness_requirement
+        
+        future = asyncio.get_running_loop().create_future()
+        worker.pending[slot] = future
+        try:
+            worker.conn.send(('decide', slot))
+        except OSError:
+            worker.pending.pop(slot, None)
+            worker.free_slots.put_nowait(slot)
+            raise RuntimeError(f"Controller pool worker {worker.worker_id} unavailable")
+        return await future
+    
+    async def get_real_ai_metrics(self) -> RealAIMetrics:
+        """Metrics of all workers merged into one RealAIMetrics view"""
+        loop = asyncio.get_running_loop()
+        waiters = []
+        for worker in self.workers:
+            future = loop.create_future()
+            worker.control_waiters.append(future)
+            worker.conn.send(('metrics',))
+            waiters.append(future)
+        return self.aggregate_metrics(await asyncio.gather(*waiters))
+    
+    @staticmethod
+    def aggregate_metrics(snapshots: List[Dict[str, Any]]) -> RealAIMetrics:
+        """Merge FunctionalRealAI.metrics_snapshot() results
+        
+        Counts are summed, levels averaged, rates weighted by decisions,
+        last-decision fields taken from the most recent worker, and
+        percentiles recomputed from the merged histograms.
+        """
+        metrics = [snapshot['metrics'] for snapshot in snapshots]
+        total_decisions = sum(m['total_decisions'] for m in metrics)
+        latest = max(metrics, key=lambda m: m['timestamp'])
+        
+        def mean(name: str) -> float:
+            return float(np.mean([m[name] for m in metrics]))
+        
+        def decision_weighted(name: str) -> float:
+            if not total_decisions:
+                return mean(name)
+            return sum(m[name] * m['total_decisions'] for m in metrics) / total_decisions
+        
+        latency_counts = np.sum([snapshot['latency_counts'] for snapshot in snapshots], axis=0)
+        latency_max_us = max(snapshot['latency_max_us'] for snapshot in snapshots)
+        
+        windows = {}
+        for label, _ in METRIC_WINDOWS:
+            totals = [snapshot['windows'][label] for snapshot in snapshots]
+            windows[label] = WindowedDecisionStats.summarize(
+                np.sum([t[0] for t in totals], axis=0),
+                np.sum([t[1] for t in totals], axis=0),
+                max(t[2] for t in totals)
+            )
+        
+        return RealAIMetrics(
+            consciousness_level=mean('consciousness_level'),
+            decision_latency_us=latest['decision_latency_us'],
+            learning_velocity=mean('learning_velocity'),
+            adaptation_success_rate=decision_weighted('adaptation_success_rate'),
+            safety_compliance=latest['safety_compliance'],
+            real_time_compliance=latest['real_time_compliance'],
+            quantum_coherence=mean('quantum_coherence'),
+            embodiment_integrity=mean('embodiment_integrity'),
+            gaia_air_coupling=mean('gaia_air_coupling'),
+            total_decisions=total_decisions,
+            successful_adaptations=sum(m['successful_adaptations'] for m in metrics),
+            timestamp=latest['timestamp'],
+            cache_hits=sum(m['cache_hits'] for m in metrics),
+            cache_misses=sum(m['cache_misses'] for m in metrics),
+            cache_evictions=sum(m['cache_evictions'] for m in metrics),
+            latency_p50_us=min(LatencyHistogram.percentile_of(latency_counts, 50.0), latency_max_us),
+            latency_p99_us=min(LatencyHistogram.percentile_of(latency_counts, 99.0), latency_max_us),
+            latency_p999_us=min(LatencyHistogram.percentile_of(latency_counts, 99.9), latency_max_us),
+            windows=windows,
+            adaptation_queue_depth=sum(m['adaptation_queue_depth'] for m in metrics),
+            adaptations_dropped=sum(m['adaptations_dropped'] for m in metrics),
+            adaptation_apply_p50_us=max(m['adaptation_apply_p50_us'] for m in metrics),
+            adaptation_apply_p99_us=max(m['adaptation_apply_p99_us'] for m in metrics),
+            stream_expired=sum(m['stream_expired'] for m in metrics),
+            stream_coalesced=sum(m['stream_coalesced'] for m in metrics),
+            stream_rejected=sum(m['stream_rejected'] for m in metrics),
+            admission_queued=sum(m['admission_queued'] for m in metrics),
+            admission_shed=sum(m['admission_shed'] for m in metrics),
+            admission_degraded=sum(m['admission_degraded'] for m in metrics),
+            admission_queue_depth=sum(m['admission_queue_depth'] for m in metrics),
+            ampel360_coupling=mean('ampel360_coupling'),
+            telemetry_stale_reads=sum(m['telemetry_stale_reads'] for m in metrics)
+        )
+    
+    async def shutdown(self):
+        """Stop all workers and release their shared memory"""
+        self.system_active = False
+        loop = asyncio.get_running_loop()
+        
+        for worker in self.workers:
+            try:
+                worker.conn.send(('shutdown',))
+            except OSError:
+                pass
+        
+        for worker in self.workers:
+            await loop.run_in_executor(None, worker.process.join, 5.0)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            self._on_worker_lost(worker)
+            worker.conn.close()
+            worker.slots = None
+            worker.shm.close()
+            worker.shm.unlink()
+        
+        self.workers = []
+        self.logger.info("Real AI controller pool shutdown complete")
+
 # Example usage and testing
 async def main():
     """Example usage of Functional Real AI"""
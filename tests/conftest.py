@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The Real AI controller modules are run as top-level scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "python" / "real_ai"))
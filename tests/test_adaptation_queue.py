@@ -0,0 +1,55 @@
+"""Queued adaptation with native offload across shutdown"""
+
+import asyncio
+import copy
+import json
+import threading
+import time
+
+import numpy as np
+
+from functional_controller import DEFAULT_CONFIG, FunctionalRealAI
+
+def test_shutdown_waits_for_offloaded_batch_before_flushing(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai'].update(inference_backend='reference', adaptation_queue_enabled=True,
+                             adaptation_batch_size=4, adaptation_flush_interval_s=0.001)
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    config['performance']['native_offload'] = True
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+
+    applied = []
+    overlapping = threading.Lock()
+    errors = []
+
+    def slow_adapt_batch(feedback, strengths):
+        if not overlapping.acquire(blocking=False):
+            errors.append("adaptation batches overlapped")
+            return False
+        try:
+            expected = feedback.copy()
+            time.sleep(0.1)
+            if not np.array_equal(expected, feedback):
+                errors.append("batch buffer overwritten during apply")
+            applied.extend(feedback[:, 0].tolist())
+            return True
+        finally:
+            overlapping.release()
+
+    async def run():
+        real_ai = FunctionalRealAI(str(path))
+        assert await real_ai.initialize_real_ai()
+        real_ai.inference_backend.adapt_batch = slow_adapt_batch
+        decision = await real_ai.make_real_ai_decision(np.zeros(16, dtype=np.float32), consciousness_requirement=0.0)
+
+        for i in range(4):
+            assert await real_ai.adapt_from_outcome(decision, np.full(16, i, dtype=np.float32), 0.1)
+        await asyncio.sleep(0.02)  # First batch is now in the executor
+        for i in range(4, 8):
+            assert await real_ai.adapt_from_outcome(decision, np.full(16, i, dtype=np.float32), 0.1)
+        await real_ai.shutdown()
+
+    asyncio.run(run())
+    assert not errors, errors
+    assert applied == list(range(8))
@@ -0,0 +1,84 @@
+"""Admission control: default deadlines, shedding and the degraded path"""
+
+import asyncio
+import copy
+import json
+import math
+import time
+
+import numpy as np
+
+from functional_controller import DEFAULT_CONFIG, DecisionShedError, FunctionalRealAI
+
+def write_config(tmp_path, **admission):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai'].update(inference_backend='reference', safety_validation=False)
+    # Offloaded inference yields to the loop, so concurrent requests really queue
+    config['performance']['native_offload'] = True
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    config['admission'].update(enabled=True, max_concurrent=1, **admission)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+CONTEXTS = np.random.default_rng(5).standard_normal((16, 512)).astype(np.float32)
+
+def run(config_path, consume):
+    async def main():
+        real_ai = FunctionalRealAI(config_path)
+        assert await real_ai.initialize_real_ai()
+        try:
+            return await consume(real_ai)
+        finally:
+            await real_ai.shutdown()
+    return asyncio.run(main())
+
+async def burst(real_ai, contexts=CONTEXTS):
+    return await asyncio.gather(*(
+        real_ai.make_real_ai_decision(context, consciousness_requirement=0.0) for context in contexts
+    ), return_exceptions=True)
+
+def test_queued_requests_under_the_shed_depth_are_served(tmp_path):
+    # Fewer than degrade_queue_depth requests: queued, but not overloaded
+    contexts = CONTEXTS[:DEFAULT_CONFIG['admission']['degrade_queue_depth'] - 2]
+
+    async def consume(real_ai):
+        # Each inference takes far longer than decision_latency_target_us
+        make_decision = real_ai.inference_backend.make_decision
+        def slow_decision(buffers):
+            time.sleep(0.0005)
+            return make_decision(buffers)
+        real_ai.inference_backend.make_decision = slow_decision
+
+        cold_deadline = real_ai.admission_deadline_us
+        cold = await burst(real_ai, contexts)
+        real_ai._refresh_admission_deadline()
+        warm = await burst(real_ai, contexts)
+        return cold_deadline, real_ai.admission_deadline_us, cold + warm, real_ai.admission
+
+    cold_deadline, warm_deadline, results, admission = run(write_config(tmp_path), consume)
+    assert cold_deadline == math.inf
+    assert math.isfinite(warm_deadline) and warm_deadline > DEFAULT_CONFIG['real_ai']['decision_latency_target_us']
+    assert not [r for r in results if isinstance(r, BaseException)]
+    assert admission.queued > 0
+    assert admission.shed == 0 and admission.degraded == 0
+
+def test_shed_requests_are_not_counted_as_degraded(tmp_path):
+    config_path = write_config(tmp_path, degrade_queue_depth=2, shed_queue_depth=4)
+
+    async def consume(real_ai):
+        return await burst(real_ai), real_ai.admission, real_ai.decision_history
+
+    results, admission, history = run(config_path, consume)
+    shed = [r for r in results if isinstance(r, DecisionShedError)]
+    decisions = [r for r in results if not isinstance(r, BaseException)]
+    degraded = [d for d in decisions if not d.reasoning_trace]
+
+    assert len(shed) + len(decisions) == len(CONTEXTS)
+    assert shed and degraded
+    assert admission.shed == len(shed)
+    assert admission.degraded == len(degraded)
+
+    # The degraded path skips trace capture and history
+    assert len(history) == len(decisions) - len(degraded)
+    assert {d.context_hash for d in history} == {d.context_hash for d in decisions if d.reasoning_trace}
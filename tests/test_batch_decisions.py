@@ -0,0 +1,59 @@
+"""make_real_ai_decisions_batch matches per-context decisions on the reference backend"""
+
+import asyncio
+import copy
+import json
+
+import numpy as np
+
+from functional_controller import DEFAULT_CONFIG, FunctionalRealAI
+
+def write_config(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai']['inference_backend'] = 'reference'
+    # Random contexts would otherwise trip the rate-of-change limit
+    config['safety']['max_rate_of_change'] = None
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+def test_batch_matches_scalar_decisions(tmp_path):
+    contexts = np.random.default_rng(7).standard_normal((6, 512)).astype(np.float32)
+
+    async def decide():
+        real_ai = FunctionalRealAI(write_config(tmp_path))
+        assert await real_ai.initialize_real_ai()
+        try:
+            scalar = [await real_ai.make_real_ai_decision(c, consciousness_requirement=0.0) for c in contexts]
+            batch = await real_ai.make_real_ai_decisions_batch(contexts, consciousness_requirement=0.0)
+            return scalar, batch, real_ai.expand_decision_batch(batch)
+        finally:
+            await real_ai.shutdown()
+
+    scalar, batch, expanded = asyncio.run(decide())
+
+    assert len(batch) == len(contexts)
+    assert np.ptp(batch.decision_vectors, axis=0).max() > 0
+    np.testing.assert_allclose(batch.decision_vectors, np.stack([d.decision_vector for d in scalar]), rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(batch.confidence_scores, np.stack([d.confidence_scores for d in scalar]), rtol=1e-5, atol=1e-6)
+    assert batch.context_hashes == [d.context_hash for d in scalar]
+    assert list(batch.safety_validated) == [d.safety_validated for d in scalar]
+
+    for row, decision in enumerate(expanded):
+        np.testing.assert_array_equal(decision.decision_vector, batch.decision_vectors[row])
+        assert decision.context_hash == scalar[row].context_hash
+
+def test_empty_batch(tmp_path):
+    async def decide():
+        real_ai = FunctionalRealAI(write_config(tmp_path))
+        assert await real_ai.initialize_real_ai()
+        try:
+            return await real_ai.make_real_ai_decisions_batch(np.zeros((0, 512), dtype=np.float32),
+                                                              consciousness_requirement=0.0)
+        finally:
+            await real_ai.shutdown()
+
+    batch = asyncio.run(decide())
+    assert len(batch) == 0
+    assert batch.decision_vectors.shape == (0, 16)
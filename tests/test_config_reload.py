@@ -0,0 +1,60 @@
+"""FunctionalRealAI.reload_config: hot keys apply, restart-only keys keep running values"""
+
+import copy
+import json
+import logging
+
+from functional_controller import DEFAULT_CONFIG, FunctionalRealAI
+
+def write(path, config):
+    path.write_text(json.dumps(config))
+
+def test_restart_only_changes_are_not_applied_and_keep_warning(tmp_path, caplog):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    path = tmp_path / 'config.json'
+    write(path, config)
+    real_ai = FunctionalRealAI(str(path))
+
+    config['real_ai']['consciousness_threshold'] = 0.5
+    config['real_ai']['stream_policy'] = 'skip'
+    config['real_ai']['stream_queue_size'] = 3
+    config['real_ai']['decision_cache_size'] = 17
+    config['performance']['native_max_in_flight'] = 1
+    write(path, config)
+
+    for _ in range(2):
+        caplog.clear()
+        with caplog.at_level(logging.WARNING):
+            assert real_ai.reload_config()
+        warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+        assert any('decision_cache_size' in w for w in warnings)
+        assert any('native_max_in_flight' in w for w in warnings)
+
+        assert real_ai.settings.consciousness_threshold == 0.5
+        assert real_ai.settings.stream_policy == 'skip'
+        assert real_ai.settings.stream_queue_size == 3
+        assert real_ai.config['real_ai']['consciousness_threshold'] == 0.5
+        assert real_ai.config['real_ai']['decision_cache_size'] == DEFAULT_CONFIG['real_ai']['decision_cache_size']
+        assert real_ai.config['performance']['native_max_in_flight'] == DEFAULT_CONFIG['performance']['native_max_in_flight']
+
+def test_invalid_config_is_rejected(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    path = tmp_path / 'config.json'
+    write(path, config)
+    real_ai = FunctionalRealAI(str(path))
+
+    config['real_ai']['consciousness_threshold'] = 1.5
+    write(path, config)
+    assert not real_ai.reload_config()
+    assert real_ai.settings.consciousness_threshold == DEFAULT_CONFIG['real_ai']['consciousness_threshold']
+
+def test_invalid_stream_queue_size_is_rejected(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    path = tmp_path / 'config.json'
+    write(path, config)
+    real_ai = FunctionalRealAI(str(path))
+
+    config['real_ai']['stream_queue_size'] = 0
+    write(path, config)
+    assert not real_ai.reload_config()
+    assert real_ai.settings.stream_queue_size == DEFAULT_CONFIG['real_ai']['stream_queue_size']
@@ -0,0 +1,114 @@
+"""ConsciousnessHistory: seqlock reads under a concurrent writer, rolling statistics"""
+
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from functional_controller import ConsciousnessHistory
+
+CAPACITY = 200
+COLUMN_OFFSETS = {'timestamp': 0.0, 'coherence': 0.25, 'awareness': 0.5, 'continuity': 0.75}
+
+def sample(t):
+    """Deterministic sample t for the rolling statistics"""
+    coherence = (t * 0.6180339887) % 1.0
+    return float(t), coherence, coherence * 0.5, coherence * 0.25
+
+def brute_force_autocorrelation(history):
+    n = history.persistence_window
+    coherence = np.array([sample(t)[1] for t in range(history.count)])
+    recent, previous = coherence[-n:], coherence[-2 * n:-n]
+    return np.corrcoef(recent, previous)[0, 1]
+
+class YieldingColumn(np.ndarray):
+    """History column that yields the GIL after every store"""
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        time.sleep(0)
+
+@pytest.fixture
+def fast_switching():
+    """Let readers hand the GIL back to the writer quickly"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+def test_concurrent_reads_are_never_torn(fast_switching):
+    history = ConsciousnessHistory(capacity=CAPACITY)
+    # Hand the GIL to the readers halfway through every push
+    history.coherence = history.coherence.view(YieldingColumn)
+    pushes = 5000
+    errors = []
+    done = threading.Event()
+
+    def push(t):
+        # Column c of push t holds t + offset[c], so every window and sample is checkable
+        history.push(float(t), t + 0.25, t + 0.5, t + 0.75)
+
+    def writer():
+        for t in range(1, pushes):
+            push(t)
+        done.set()
+
+    def reader():
+        out = np.empty(CAPACITY)
+        try:
+            while not done.is_set():
+                for column, offset in COLUMN_OFFSETS.items():
+                    window = history.read_window(column, CAPACITY, out)
+                    if len(window):
+                        expected = np.arange(len(window)) + window[0]
+                        assert np.array_equal(window, expected), f"{column} window not contiguous"
+                        assert window[0] % 1.0 == offset, f"{column} window holds another column"
+
+                latest = history.latest()
+                t = latest[0]
+                assert latest == (t, t + 0.25, t + 0.5, t + 0.75), "torn latest() sample"
+        except Exception as e:
+            errors.append(e)
+
+    push(0)
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    writer_thread.join(timeout=60)
+    for thread in readers:
+        thread.join(timeout=60)
+
+    assert not errors, errors[0]
+    assert history.count == pushes
+
+@pytest.mark.parametrize('pushes', [1, 5, 30, 99, 100, 101, 350, 1000, 1234])
+def test_rolling_statistics_match_brute_force(pushes):
+    history = ConsciousnessHistory(capacity=CAPACITY)
+    for t in range(pushes):
+        history.push(*sample(t))
+    coherence = np.array([sample(t)[1] for t in range(pushes)])
+
+    assert history.coherence_mean() == pytest.approx(coherence[-history.awareness_window:].mean())
+    assert history.coherence_variance() == pytest.approx(
+        coherence[-history.continuity_window:].var(), abs=1e-12
+    )
+    if pushes >= 2 * history.persistence_window:
+        assert history.coherence_autocorrelation() == pytest.approx(
+            brute_force_autocorrelation(history), abs=1e-9
+        )
+
+    window = history.read_window('coherence', CAPACITY)
+    assert np.array_equal(window, coherence[-CAPACITY:])
+
+def test_reader_gives_up_on_stalled_writer(monkeypatch):
+    history = ConsciousnessHistory(capacity=CAPACITY)
+    history.push(*sample(0))
+    monkeypatch.setattr(ConsciousnessHistory, 'READ_STALL_TIMEOUT_S', 0.05)
+    history._write_seq += 1  # Writer died mid-push
+
+    with pytest.raises(RuntimeError, match="stalled"):
+        history.latest()
@@ -0,0 +1,59 @@
+"""FunctionalRealAI start/stop cycles keep a single consciousness sampler"""
+
+import asyncio
+import copy
+import json
+import threading
+
+import numpy as np
+
+from functional_controller import DEFAULT_CONFIG, FunctionalRealAI
+
+def samplers():
+    return [t for t in threading.enumerate() if t.name == 'consciousness-sampler']
+
+def write_config(tmp_path, **integration):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai']['inference_backend'] = 'reference'
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False, **integration)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+def test_reinitialize_after_shutdown_keeps_one_sampler(tmp_path):
+    async def cycle():
+        real_ai = FunctionalRealAI(write_config(tmp_path))
+        for _ in range(3):
+            assert await real_ai.initialize_real_ai()
+            assert len(samplers()) == 1
+            await real_ai.make_real_ai_decision(np.zeros(16, dtype=np.float32), consciousness_requirement=0.0)
+            await real_ai.shutdown()
+            assert not samplers()
+
+    asyncio.run(cycle())
+
+def test_failed_initialization_rolls_back_sampler(tmp_path):
+    async def failing_then_retry():
+        # The external GAIA-Q-AIR package is not installed, so its phase fails
+        real_ai = FunctionalRealAI(write_config(tmp_path))
+        real_ai.config['integration']['gaia_air_enabled'] = True
+        assert not await real_ai.initialize_real_ai()
+        assert not samplers()
+
+        real_ai.config['integration']['gaia_air_enabled'] = False
+        assert await real_ai.initialize_real_ai()
+        assert len(samplers()) == 1
+        await real_ai.shutdown()
+
+    asyncio.run(failing_then_retry())
+
+def test_start_monitoring_reuses_live_sampler(tmp_path):
+    real_ai = FunctionalRealAI(write_config(tmp_path))
+    monitor = real_ai.consciousness_monitor
+    monitor.start_monitoring()
+    monitor.start_monitoring()
+    try:
+        assert len(samplers()) == 1
+    finally:
+        assert monitor.stop_monitoring()
+    assert not samplers()
@@ -0,0 +1,44 @@
+"""RealAIControllerPool workers keep separate journals and memory budgets"""
+
+import asyncio
+import copy
+import json
+
+import numpy as np
+
+from functional_controller import DEFAULT_CONFIG, DecisionJournalReader, RealAIControllerPool
+
+WORKERS = 2
+DECISIONS = 40
+
+def test_each_worker_journals_its_own_decisions(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai']['inference_backend'] = 'reference'
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    config['pool']['workers'] = WORKERS
+    config['journal'].update(enabled=True, directory=str(tmp_path / 'journal'), flush_records=8)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+
+    contexts = np.random.default_rng(3).standard_normal((DECISIONS, 512)).astype(np.float32)
+
+    async def run():
+        pool = RealAIControllerPool(str(path))
+        assert await pool.start()
+        try:
+            return await asyncio.gather(*(
+                pool.make_real_ai_decision(context, consciousness_requirement=0.0) for context in contexts
+            ))
+        finally:
+            await pool.shutdown()
+
+    decisions = asyncio.run(run())
+    assert len(decisions) == DECISIONS
+
+    journal = tmp_path / 'journal'
+    assert sorted(p.name for p in journal.iterdir()) == [f'worker-{i}' for i in range(WORKERS)]
+    counts = [len(DecisionJournalReader(str(journal / f'worker-{i}')).records()) for i in range(WORKERS)]
+    assert all(counts) and sum(counts) == DECISIONS
+
+    journaled = np.concatenate([DecisionJournalReader(str(journal / f'worker-{i}')).records() for i in range(WORKERS)])
+    assert sorted(r['context_hash'].decode('ascii') for r in journaled) == sorted(d.context_hash for d in decisions)
@@ -0,0 +1,65 @@
+"""Decision cache hits, misses and invalidation when the model adapts"""
+
+import asyncio
+import copy
+import json
+
+import numpy as np
+
+from functional_controller import DEFAULT_CONFIG, DecisionCache, FunctionalRealAI
+
+def write_config(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    # Safety auto-revert would mask the adapted model's output
+    config['real_ai'].update(inference_backend='reference', decision_cache_enabled=True, decision_cache_ttl_s=None,
+                             safety_validation=False)
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+def test_repeated_context_hits_until_adaptation(tmp_path):
+    context = np.linspace(-1.0, 1.0, 512, dtype=np.float32)
+
+    async def run():
+        real_ai = FunctionalRealAI(write_config(tmp_path))
+        assert await real_ai.initialize_real_ai()
+        try:
+            decide = lambda: real_ai.make_real_ai_decision(context, consciousness_requirement=0.0)
+            first = await decide()
+            second = await decide()
+            cache = real_ai.decision_cache
+            assert (cache.hits, cache.misses) == (1, 1)
+            assert real_ai.metrics.cache_hits == 1
+            np.testing.assert_array_equal(first.decision_vector, second.decision_vector)
+
+            generation = cache.generation
+            assert await real_ai.adapt_from_outcome(first, np.ones(16, dtype=np.float32), learning_strength=50.0)
+            assert cache.generation == generation + 1 and len(cache) == 0
+
+            adapted = await decide()
+            assert (cache.hits, cache.misses) == (1, 2)
+            assert not np.array_equal(adapted.decision_vector, first.decision_vector)
+        finally:
+            await real_ai.shutdown()
+
+    asyncio.run(run())
+
+def test_result_from_a_superseded_model_is_not_stored():
+    cache = DecisionCache(max_entries=4)
+    generation = cache.generation
+    cache.invalidate()  # Model changed while the inference was in flight
+    cache.put('k', np.ones(16, dtype=np.float32), np.ones(16, dtype=np.float32), generation)
+    assert cache.get('k') is None and len(cache) == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = DecisionCache(max_entries=2)
+    outputs = np.zeros(16, dtype=np.float32)
+    cache.put('a', outputs, outputs)
+    cache.put('b', outputs, outputs)
+    assert cache.get('a') is not None
+    cache.put('c', outputs, outputs)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.evictions == 1
@@ -0,0 +1,102 @@
+"""DecisionHistory ring order, batch appends, resize and latency percentiles"""
+
+import numpy as np
+import pytest
+
+from functional_controller import ConsciousnessState, DecisionHistory, RealAIDecision, RealAIDecisionBatch
+
+STATE = ConsciousnessState(*([0.5] * 10), sequence=3)  # Exact in float32
+
+def make_decision(i, real_time_compliant=True):
+    vector = np.full(16, i, dtype=np.float32)
+    return RealAIDecision(
+        decision_vector=vector,
+        confidence_scores=np.full(16, 0.5, dtype=np.float32),
+        reasoning_trace=[],
+        consciousness_state=STATE,
+        safety_validated=True,
+        ethics_validated=False,
+        real_time_compliant=real_time_compliant,
+        decision_latency_us=float(i),
+        context_hash=f'{i:016x}',
+        timestamp=float(i)
+    )
+
+def make_batch(values):
+    n = len(values)
+    return RealAIDecisionBatch(
+        contexts=np.zeros((n, 8), dtype=np.float32),
+        decision_vectors=np.repeat(np.asarray(values, dtype=np.float32)[:, None], 16, axis=1),
+        confidence_scores=np.full((n, 16), 0.5, dtype=np.float32),
+        consciousness_state=STATE,
+        safety_validated=np.ones(n, dtype=bool),
+        ethics_validated=np.zeros(n, dtype=bool),
+        real_time_compliant=np.ones(n, dtype=bool),
+        decision_latency_us=np.asarray(values, dtype=np.float64),
+        context_hashes=[f'{v:016x}' for v in values],
+        violations={},
+        batch_latency_us=float(sum(values)),
+        timestamp=1.0
+    )
+
+def latencies(history):
+    return list(history.column('decision_latency_us'))
+
+def test_wrap_around_keeps_newest_in_order():
+    history = DecisionHistory(capacity=4)
+    for i in range(7):
+        history.append(make_decision(i), context_features=8)
+
+    assert len(history) == 4 and history.count == 7
+    assert latencies(history) == [3, 4, 5, 6]
+    assert [d.context_hash for d in history] == [f'{i:016x}' for i in range(3, 7)]
+    assert history[-1].decision_vector[0] == 6
+    assert history[0].consciousness_state == STATE
+    with pytest.raises(IndexError):
+        history[4]
+
+    # The last three wrap past the end of the ring and come back as a copy
+    assert list(history.column('decision_latency_us', 3)) == [4, 5, 6]
+
+def test_batch_append_wraps_and_drops_rows_that_cannot_fit():
+    history = DecisionHistory(capacity=4)
+    history.append(make_decision(0), context_features=8)
+    history.append_batch(make_batch([1, 2, 3, 4, 5]))
+    assert latencies(history) == [2, 3, 4, 5]
+
+    history.append_batch(make_batch([10, 11, 12, 13, 14, 15]))
+    assert latencies(history) == [12, 13, 14, 15]
+    assert history.count == 12
+    assert history[0].decision_vector[0] == 12
+    assert history[0].context_hash == f'{12:016x}'
+
+def test_resize_keeps_newest_decisions():
+    history = DecisionHistory(capacity=4)
+    for i in range(6):
+        history.append(make_decision(i), context_features=8)
+
+    history.resize(2)
+    assert latencies(history) == [4, 5]
+
+    history.resize(5)
+    for i in range(6, 9):
+        history.append(make_decision(i), context_features=8)
+    assert latencies(history) == [4, 5, 6, 7, 8]
+    assert [int(d.decision_vector[0]) for d in history] == [4, 5, 6, 7, 8]
+
+    with pytest.raises(ValueError):
+        history.resize(0)
+
+def test_latency_percentile_and_flag_ratio_over_recent_window():
+    history = DecisionHistory(capacity=100)
+    assert history.latency_percentile(50) == 0.0
+
+    for i in range(1, 151):
+        history.append(make_decision(i, real_time_compliant=i > 140), context_features=8)
+
+    assert history.latency_percentile(0) == 51
+    assert history.latency_percentile(100) == 150
+    assert history.latency_percentile(50, last=11) == 145
+    assert history.flag_ratio(DecisionHistory.REAL_TIME_COMPLIANT, last=20) == 0.5
+    assert history.flag_ratio(DecisionHistory.SAFETY_VALIDATED) == 1.0
+    assert history.flag_ratio(DecisionHistory.ETHICS_VALIDATED) == 0.0
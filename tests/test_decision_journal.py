@@ -0,0 +1,54 @@
+"""DecisionJournal: appends stay off disk until flush(), rotation and replay"""
+
+import numpy as np
+
+from functional_controller import (
+    ConsciousnessState, DecisionJournal, DecisionJournalReader, RealAIDecision
+)
+
+STATE = ConsciousnessState(*([0.9] * 10), sequence=7)
+
+def make_decision(i):
+    return RealAIDecision(
+        decision_vector=np.full(16, i, dtype=np.float32),
+        confidence_scores=np.full(16, 0.9, dtype=np.float32),
+        reasoning_trace=[],
+        consciousness_state=STATE,
+        safety_validated=True,
+        ethics_validated=True,
+        real_time_compliant=i % 2 == 0,
+        decision_latency_us=float(i),
+        context_hash=f"{i:016x}",
+        timestamp=float(i)
+    )
+
+def test_appends_publish_only_on_flush(tmp_path, monkeypatch):
+    journal = DecisionJournal(str(tmp_path), segment_records=64, flush_records=4)
+    syncs = []
+    monkeypatch.setattr(journal._map, 'flush', lambda: syncs.append(1))
+
+    for i in range(10):
+        journal.append(make_decision(i), 16)
+
+    assert not syncs
+    assert len(DecisionJournalReader(str(tmp_path)).records()) == 0
+    assert journal.flush_due(interval_s=60.0)
+
+    journal.flush()
+    assert syncs and not journal.flush_due(interval_s=60.0)
+    assert len(DecisionJournalReader(str(tmp_path)).records()) == 10
+    journal.close()
+
+def test_rotation_and_replay(tmp_path):
+    journal = DecisionJournal(str(tmp_path), segment_records=8, flush_records=1024)
+    for i in range(20):
+        journal.append(make_decision(i), 16)
+    assert journal.flush_due(interval_s=60.0)  # Rotated segments await a sync
+    journal.close()
+
+    reader = DecisionJournalReader(str(tmp_path))
+    assert len(reader.segments()) == 3
+    replayed = list(reader.replay())
+    assert [d.decision_latency_us for d in replayed] == [float(i) for i in range(20)]
+    assert [d.real_time_compliant for d in replayed] == [i % 2 == 0 for i in range(20)]
+    np.testing.assert_array_equal(replayed[5].decision_vector, np.full(16, 5, dtype=np.float32))
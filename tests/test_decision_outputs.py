@@ -0,0 +1,95 @@
+"""Decision outputs are frozen once and shared read-only afterwards"""
+
+import asyncio
+import copy
+import json
+
+import numpy as np
+import pytest
+
+from functional_controller import (DEFAULT_CONFIG, ConsciousnessState, DecisionCache, FunctionalRealAI,
+                                   RealAIDecision, ReasoningTrace, _frozen_outputs)
+
+def write_config(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai']['inference_backend'] = 'reference'
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+def test_frozen_outputs_copies_once():
+    vector = np.arange(16, dtype=np.float32)
+    scores = np.full(16, 0.5, dtype=np.float32)
+
+    frozen_vector, frozen_scores = _frozen_outputs(vector, scores)
+    vector[:] = -1.0
+    assert frozen_vector[0] == 0.0 and frozen_scores[0] == 0.5
+    assert not frozen_vector.flags.writeable and not frozen_scores.flags.writeable
+
+    again = _frozen_outputs(frozen_vector, frozen_scores)
+    assert again[0] is frozen_vector and again[1] is frozen_scores
+
+    # Two unrelated read-only arrays are still copied into one block
+    mixed = _frozen_outputs(frozen_vector, np.array(frozen_scores))
+    assert mixed[0].base is mixed[1].base is not frozen_vector.base
+
+def test_cache_hits_return_the_stored_frozen_block():
+    cache = DecisionCache(max_entries=4)
+    vector = np.ones(16, dtype=np.float32)
+    cache.put('k', vector, vector * 0.5)
+    vector[:] = 0.0
+
+    hit_vector, hit_scores = cache.get('k')
+    assert hit_vector[0] == 1.0 and hit_scores[0] == 0.5
+    assert not hit_vector.flags.writeable
+    assert cache.get('k')[0] is hit_vector
+
+def test_decision_vectors_are_read_only(tmp_path):
+    async def decide():
+        real_ai = FunctionalRealAI(write_config(tmp_path))
+        assert await real_ai.initialize_real_ai()
+        try:
+            decision = await real_ai.make_real_ai_decision(np.ones(512, dtype=np.float32), consciousness_requirement=0.0)
+            return decision, real_ai.decision_history[-1]
+        finally:
+            await real_ai.shutdown()
+
+    decision, stored = asyncio.run(decide())
+    for record in (decision, stored):
+        assert record.decision_vector.dtype == np.float32 and record.decision_vector.shape == (16,)
+        with pytest.raises(ValueError):
+            record.decision_vector[0] = 1.0
+        with pytest.raises(ValueError):
+            record.confidence_scores[0] = 1.0
+    np.testing.assert_array_equal(stored.decision_vector, decision.decision_vector)
+
+def test_to_dict_round_trips_through_json():
+    state = ConsciousnessState(*([0.5] * 10), sequence=7)
+    vector, scores = _frozen_outputs(np.linspace(-1, 1, 16, dtype=np.float32), np.full(16, 0.9, dtype=np.float32))
+    decision = RealAIDecision(
+        decision_vector=vector,
+        confidence_scores=scores,
+        reasoning_trace=ReasoningTrace(512, vector, state),
+        consciousness_state=state,
+        safety_validated=True,
+        ethics_validated=True,
+        real_time_compliant=False,
+        decision_latency_us=12.5,
+        context_hash='0123456789abcdef',
+        timestamp=1.5
+    )
+
+    data = json.loads(json.dumps(decision.to_dict()))
+    assert data['decision_vector'] == vector.tolist()
+    assert isinstance(data['reasoning_trace'], list) and len(data['reasoning_trace']) == ReasoningTrace.LINE_COUNT
+
+    restored = RealAIDecision(
+        decision_vector=np.asarray(data['decision_vector'], dtype=np.float32),
+        confidence_scores=np.asarray(data['confidence_scores'], dtype=np.float32),
+        reasoning_trace=data['reasoning_trace'],
+        consciousness_state=ConsciousnessState(**data['consciousness_state']),
+        **{k: data[k] for k in ('safety_validated', 'ethics_validated', 'real_time_compliant',
+                                'decision_latency_us', 'context_hash', 'timestamp')}
+    )
+    assert restored.to_dict() == decision.to_dict()
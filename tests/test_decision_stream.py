@@ -0,0 +1,93 @@
+"""decision_stream(): per-stream drop counts, skipped consciousness failures and early exit"""
+
+import asyncio
+import copy
+import json
+
+import numpy as np
+import pytest
+
+from functional_controller import DEFAULT_CONFIG, FunctionalRealAI, InsufficientConsciousnessError
+
+@pytest.fixture
+def config_path(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai'].update(inference_backend='reference', safety_validation=False)
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+CONTEXTS = np.random.default_rng(0).random((50, 32), dtype=np.float32)
+
+async def burst():
+    for context in CONTEXTS:
+        yield context
+
+def run(config_path, consume, patch=None):
+    async def main():
+        real_ai = FunctionalRealAI(config_path)
+        assert await real_ai.initialize_real_ai()
+        if patch:
+            patch(real_ai)
+        try:
+            return await consume(real_ai)
+        finally:
+            await real_ai.shutdown()
+    return asyncio.run(main())
+
+def test_latest_policy_drops_are_counted_on_the_stream(config_path):
+    async def consume(real_ai):
+        stream = real_ai.decision_stream(burst(), consciousness_requirement=0.0, policy='latest')
+        decisions = [decision async for decision in stream]
+        return decisions, stream, real_ai.metrics.stream_coalesced
+
+    decisions, stream, total_coalesced = run(config_path, consume)
+    assert stream.coalesced > 0
+    assert stream.coalesced == total_coalesced
+    assert len(decisions) + stream.dropped == len(CONTEXTS)
+
+def test_failed_consciousness_check_skips_the_item(config_path):
+    def flaky_consciousness(real_ai):
+        inference = real_ai._decision_inference
+        calls = []
+
+        async def decision_inference(context, consciousness_requirement, traced):
+            calls.append(context)
+            if len(calls) == 3:
+                raise InsufficientConsciousnessError("Insufficient consciousness: 0.100 < 0.0")
+            return await inference(context, consciousness_requirement, traced)
+        real_ai._decision_inference = decision_inference
+
+    async def consume(real_ai):
+        stream = real_ai.decision_stream(burst(), consciousness_requirement=0.0, policy='skip')
+        decisions = [decision async for decision in stream]
+        return decisions, stream
+
+    decisions, stream = run(config_path, consume, flaky_consciousness)
+    assert stream.rejected == 1
+    assert len(decisions) + stream.expired == len(CONTEXTS) - 1
+
+def test_breaking_out_of_the_stream_stops_its_stages(config_path):
+    source_closed = asyncio.Event()
+
+    async def endless():
+        try:
+            while True:
+                yield CONTEXTS[0]
+                await asyncio.sleep(0)
+        finally:
+            source_closed.set()
+
+    async def consume(real_ai):
+        running = asyncio.all_tasks()
+        async with real_ai.decision_stream(endless(), consciousness_requirement=0.0, policy='skip') as stream:
+            async for decision in stream:
+                break
+        # Intake and inference were cancelled on exit, not left to the collector
+        return decision, asyncio.all_tasks() - running, source_closed.is_set()
+
+    decision, leftover_tasks, closed = run(config_path, consume)
+    assert decision.context_hash
+    assert not leftover_tasks
+    assert closed
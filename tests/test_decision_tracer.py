@@ -0,0 +1,77 @@
+"""DecisionTracer sampling and Chrome trace export schema"""
+
+import asyncio
+import copy
+import json
+import os
+import threading
+
+import numpy as np
+
+from functional_controller import DEFAULT_CONFIG, DecisionTracer, FunctionalRealAI
+
+def write_config(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai']['inference_backend'] = 'reference'
+    config['performance']['tracing_mode'] = 'always'
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+def load_events(path):
+    with open(path) as f:
+        trace = json.load(f)
+    assert set(trace) == {'traceEvents', 'displayTimeUnit'}
+    return trace['traceEvents']
+
+def test_sampled_mode_traces_every_nth_root():
+    tracer = DecisionTracer(mode='sampled', sample_rate=0.25)
+    assert [tracer.sample() for _ in range(8)] == [False, False, False, True] * 2
+    assert not DecisionTracer().sample()
+
+def test_ring_keeps_newest_spans():
+    tracer = DecisionTracer(mode='always', max_events=3)
+    for i in range(5):
+        tracer.record(f'span{i}', 0)
+    assert [event[0] for event in tracer.events] == ['span2', 'span3', 'span4']
+
+def test_export_schema(tmp_path):
+    tracer = DecisionTracer(mode='always')
+    start_ns = tracer.record('first', 0)
+    tracer.record('second', start_ns, category='adaptation', args={'hit': True})
+
+    path = tmp_path / 'trace.json'
+    assert tracer.export_chrome_trace(str(path)) == 2
+    events = load_events(path)
+
+    metadata = [e for e in events if e['ph'] == 'M']
+    assert metadata == [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(),
+                         'tid': threading.get_ident(), 'args': {'name': threading.current_thread().name}}]
+
+    spans = [e for e in events if e['ph'] == 'X']
+    assert [(e['name'], e['cat']) for e in spans] == [('first', 'decision'), ('second', 'adaptation')]
+    for span in spans:
+        assert set(span) >= {'name', 'cat', 'ph', 'pid', 'tid', 'ts', 'dur'}
+        assert isinstance(span['ts'], float) and span['dur'] >= 0
+    assert 'args' not in spans[0] and spans[1]['args'] == {'hit': True}
+    # Chained stages abut: the second starts where the first ended (in μs)
+    assert spans[1]['ts'] == spans[0]['ts'] + spans[0]['dur']
+
+def test_decision_root_span_encloses_its_stages(tmp_path):
+    async def decide():
+        real_ai = FunctionalRealAI(write_config(tmp_path))
+        assert await real_ai.initialize_real_ai()
+        try:
+            await real_ai.make_real_ai_decision(np.zeros(512, dtype=np.float32), consciousness_requirement=0.0)
+            return real_ai.export_trace(str(tmp_path / 'trace.json'))
+        finally:
+            await real_ai.shutdown()
+
+    assert asyncio.run(decide()) > 0
+    spans = {e['name']: e for e in load_events(tmp_path / 'trace.json') if e['ph'] == 'X'}
+
+    root = spans.pop('make_real_ai_decision')
+    assert {'get_consciousness_state', 'inference', 'validate_decision', 'update_metrics'} <= set(spans)
+    for span in spans.values():
+        assert root['ts'] <= span['ts'] and span['ts'] + span['dur'] <= root['ts'] + root['dur'] + 1e-3
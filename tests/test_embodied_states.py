@@ -0,0 +1,55 @@
+"""poll_embodied_states() reference fill from consciousness monitor samples"""
+
+import copy
+import json
+
+import numpy as np
+import pytest
+
+from functional_controller import DEFAULT_CONFIG, EMBODIED_STATE_DTYPE, FunctionalRealAI
+
+SAMPLES = [(10.0 + i, 0.5, 0.5 + i / 16, 0.75) for i in range(5)]  # (timestamp, coherence, awareness, continuity)
+
+@pytest.fixture
+def real_ai(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai']['inference_backend'] = 'reference'
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    real_ai = FunctionalRealAI(str(path))
+    for sample in SAMPLES:
+        real_ai.consciousness_monitor.consciousness_history.push(*sample)
+    return real_ai
+
+def test_reference_fill_writes_derivable_fields_oldest_first(real_ai):
+    out = FunctionalRealAI.embodied_state_buffer(8)
+    states = real_ai.poll_embodied_states(out)
+    assert len(states) == len(SAMPLES)
+    assert np.shares_memory(states, out)
+
+    awareness = np.array([s[2] for s in SAMPLES], dtype=np.float32)
+    np.testing.assert_array_equal(states['consciousness_level'], awareness)
+    np.testing.assert_array_equal(states['consciousness_continuity'], np.float32(0.75))
+    np.testing.assert_allclose(states['self_awareness'], awareness * 0.9, rtol=1e-6)
+    np.testing.assert_allclose(states['prediction_confidence'], awareness * 0.95, rtol=1e-6)
+    np.testing.assert_array_equal(states['timestamp_ns'], [int(s[0] * 1e9) for s in SAMPLES])
+
+    state = real_ai.get_consciousness_state()
+    np.testing.assert_allclose(states['intentionality'], state.intentionality, rtol=1e-6)
+    np.testing.assert_allclose(states['memory_persistence'], state.memory_persistence, rtol=1e-6)
+
+def test_fields_the_monitor_cannot_derive_are_nan(real_ai):
+    states = real_ai.poll_embodied_states(FunctionalRealAI.embodied_state_buffer(3))
+    assert len(states) == 3
+    for name in ('intention_stability', 'self_model_accuracy', 'world_model_fidelity'):
+        assert np.isnan(states[name]).all()
+    # The newest three samples
+    np.testing.assert_array_equal(states['timestamp_ns'], [int(s[0] * 1e9) for s in SAMPLES[-3:]])
+
+def test_buffer_layout_is_checked(real_ai):
+    with pytest.raises(ValueError):
+        real_ai.poll_embodied_states(np.zeros(4, dtype=np.float32))
+    with pytest.raises(ValueError):
+        real_ai.poll_embodied_states(FunctionalRealAI.embodied_state_buffer(8)[::2])
+    assert FunctionalRealAI.embodied_state_buffer(2).dtype == EMBODIED_STATE_DTYPE
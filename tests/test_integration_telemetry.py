@@ -0,0 +1,66 @@
+"""IntegrationTelemetry staleness bounds"""
+
+import copy
+import json
+import math
+import time
+
+import pytest
+
+from functional_controller import DEFAULT_CONFIG, FunctionalRealAI, IntegrationTelemetry
+
+def test_reads_past_the_bound_return_the_default_and_count_as_stale():
+    telemetry = IntegrationTelemetry({'gaia_air.coupling_strength': 0.5}, default_max_staleness_s=2.0)
+    now = time.monotonic()
+    telemetry.publish('gaia_air.coupling_strength', 0.7, timestamp=now - 0.25)
+    telemetry.publish('ampel360.coupling_strength', 0.9, timestamp=now - 1.0)
+
+    assert telemetry.get('gaia_air.coupling_strength', 0.0) == 0.7
+    assert telemetry.get('ampel360.coupling_strength', 0.0) == 0.9  # Within the default bound
+    assert telemetry.stale_reads == 0
+
+    telemetry.publish('gaia_air.coupling_strength', 0.8, timestamp=now - 0.75)
+    assert telemetry.get('gaia_air.coupling_strength', 0.0) == 0.0
+    assert telemetry.get('never.published') is None
+    assert telemetry.stale_reads == 2
+    assert telemetry.age('never.published') == math.inf
+    assert telemetry.age('gaia_air.coupling_strength') >= 0.75
+
+def test_snapshot_and_publisher():
+    telemetry = IntegrationTelemetry(default_max_staleness_s=1.0)
+    publish = telemetry.publisher('ampel360')
+    publish('coupling_strength', 0.6)
+    publish('mode', 'cruise', time.monotonic() - 5.0)
+
+    snapshot = telemetry.snapshot()
+    assert set(snapshot) == {'ampel360.coupling_strength', 'ampel360.mode'}
+    assert snapshot['ampel360.coupling_strength']['fresh']
+    assert not snapshot['ampel360.mode']['fresh'] and snapshot['ampel360.mode']['age_s'] >= 5.0
+    assert telemetry.updates == 2
+
+@pytest.mark.parametrize('integration', [
+    {'default_max_staleness_s': 0},
+    {'max_staleness_s': {'gaia_air.coupling_strength': -1.0}},
+    {'max_staleness_s': {'gaia_air.coupling_strength': 'soon'}},
+])
+def test_invalid_bounds_are_rejected(integration):
+    with pytest.raises(ValueError):
+        IntegrationTelemetry.compile_bounds(integration)
+
+def test_bounds_are_hot_reloaded(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    real_ai = FunctionalRealAI(str(path))
+
+    config['integration']['max_staleness_s'] = {'gaia_air.coupling_strength': 3.0}
+    config['integration']['default_max_staleness_s'] = 0.25
+    path.write_text(json.dumps(config))
+    assert real_ai.reload_config()
+    assert real_ai.telemetry.bound('gaia_air.coupling_strength') == 3.0
+    assert real_ai.telemetry.bound('ampel360.coupling_strength') == 0.25
+
+    config['integration']['default_max_staleness_s'] = -1.0
+    path.write_text(json.dumps(config))
+    assert not real_ai.reload_config()
+    assert real_ai.telemetry.bound('ampel360.coupling_strength') == 0.25
@@ -0,0 +1,101 @@
+"""PerformanceTuner role placement and priority"""
+
+import asyncio
+import copy
+import json
+import os
+import threading
+
+import pytest
+
+from functional_controller import DEFAULT_CONFIG, FunctionalRealAI, PerformanceTuner
+
+def tuner(allowed=(0, 1, 2, 3), **performance):
+    tuner = PerformanceTuner({**DEFAULT_CONFIG['performance'], **performance})
+    tuner._allowed_cores = set(allowed)
+    return tuner
+
+def prioritized_roles(tuner, monkeypatch):
+    monkeypatch.setattr(tuner, '_pin_current_thread', lambda role: tuner.role_cores(role))
+    monkeypatch.setattr(tuner, '_raise_priority', lambda: 'SCHED_FIFO:10')
+    for role in PerformanceTuner.ROLES:
+        tuner.configure_thread(role)
+    return {role for role, applied in tuner.report['threads'].items() if 'priority' in applied}
+
+def test_real_time_priority_is_opt_in(monkeypatch):
+    assert not DEFAULT_CONFIG['performance']['real_time_priority']
+    assert prioritized_roles(tuner(), monkeypatch) == set()
+
+def test_monitor_gets_its_own_core():
+    placement = tuner(cpu_affinity=[0, 1, 2, 3])
+    assert placement.role_cores('monitor') == [3]
+    assert placement.role_cores('decision') == [0, 1, 2]
+    assert placement.role_cores('executor') == [0, 1, 2]
+
+def test_unavailable_cores_are_left_out_of_the_partition():
+    placement = tuner(allowed=(0, 1), cpu_affinity=[0, 1, 2, 3])
+    assert placement.role_cores('monitor') == [1]
+    assert placement.role_cores('decision') == [0]
+
+@pytest.mark.parametrize('performance, expected', [
+    ({'cpu_affinity': [0, 1, 2, 3]}, {'decision', 'executor'}),
+    ({'cpu_affinity': [0]}, {'decision', 'executor', 'monitor'}),
+    ({'cpu_affinity': []}, {'decision', 'executor', 'monitor'}),
+    ({'cpu_affinity': [0, 1], 'thread_affinity': {'monitor': [0]}}, {'decision', 'executor', 'monitor'}),
+])
+def test_monitor_sharing_a_real_time_core_gets_the_same_class(monkeypatch, performance, expected):
+    placement = tuner(real_time_priority=True, **performance)
+    assert prioritized_roles(placement, monkeypatch) == expected
+
+def test_pool_workers_get_disjoint_slices():
+    slices = []
+    for worker_id in range(2):
+        placement = tuner(real_time_priority=True, cpu_affinity=[0, 1, 2, 3], thread_affinity={'monitor': [0]})
+        placement.confine_to_worker(worker_id, 2)
+        slices.append({role: placement.role_cores(role) for role in PerformanceTuner.ROLES})
+        assert placement.real_time_priority
+
+    assert slices == [
+        {'decision': [0], 'executor': [0], 'monitor': [1]},
+        {'decision': [2], 'executor': [2], 'monitor': [3]},
+    ]
+
+def test_pool_workers_without_enough_cores_do_not_pin_or_prioritize():
+    placement = tuner(real_time_priority=True, cpu_affinity=[0, 1, 2, 3])
+    placement.confine_to_worker(3, 8)
+    assert placement.role_cores('decision') == []
+    assert not placement.real_time_priority
+
+@pytest.mark.skipif(not hasattr(os, 'sched_getaffinity'), reason='per-thread affinity is Linux-only')
+def test_shutdown_restores_event_loop_thread_affinity(tmp_path):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['real_ai']['inference_backend'] = 'reference'
+    config['integration'].update(gaia_air_enabled=False, ampel360_enabled=False)
+    config['performance']['thread_affinity'] = {'decision': [min(os.sched_getaffinity(0))]}
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+
+    async def cycle():
+        real_ai = FunctionalRealAI(str(path))
+        assert await real_ai.initialize_real_ai()
+        pinned = os.sched_getaffinity(0)
+        await real_ai.shutdown()
+        return pinned, os.sched_getaffinity(0)
+
+    # Run on a throwaway thread so a failure cannot leave the test runner pinned
+    original = {}
+    def loop_thread():
+        original['cores'] = os.sched_getaffinity(0)
+        original['pinned'], original['restored'] = asyncio.run(cycle())
+    thread = threading.Thread(target=loop_thread)
+    thread.start()
+    thread.join()
+
+    assert original['pinned'] == set(config['performance']['thread_affinity']['decision'])
+    assert original['restored'] == original['cores']
+
+def test_pool_workers_split_the_memory_limit():
+    placement = tuner(memory_limit_mb=512, cpu_affinity=[0, 1, 2, 3])
+    placement.confine_to_worker(1, 4)
+    assert placement.memory_limit_bytes == 128 * 1024 * 1024
+    assert placement.cpu_affinity == [1]
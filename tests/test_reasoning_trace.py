@@ -0,0 +1,36 @@
+"""ReasoningTrace captures numbers and renders lines only when read"""
+
+import numpy as np
+
+from functional_controller import ConsciousnessState, ReasoningTrace
+
+STATE = ConsciousnessState(0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.95)
+
+def make_trace():
+    decision = np.zeros(16, dtype=np.float32)
+    decision[5] = -0.75
+    return ReasoningTrace(512, decision, STATE)
+
+def test_len_and_truthiness_do_not_render():
+    trace = make_trace()
+    assert len(trace) == ReasoningTrace.LINE_COUNT
+    assert trace
+    assert trace._lines is None
+
+def test_render_once_on_first_read():
+    trace = make_trace()
+    assert trace[0] == "Context analysis: 512 input features processed"
+    lines = trace._lines
+    assert lines is not None and len(lines) == len(trace)
+
+    assert trace[-1] == "Primary decision factor: dimension 5 (strength: -0.750)"
+    assert list(trace) == lines and trace.render() is lines
+    assert "Agency: 0.600" in trace
+
+def test_equality_with_rendered_lines():
+    trace = make_trace()
+    lines = list(make_trace())
+    assert trace == lines
+    assert trace == tuple(lines)
+    assert trace == make_trace()
+    assert trace != lines[:-1]
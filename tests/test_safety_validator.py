@@ -0,0 +1,66 @@
+"""RealAISafetyValidator stateful rules"""
+
+import numpy as np
+
+from functional_controller import ConsciousnessState, RealAIDecision, RealAISafetyValidator, ReasoningTrace
+
+STATE = ConsciousnessState(*([0.95] * 10))
+
+def make_decision(value, confidence=0.9, real_time_compliant=True):
+    vector = np.full(16, value, dtype=np.float32)
+    scores = np.full(16, confidence, dtype=np.float32)
+    return RealAIDecision(
+        decision_vector=vector,
+        confidence_scores=scores,
+        reasoning_trace=ReasoningTrace(16, vector, STATE),
+        consciousness_state=STATE,
+        safety_validated=False,
+        ethics_validated=False,
+        real_time_compliant=real_time_compliant,
+        decision_latency_us=1.0,
+        context_hash='0' * 16,
+        timestamp=0.0
+    )
+
+def test_held_step_is_accepted_as_new_setpoint():
+    validator = RealAISafetyValidator()
+    assert validator.validate_decision(make_decision(0.0))[0]
+
+    results = [validator.validate_decision(make_decision(0.5))[0] for _ in range(50)]
+
+    rearm = validator.rate_rearm_decisions
+    assert not any(results[:rearm - 1])
+    assert all(results[rearm - 1:])
+    assert not validator.escalated
+
+def test_transient_spike_is_still_rejected():
+    validator = RealAISafetyValidator()
+    validator.validate_decision(make_decision(0.0))
+
+    spike = make_decision(0.5)
+    valid, violations = validator.validate_decision(spike)
+
+    assert not valid
+    assert any('Rate of change' in v for v in violations)
+    assert validator.validate_decision(make_decision(0.05))[0]
+
+def test_auto_revert_replaces_scores_and_trace():
+    validator = RealAISafetyValidator()
+    safe = make_decision(0.0, confidence=0.95)
+    validator.validate_decision(safe)
+
+    rejected = make_decision(0.9, confidence=0.99)
+    valid, violations = validator.validate_decision(rejected)
+
+    assert not valid and "Auto-reverted to last safe decision" in violations
+    np.testing.assert_array_equal(rejected.decision_vector, safe.decision_vector)
+    np.testing.assert_array_equal(rejected.confidence_scores, safe.confidence_scores)
+    assert rejected.reasoning_trace.decision is safe.decision_vector
+
+def test_real_time_misses_do_not_escalate():
+    validator = RealAISafetyValidator()
+    for _ in range(100):
+        valid, violations = validator.validate_decision(make_decision(0.0, real_time_compliant=False))
+        assert not valid and violations == ["Real-time constraint violation"]
+
+    assert not validator.escalated
@@ -0,0 +1,20 @@
+"""WindowedDecisionStats window rates"""
+
+import pytest
+
+from functional_controller import WindowedDecisionStats
+
+def test_rate_uses_uptime_when_shorter_than_window():
+    stats = WindowedDecisionStats(start=100.0)
+    for i in range(50):
+        stats.record(10.0, True, True, now=100.0 + i * 0.1)
+
+    assert stats.window(60.0, now=105.0)['decisions_per_s'] == pytest.approx(10.0)
+
+def test_rate_uses_window_once_uptime_exceeds_it():
+    stats = WindowedDecisionStats(start=0.0)
+    for i in range(1000):
+        stats.record(10.0, True, True, now=i * 0.1)
+
+    window = stats.window(10.0, now=100.0)
+    assert window['decisions_per_s'] == pytest.approx(10.0, rel=0.1)